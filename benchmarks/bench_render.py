@@ -0,0 +1,84 @@
+# benchmarks/bench_render.py
+"""
+Temps de dessin des entités en fonction de leur nombre : un blit (et deux
+draw.rect de barre de PV) par entité, comme avant, contre la file de rendu
+(seaux par couche vidés en un blits chacun, barres tirées d'une bande
+pré-rendue).
+
+    python -m benchmarks.bench_render
+"""
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from game.settings import WIDTH, HEIGHT
+from game.enemy import Enemy
+from game.xp_orb import XPOrb
+from game.render_queue import RenderQueue, GROUND, BODIES, BARS
+from game.hp_bars import bar_sprite
+
+COUNTS  = (50, 100, 250, 500, 1000, 2000)
+REPEATS = 30
+
+
+def make_scene(n, seed):
+    """n gobelins blessés et n orbes, tous à l'écran."""
+    rng = random.Random(seed)
+    enemies = []
+    for _ in range(n):
+        e = Enemy(rng.randint(0, WIDTH), rng.randint(0, HEIGHT), speed=0)
+        e.hp = e.max_hp * rng.random()
+        enemies.append(e)
+    orbs = [XPOrb(rng.randint(0, WIDTH), rng.randint(0, HEIGHT), 1) for _ in range(n)]
+    return enemies, orbs
+
+
+def immediate(screen, enemies, orbs):
+    """Copie de l'ancien draw_world : un appel par sprite et par rectangle."""
+    for orb in orbs:
+        orb.draw(screen, 0, 0)
+    for e in enemies:
+        e.draw(screen, 0, 0)
+        ex, ey = e.rect.x, e.rect.y
+        bw, bh = e.rect.width, 5
+        pygame.draw.rect(screen, (100,0,0), (ex, ey-bh-2, bw, bh))
+        pygame.draw.rect(screen, (0,200,0), (ex, ey-bh-2, int(bw*(e.hp/e.max_hp)), bh))
+
+
+def queued(screen, enemies, orbs, rq=RenderQueue()):
+    rq.extend(GROUND, [orb.sprite(0, 0) for orb in orbs])
+    rq.extend(BODIES, [e.sprite(0, 0) for e in enemies])
+    rq.extend(BARS, [bar_sprite(e, 0, 0) for e in enemies if e.hp < e.max_hp])
+    rq.flush(screen)
+
+
+def time_draw(fn, screen, scene):
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        fn(screen, *scene)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((WIDTH, HEIGHT))
+    print(f"{'entities':>8} | {'direct ms':>9} | {'queue ms':>8} | speedup")
+    print("-" * 42)
+    for n in COUNTS:
+        scene = make_scene(n, seed=n)
+        t_direct = time_draw(immediate, screen, scene)
+        t_queue  = time_draw(queued, screen, scene)
+        print(f"{n:>8} | {t_direct:>9.3f} | {t_queue:>8.3f} | {t_direct / t_queue:>6.2f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
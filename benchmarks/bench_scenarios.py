@@ -0,0 +1,241 @@
+# benchmarks/bench_scenarios.py
+"""
+Scénarios scriptés de la boucle de jeu : mise à jour (Simulation) et dessin
+(draw_world) d'une frame, sous les drivers SDL « dummy » des tests, avec des
+graines fixes. Pour chaque scénario : frames/s, temps de frame p50/p99 et
+mémoire allouée (tracemalloc, mesurée sur un passage séparé pour ne pas
+fausser les temps). Les résultats sont écrits en JSON pour comparer les
+commits entre eux.
+
+    python -m benchmarks.bench_scenarios
+    python -m benchmarks.bench_scenarios --frames 600 --out bench.json
+    python -m benchmarks.bench_scenarios --only goblins scream
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from game.settings import WIDTH, HEIGHT
+from game.simulation import Simulation, FrameInput
+from game.enemy import Enemy
+from game.goblin_mage import GoblinMage
+from game.boss import Boss
+
+FRAMES = 300
+WARMUP = 30
+STEPS_PER_FRAME = 2      # 120 Hz de simulation pour 60 images/s
+SIM_DT = 1 / 120
+INVULNERABLE = 1e9
+
+
+def _arena(seed, stress=False):
+    """Simulation sans spawns aléatoires, joueur invulnérable."""
+    sim = Simulation(seed=seed, stress=stress)
+    sim.base_spawn_interval = math.inf
+    sim.current_bonus = ("magnet", pygame.Rect(0, 0, 1, 1))   # pas de bonus ramassé
+    p = sim.player
+    p.max_hp = p.hp = INVULNERABLE
+    return sim
+
+
+def _ring(sim, n, radius, spread):
+    """Positions de n points autour du joueur (anneau bruité, graine de la sim)."""
+    cx, cy = sim.player.rect.center
+    for i in range(n):
+        a = 2 * math.pi * i / n
+        r = radius + sim.rng.uniform(-spread, spread)
+        yield cx + math.cos(a) * r, cy + math.sin(a) * r
+
+
+def goblins(n=1000):
+    """N gobelins qui convergent sur le joueur (store vectorisé)."""
+    def setup(sim):
+        for x, y in _ring(sim, n, 700, 300):
+            e = Enemy(x, y, speed=60, player_level=5)
+            e.hp = INVULNERABLE
+            sim.add_enemy(e)
+    return setup, True, None
+
+
+def mages(m=60):
+    """M mages qui gardent leur distance et tirent en continu."""
+    def setup(sim):
+        for k, (x, y) in enumerate(_ring(sim, m, 450, 50)):
+            mage = GoblinMage(x, y)
+            mage.hp = INVULNERABLE
+            mage.fire_timer = (k % 10) * 0.5   # tirs étalés
+            sim.add_mage(mage)
+    return setup, False, None
+
+
+def boss50():
+    """Un boss de niveau 50 au contact, escorté de gobelins."""
+    def setup(sim):
+        p = sim.player
+        p.level = 50
+        b = Boss(p.rect.centerx + 300, p.rect.centery, 50)
+        b.hp = b.max_hp = INVULNERABLE
+        sim.boss_list.append(b)
+        for x, y in _ring(sim, 100, 500, 100):
+            e = Enemy(x, y, speed=60, tier='elite', player_level=50)
+            e.hp = INVULNERABLE
+            sim.add_enemy(e)
+    return setup, False, None
+
+
+def orb_storm(n=2000):
+    """N orbes dispersées, aimant actif : toutes convergent sur le joueur."""
+    def setup(sim):
+        p = sim.player
+        p.next_level_xp = INVULNERABLE   # pas de menu de level up
+        for x, y in _ring(sim, n, 900, 800):
+            sim.drop_orb(x, y, 1)
+        p.magnet_active = True
+        p.magnet_timer  = p.magnet_duration = 3600.0
+    return setup, False, None
+
+
+def scream(n=400):
+    """Cri lancé à chaque frame dans un cône bondé de gobelins."""
+    def setup(sim):
+        cx, cy = sim.player.rect.center
+        for i in range(n):
+            e = Enemy(cx + 80 + (i % 20) * 12, cy - 120 + (i // 20) * 12,
+                      speed=60, player_level=5)
+            e.hp = INVULNERABLE
+            sim.add_enemy(e)
+
+    def each_frame(sim):
+        p = sim.player
+        p.scream_timer = 0.0
+        sim.scream((p.rect.centerx + 300, p.rect.centery))
+    return setup, True, each_frame
+
+
+SCENARIOS = {
+    "goblins":   goblins,
+    "mages":     mages,
+    "boss50":    boss50,
+    "orb_storm": orb_storm,
+    "scream":    scream,
+}
+
+
+def _frames(sim, screen, art, each_frame, count):
+    """Génère les temps (s) de `count` frames update + draw."""
+    from game.main import draw_world
+    idle = FrameInput()
+    for _ in range(count):
+        t0 = time.perf_counter()
+        if each_frame:
+            each_frame(sim)
+        for _ in range(STEPS_PER_FRAME):
+            sim.step(SIM_DT, idle)
+        draw_world(screen, sim, art)
+        yield time.perf_counter() - t0
+
+
+def _percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def run_scenario(name, frames=FRAMES, warmup=WARMUP, seed=1234, art=None):
+    """Exécute un scénario et renvoie ses mesures (dict sérialisable)."""
+    from game.main import GameArt, get_cri_icons
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+    if not pygame.font.get_init():
+        pygame.font.init()
+    pygame.freetype.init()
+    get_cri_icons()
+    art = art or GameArt()
+    screen = pygame.Surface((WIDTH, HEIGHT))
+
+    def build():
+        setup, stress, each_frame = SCENARIOS[name]()
+        sim = _arena(seed, stress)
+        setup(sim)
+        return sim, each_frame
+
+    # 1) temps
+    sim, each_frame = build()
+    for _ in _frames(sim, screen, art, each_frame, warmup):
+        pass
+    times = sorted(_frames(sim, screen, art, each_frame, frames))
+
+    # 2) allocations (passage séparé : tracemalloc ralentit tout)
+    sim, each_frame = build()
+    for _ in _frames(sim, screen, art, each_frame, warmup):
+        pass
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in _frames(sim, screen, art, each_frame, frames):
+        pass
+    end, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(times)
+    return {
+        "frames":   frames,
+        "entities": sim.enemy_count() + len(sim.xp_orbs),
+        "fps":      round(frames / total, 1),
+        "mean_ms":  round(total / frames * 1000, 3),
+        "p50_ms":   round(_percentile(times, 0.50) * 1000, 3),
+        "p99_ms":   round(_percentile(times, 0.99) * 1000, 3),
+        "max_ms":   round(times[-1] * 1000, 3),
+        "alloc_peak_kb": round((peak - start) / 1024, 1),
+        "alloc_net_kb":  round((end - start) / 1024, 1),
+    }
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--warmup", type=int, default=WARMUP)
+    parser.add_argument("--seed",   type=int, default=1234)
+    parser.add_argument("--only",   nargs="+", choices=sorted(SCENARIOS))
+    parser.add_argument("--out",    default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    results = {
+        "commit":  _commit(),
+        "python":  platform.python_version(),
+        "pygame":  pygame.version.ver,
+        "seed":    args.seed,
+        "scenarios": {},
+    }
+    print(f"{'scenario':<10} | {'fps':>7} | {'p50 ms':>7} | {'p99 ms':>7} | {'peak KB':>8}")
+    print("-" * 52)
+    for name in args.only or SCENARIOS:
+        r = run_scenario(name, args.frames, args.warmup, args.seed)
+        results["scenarios"][name] = r
+        print(f"{name:<10} | {r['fps']:>7.1f} | {r['p50_ms']:>7.2f} | {r['p99_ms']:>7.2f} | "
+              f"{r['alloc_peak_kb']:>8.1f}")
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n→ {args.out}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/bench_separation.py
+"""
+Temps de frame de la passe de séparation + contacts joueur en fonction du
+nombre d'entités : ancienne double boucle O(n²) contre la grille spatiale.
+
+    python -m benchmarks.bench_separation
+"""
+import math
+import random
+import time
+
+import pygame
+
+from game.spatial import SpatialHash, separate
+from game.settings import MAP_WIDTH, MAP_HEIGHT
+
+COUNTS  = (25, 65, 130, 250, 500, 1000, 2000)
+REPEATS = 20
+
+
+class Body:
+    def __init__(self, x, y, size):
+        self.rect = pygame.Rect(0, 0, size, size)
+        self.rect.center = (x, y)
+
+
+def naive_separation(entities):
+    """Copie de l'ancienne passe de main() (comparaison de toutes les paires)."""
+    for i in range(len(entities)):
+        e1 = entities[i]
+        for e2 in entities[i+1:]:
+            dx=e1.rect.centerx-e2.rect.centerx; dy=e1.rect.centery-e2.rect.centery
+            dist=math.hypot(dx,dy); md=(e1.rect.width+e2.rect.width)/2
+            if 0<dist<md:
+                nx,ny=dx/dist,dy/dist; overlap=md-dist
+                e1.rect.x+=nx*overlap*0.5; e1.rect.y+=ny*overlap*0.5
+                e2.rect.x-=nx*overlap*0.5; e2.rect.y-=ny*overlap*0.5
+
+
+def make_bodies(n, seed):
+    rng = random.Random(seed)
+    # une horde resserrée autour du joueur, comme en fin de partie
+    cx, cy, spread = MAP_WIDTH // 2, MAP_HEIGHT // 2, 300 + 3 * n
+    return [Body(rng.randint(cx - spread, cx + spread),
+                 rng.randint(cy - spread, cy + spread),
+                 rng.choice((80, 104, 90))) for _ in range(n)]
+
+
+def time_pass(fn, n):
+    best = float("inf")
+    for k in range(REPEATS):
+        bodies = make_bodies(n, seed=k)
+        t0 = time.perf_counter()
+        fn(bodies)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    grid = SpatialHash()
+    player_hb = pygame.Rect(MAP_WIDTH // 2 - 30, MAP_HEIGHT // 2 - 30, 60, 60)
+
+    def hashed(bodies):
+        separate(bodies, grid)
+        grid.query_rect(player_hb)
+
+    def naive(bodies):
+        naive_separation(bodies)
+        [b for b in bodies if b.rect.colliderect(player_hb)]
+
+    print(f"{'entities':>8} | {'naive ms':>9} | {'grid ms':>8} | speedup")
+    print("-" * 42)
+    for n in COUNTS:
+        t_naive = time_pass(naive, n) if n <= 1000 else float("nan")
+        t_grid  = time_pass(hashed, n)
+        print(f"{n:>8} | {t_naive:>9.3f} | {t_grid:>8.3f} | {t_naive / t_grid:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# background.py
+"""
+Fond de carte pré-rendu.
+
+La tuile est répétée une seule fois sur une couche de la taille de l'écran
+plus une tuile dans chaque direction. Chaque frame ne coûte alors qu'un
+blit de la zone décalée de (cam % tuile) : autant qu'une copie d'écran,
+quelle que soit la taille de la tuile.
+"""
+import pygame
+from .settings import WIDTH, HEIGHT
+
+
+class TiledBackground:
+    def __init__(self, tile, view_w=WIDTH, view_h=HEIGHT, step=None):
+        # step : pas de répétition (taille de la tuile par défaut)
+        self.tile_w, self.tile_h = step or tile.get_size()
+        self.view_w, self.view_h = view_w, view_h
+        # même format de pixels que la tuile (blit sans conversion)
+        self.layer = pygame.Surface((view_w + self.tile_w, view_h + self.tile_h), 0, tile)
+        for y in range(0, self.layer.get_height(), self.tile_h):
+            for x in range(0, self.layer.get_width(), self.tile_w):
+                self.layer.blit(tile, (x, y))
+
+    def draw(self, surface, cam_x, cam_y):
+        area = (cam_x % self.tile_w, cam_y % self.tile_h, self.view_w, self.view_h)
+        surface.blit(self.layer, (0, 0), area)
+
+
+_LAYERS = {}   # (tuile, taille de vue, pas) -> TiledBackground
+
+
+def get_background(tile, view_w=WIDTH, view_h=HEIGHT, step=None):
+    """Couche pré-rendue partagée pour cette tuile."""
+    key = (tile, view_w, view_h, step)
+    bg = _LAYERS.get(key)
+    if bg is None:
+        bg = _LAYERS[key] = TiledBackground(tile, view_w, view_h, step)
+    return bg
+
+
+def clear_cache():
+    _LAYERS.clear()
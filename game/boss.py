@@ -2,22 +2,23 @@
 import pygame, math
 from .enemy import Enemy
 from .settings import MAP_WIDTH, MAP_HEIGHT
-from .utils import resource_path
+from .sprites import TINT_BOSS
 class Boss(Enemy):
     def __init__(self, x, y, player_level):
         super().__init__(x, y, speed=40, tier='elite', player_level=player_level)
         
-        # Sprite agrandi
-        self.image = pygame.transform.rotozoom(self.image, 0, 2.0)
+        # Teinte rouge
+        self.tint_color = TINT_BOSS
+
+        # Sprite agrandi (les deux orientations, sinon le boss rétrécit en bougeant)
+        self.bake_sprites(size=self.img_right.get_size(), zoom=2.0)
+        self.image = self.img_right
         self.rect  = self.image.get_rect(center=self.rect.center)
         
         # Beaucoup plus de PV
         self.max_hp = int(self.max_hp * 5)
         self.hp     = self.max_hp
         
-        # Teinte rouge
-        self.tint_color = (255, 0, 0, 120)
-        
         # XP
         self.xp_value = player_level * 10
 
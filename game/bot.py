@@ -0,0 +1,75 @@
+# bot.py
+"""
+Joueur automatique des runs headless (équilibrage, voir sweep.py).
+
+Politique simple et déterministe : fuir le barycentre des ennemis proches
+(en s'écartant des bords de la map), sinon rejoindre l'orbe la plus
+proche ; crier dès qu'assez d'ennemis sont à portée ; prendre une
+amélioration au hasard (RNG du bot). L'attaque reste l'auto-attaque du
+joueur.
+"""
+import math
+import random
+
+import pygame
+
+from .settings import MAP_WIDTH, MAP_HEIGHT
+from .simulation import FrameInput
+
+DANGER_RADIUS = 220   # px : ennemis fuis
+EDGE_MARGIN   = 200   # px : les bords repoussent le bot
+SCREAM_CROWD  = 5     # ennemis à portée pour lancer le cri
+DEAD_ZONE     = 0.35  # composante minimale pour appuyer sur une touche
+
+
+class Bot:
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def act(self, sim):
+        """Actions hors tick (menu, cri) puis entrées du pas suivant."""
+        if sim.upgrade_choices:
+            sim.choose_upgrade(self.rng.choice(sim.upgrade_choices))
+        player = sim.player
+        px, py = player.rect.center
+
+        # ennemis proches : direction de fuite et foule à portée du cri
+        ax = ay = 0.0
+        crowd = 0
+        for e in self._threats(sim):
+            dx, dy = px - e.rect.centerx, py - e.rect.centery
+            dist = math.hypot(dx, dy) or 1.0
+            if dist < DANGER_RADIUS:
+                ax += dx / dist
+                ay += dy / dist
+            if dist < player.scream_range:
+                crowd += 1
+        if crowd >= SCREAM_CROWD and player.scream_timer <= 0:
+            sim.scream((px - ax, py - ay))
+
+        if ax == ay == 0.0:
+            orb = min(sim.xp_orbs, default=None,
+                      key=lambda o: (o.rect.centerx - px) ** 2 + (o.rect.centery - py) ** 2)
+            if orb is not None:
+                ax, ay = orb.rect.centerx - px, orb.rect.centery - py
+        # bords de la map
+        if px < EDGE_MARGIN:              ax += 1
+        if px > MAP_WIDTH - EDGE_MARGIN:  ax -= 1
+        if py < EDGE_MARGIN:              ay += 1
+        if py > MAP_HEIGHT - EDGE_MARGIN: ay -= 1
+        return FrameInput(keys=self._keys(ax, ay), mouse=(px + ax, py + ay))
+
+    def _threats(self, sim):
+        yield from sim.enemy_list
+        yield from sim.mages
+        yield from sim.boss_list
+
+    def _keys(self, ax, ay):
+        norm = math.hypot(ax, ay)
+        if norm == 0:
+            return {}
+        ax, ay = ax / norm, ay / norm
+        return {
+            pygame.K_q: ax < -DEAD_ZONE, pygame.K_d: ax > DEAD_ZONE,
+            pygame.K_z: ay < -DEAD_ZONE, pygame.K_s: ay > DEAD_ZONE,
+        }
@@ -0,0 +1,70 @@
+# camera.py
+"""
+Caméra et culling : seuls les objets dont le rect touche la vue (élargie
+d'une petite marge pour les barres de PV) sont dessinés. Si une grille
+spatiale à jour est fournie, l'ensemble visible est une requête de zone
+au lieu d'un parcours complet.
+"""
+import pygame
+from .settings import WIDTH, HEIGHT, MAP_WIDTH, MAP_HEIGHT
+
+
+class Camera:
+    MARGIN = 16   # px autour de l'écran (barres de PV au-dessus des sprites)
+
+    def __init__(self, width=WIDTH, height=HEIGHT):
+        self.rect = pygame.Rect(0, 0, width, height)
+        self.view = self.rect.inflate(self.MARGIN * 2, self.MARGIN * 2)
+        # compteurs de la frame en cours
+        self.drawn  = 0
+        self.culled = 0
+
+    @property
+    def x(self):
+        return self.rect.x
+
+    @property
+    def y(self):
+        return self.rect.y
+
+    def follow(self, target):
+        """Centre la caméra sur `target` (un Rect), bornée à la map."""
+        self.rect.x = max(0, min(target.centerx - self.rect.width  // 2, MAP_WIDTH  - self.rect.width))
+        self.rect.y = max(0, min(target.centery - self.rect.height // 2, MAP_HEIGHT - self.rect.height))
+        self.view.center = self.rect.center
+        return self.rect.x, self.rect.y
+
+    def begin_frame(self):
+        self.drawn  = 0
+        self.culled = 0
+
+    def visible(self, objs, grid=None):
+        """
+        Objets de `objs` visibles à l'écran, dans l'ordre de `objs`. `grid`
+        (SpatialHash contenant exactement `objs`) remplace les tests de
+        collision par une requête de zone.
+        """
+        if grid is not None:
+            # ordre des cellules → ordre de la liste : l'empilement des
+            # sprites ne change pas quand un objet passe d'une cellule à l'autre
+            hits = set(grid.query_rect(self.view))
+            out = [o for o in objs if o in hits] if hits else []
+        else:
+            view = self.view
+            out = [o for o in objs if o.rect.colliderect(view)]
+        self.drawn  += len(out)
+        self.culled += len(objs) - len(out)
+        return out
+
+    def tally(self, drawn, total):
+        """Compte un lot culled ailleurs (projectiles vectorisés…)."""
+        self.drawn  += drawn
+        self.culled += total - drawn
+
+    def is_visible(self, rect):
+        """Version unitaire (bonus, flash du boss…), comptée elle aussi."""
+        if rect.colliderect(self.view):
+            self.drawn += 1
+            return True
+        self.culled += 1
+        return False
@@ -0,0 +1,31 @@
+# combat.py
+"""
+Tests de touche vectorisés (NumPy) pour les attaques en cône :
+un seul appel pour toutes les cibles au lieu d'une boucle hypot/atan2.
+"""
+import numpy as np
+
+
+def centers_and_radii(targets):
+    """Tableaux (xs, ys, rayons) des centres des cibles (rayon = largeur/2)."""
+    n  = len(targets)
+    xs = np.fromiter((t.rect.centerx for t in targets), float, n)
+    ys = np.fromiter((t.rect.centery for t in targets), float, n)
+    rs = np.fromiter((t.rect.width for t in targets), float, n) / 2
+    return xs, ys, rs
+
+
+def cone_hits(ox, oy, angle, half_angle, max_range, xs, ys, radii=0.0):
+    """
+    Indices des cibles touchées par un cône partant de (ox, oy).
+    - angle      : direction du cône en degrés (repère écran, y vers le bas)
+    - half_angle : demi-ouverture en degrés
+    - max_range  : portée ; une cible est à portée si dist - rayon <= max_range
+    Même règle que l'ancienne boucle : écart angulaire <= half_angle.
+    """
+    dx = np.asarray(xs, dtype=float) - ox
+    dy = np.asarray(ys, dtype=float) - oy
+    dist  = np.hypot(dx, dy)
+    a2e   = np.degrees(np.arctan2(-dy, dx)) % 360
+    delta = np.abs((angle - a2e + 180) % 360 - 180)
+    return np.flatnonzero((dist - radii <= max_range) & (delta <= half_angle))
@@ -2,27 +2,53 @@
 
 import pygame
 import math
-import os
 from .settings import MAP_WIDTH, MAP_HEIGHT
-from .utils import resource_path
+from .sprites import get_sprite, TINT_RARE, TINT_ELITE, FLASH_WHITE
+from .enemy_store import Stored
+from .pool import Pool
+
 class Enemy:
     LIFESPAN = 40.0  # secondes
 
+    # État redirigé vers l'EnemyStore quand l'ennemi y est rattaché
+    _store = None
+    _slot  = None
+    hp           = Stored("hp")
+    slow_timer   = Stored("slow")
+    attack_timer = Stored("attack")
+    pause_timer  = Stored("pause")
+    flash_timer  = Stored("flash")
+
     def __init__(self, x, y, speed=100, tier='normal', player_level=1):
+        self.reset(x, y, speed, tier, player_level)
+
+    def reset(self, x, y, speed=100, tier='normal', player_level=1):
+        """(Ré)initialise le gobelin : création ou recyclage via POOL."""
         # moment de spawn
         self.spawn_time = pygame.time.get_ticks() / 1000.0
 
-        # Charger sprites droite/gauche
-        base = os.path.join("assets", "gobelin")
-        img_r = pygame.image.load(resource_path(base + "-right.png")).convert_alpha()
-        img_l = pygame.image.load(resource_path(base + "-left.png")).convert_alpha()
-        # Sprite scaling
+        # Teinte rare/elite
+        if tier == 'rare':
+            self.tint_color = TINT_RARE
+        elif tier == 'elite':
+            self.tint_color = TINT_ELITE
+        else:
+            self.tint_color = None
+
+        # Sprites droite/gauche partagés (registre global)
         sprite_scale = 1.3 if tier != 'normal' else 1.0
         size = (int(80 * sprite_scale), int(80 * sprite_scale))
-        self.img_right = pygame.transform.scale(img_r, size)
-        self.img_left  = pygame.transform.scale(img_l, size)
+        self.bake_sprites(size=size)
         self.image     = self.img_right
-        self.rect      = self.image.get_rect(center=(x, y))
+        rect = self.__dict__.get("rect")
+        if rect is None:
+            self.rect = self.image.get_rect(center=(x, y))
+        else:
+            # gobelin recyclé : on garde son Rect
+            rect.size   = self.image.get_size()
+            rect.center = (x, y)
+        # position flottante : le Rect entier tronquait les petits déplacements
+        self.fx, self.fy = self.rect.topleft
 
         # HP scaling
         if tier == 'elite':
@@ -49,18 +75,25 @@ class Enemy:
         self.attack_timer    = 0.0
         self.pause_timer     = 0.0
 
-        # Teinte rare/elite
-        if tier == 'rare':
-            self.tint_color = (0,0,255,80)
-        elif tier == 'elite':
-            self.tint_color = (255,255,0,80)
-        else:
-            self.tint_color = None
-
         # Flash blanc
         self.flash_duration = 0.2
         self.flash_timer    = 0.0
 
+    def bake_sprites(self, **variant):
+        """
+        Récupère dans le registre les sprites droite/gauche bruts, teintés
+        et en flash blanc : le dessin ne fait plus qu'un blit.
+        """
+        right = "assets/gobelin-right.png"
+        left  = "assets/gobelin-left.png"
+        tint  = self.tint_color
+        self.img_right    = get_sprite(right, **variant)
+        self.img_left     = get_sprite(left,  **variant)
+        self.tint_frames  = (get_sprite(right, tint=tint, **variant),
+                             get_sprite(left,  tint=tint, **variant))
+        self.flash_frames = (get_sprite(right, tint=tint, flash=FLASH_WHITE, **variant),
+                             get_sprite(left,  tint=tint, flash=FLASH_WHITE, **variant))
+
     def update(self, player_pos, dt):
         # timers attaque/pause/flash
         if self.attack_timer > 0:
@@ -78,6 +111,10 @@ class Enemy:
         else:
             factor = 1.0
 
+        # rect déplacé de l'extérieur (séparation…) → on reprend sa position
+        if self.rect.topleft != (round(self.fx), round(self.fy)):
+            self.fx, self.fy = self.rect.topleft
+
         # mouvement vers joueur
         dx = player_pos[0] - self.rect.centerx
         dy = player_pos[1] - self.rect.centery
@@ -85,21 +122,22 @@ class Enemy:
         if dist > 0:
             self.image = self.img_left if dx < 0 else self.img_right
             nx, ny = dx/dist, dy/dist
-            self.rect.x += nx * self.base_speed * factor * dt
-            self.rect.y += ny * self.base_speed * factor * dt
+            self.fx += nx * self.base_speed * factor * dt
+            self.fy += ny * self.base_speed * factor * dt
 
         # clamp
-        self.rect.x = max(0, min(self.rect.x, MAP_WIDTH - self.rect.width))
-        self.rect.y = max(0, min(self.rect.y, MAP_HEIGHT - self.rect.height))
+        self.fx = max(0, min(self.fx, MAP_WIDTH - self.rect.width))
+        self.fy = max(0, min(self.fy, MAP_HEIGHT - self.rect.height))
+        self.rect.topleft = (round(self.fx), round(self.fy))
+
+    def sprite(self, cam_x, cam_y):
+        """Paire (image, position écran) à blitter (voir RenderQueue)."""
+        frames = self.flash_frames if self.flash_timer > 0 else self.tint_frames
+        return frames[self.image is self.img_left], (self.rect.x - cam_x, self.rect.y - cam_y)
 
     def draw(self, surface, cam_x, cam_y):
-        pos = (self.rect.x - cam_x, self.rect.y - cam_y)
-        surface.blit(self.image, pos)
-        if self.tint_color:
-            mask = pygame.mask.from_surface(self.image)
-            tint = mask.to_surface(setcolor=self.tint_color, unsetcolor=(0,0,0,0))
-            surface.blit(tint, pos)
-        if self.flash_timer > 0:
-            mask = pygame.mask.from_surface(self.image)
-            flash = mask.to_surface(setcolor=(255,255,255,150), unsetcolor=(0,0,0,0))
-            surface.blit(flash, pos)
+        surface.blit(*self.sprite(cam_x, cam_y))
+
+
+# gobelins recyclés entre deux morts / despawns
+POOL = Pool(Enemy)
@@ -0,0 +1,176 @@
+# enemy_store.py
+"""
+Stockage « struct-of-arrays » des gobelins pour le mode stress.
+
+Positions (flottantes), vitesses, timers et PV vivent dans des tableaux
+NumPy ; un seul pas vectorisé remplace la boucle d'Enemy.update. Les objets
+Enemy restent des vues fines : leurs timers/PV sont lus et écrits dans le
+store (voir `Stored`), et leur rect est recopié après chaque pas pour le
+dessin, les collisions et les tests.
+"""
+import numpy as np
+from .settings import MAP_WIDTH, MAP_HEIGHT
+
+
+class Stored:
+    """
+    Attribut d'Enemy redirigé vers une colonne de l'EnemyStore quand
+    l'ennemi y est rattaché, stocké dans l'instance sinon.
+    """
+    def __init__(self, column):
+        self.column = column
+
+    def __set_name__(self, owner, name):
+        self.name = "_" + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            return obj.__dict__[self.name]
+        return float(store.columns[self.column][obj._slot])
+
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            obj.__dict__[self.name] = value
+        else:
+            store.columns[self.column][obj._slot] = value
+
+
+class EnemyStore:
+    COLUMNS = ("x", "y", "w", "h", "speed", "hp",
+               "slow", "attack", "pause", "flash", "left")
+    SLOW_FACTOR = 0.5
+
+    def __init__(self, capacity=256):
+        self.enemies = []
+        self.columns = {c: np.zeros(capacity) for c in self.COLUMNS}
+        # dernières positions entières écrites dans les rects
+        self._rx = np.zeros(capacity, dtype=np.int64)
+        self._ry = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.enemies)
+
+    def __iter__(self):
+        return iter(self.enemies)
+
+    def _grow(self):
+        cap = len(self._rx) * 2
+        for c, arr in self.columns.items():
+            new = np.zeros(cap)
+            new[:len(arr)] = arr
+            self.columns[c] = new
+        for name in ("_rx", "_ry"):
+            old = getattr(self, name)
+            new = np.zeros(cap, dtype=np.int64)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, enemy):
+        """Recopie l'état de l'ennemi dans les tableaux et le rattache."""
+        i = len(self.enemies)
+        if i == len(self._rx):
+            self._grow()
+        col = self.columns
+        r = enemy.rect
+        values = {
+            "x": r.x, "y": r.y, "w": r.width, "h": r.height,
+            "speed": enemy.base_speed, "hp": enemy.hp,
+            "slow": enemy.slow_timer, "attack": enemy.attack_timer,
+            "pause": enemy.pause_timer, "flash": enemy.flash_timer,
+            "left": enemy.image is enemy.img_left,
+        }
+        for c, v in values.items():
+            col[c][i] = v
+        self._rx[i], self._ry[i] = r.x, r.y
+        enemy._store, enemy._slot = self, i
+        self.enemies.append(enemy)
+        return enemy
+
+    def remove(self, enemy):
+        """Retrait O(1) : le dernier ennemi prend la place libérée."""
+        i, last = enemy._slot, len(self.enemies) - 1
+        # l'ennemi redevient autonome avec son état courant
+        state = {a: getattr(enemy, a) for a in
+                 ("hp", "slow_timer", "attack_timer", "pause_timer", "flash_timer")}
+        enemy._store, enemy._slot = None, None
+        for a, v in state.items():
+            setattr(enemy, a, v)
+        if i != last:
+            moved = self.enemies[last]
+            self.enemies[i] = moved
+            moved._slot = i
+            for arr in self.columns.values():
+                arr[i] = arr[last]
+            self._rx[i], self._ry[i] = self._rx[last], self._ry[last]
+        self.enemies.pop()
+
+    def clear(self):
+        for e in self.enemies[::-1]:
+            self.remove(e)
+
+    def step(self, player_pos, dt):
+        """Équivalent vectorisé d'Enemy.update pour tous les gobelins."""
+        n = len(self.enemies)
+        if n == 0:
+            return
+        col = self.columns
+        x, y = col["x"][:n], col["y"][:n]
+        w, h = col["w"][:n], col["h"][:n]
+
+        # rects déplacés de l'extérieur (séparation…) → on reprend leur position
+        rx = np.fromiter((e.rect.x for e in self.enemies), np.int64, n)
+        ry = np.fromiter((e.rect.y for e in self.enemies), np.int64, n)
+        moved = (rx != self._rx[:n]) | (ry != self._ry[:n])
+        x[moved] = rx[moved]
+        y[moved] = ry[moved]
+
+        # timers attaque/pause/flash (un ennemi en pause ne bouge pas)
+        attack = col["attack"][:n]
+        attack[attack > 0] -= dt
+        pause = col["pause"][:n]
+        paused = pause > 0
+        pause[paused] -= dt
+        active = ~paused
+        flash = col["flash"][:n]
+        flash[active & (flash > 0)] -= dt
+
+        # slow
+        slow = col["slow"][:n]
+        slowed = active & (slow > 0)
+        slow[slowed] -= dt
+        factor = np.where(slowed, self.SLOW_FACTOR, 1.0)
+
+        # mouvement vers le joueur
+        dx = player_pos[0] - (x + w // 2)
+        dy = player_pos[1] - (y + h // 2)
+        dist = np.hypot(dx, dy)
+        moving = active & (dist > 0)
+        safe = np.where(moving, dist, 1.0)
+        step = np.where(moving, col["speed"][:n] * factor * dt / safe, 0.0)
+        x += dx * step
+        y += dy * step
+        left = col["left"][:n]
+        left[moving] = dx[moving] < 0
+
+        # clamp (sauf ennemis en pause, comme Enemy.update)
+        np.copyto(x, np.clip(x, 0, MAP_WIDTH - w), where=active)
+        np.copyto(y, np.clip(y, 0, MAP_HEIGHT - h), where=active)
+
+        self.sync_rects()
+
+    def sync_rects(self):
+        """Recopie positions et orientation dans les Enemy (vues)."""
+        n = len(self.enemies)
+        col = self.columns
+        rx = np.rint(col["x"][:n]).astype(np.int64)
+        ry = np.rint(col["y"][:n]).astype(np.int64)
+        self._rx[:n], self._ry[:n] = rx, ry
+        for e, ex, ey, left in zip(self.enemies, rx.tolist(), ry.tolist(),
+                                   col["left"][:n].tolist()):
+            e.rect.x = ex
+            e.rect.y = ey
+            e.image = e.img_left if left else e.img_right
@@ -0,0 +1,47 @@
+# fonts.py
+"""
+Registre de polices et cache des textes rendus.
+
+Chaque (police, taille) n'est ouverte qu'une fois, et un texte inchangé
+(même police, même chaîne, même couleur) n'est rastérisé qu'une fois :
+le HUD ne re-rend que ce qui change réellement.
+"""
+from functools import lru_cache
+
+import pygame
+import pygame.freetype
+from .utils import resource_path
+
+CINZEL = "assets/fonts/Cinzel/static/Cinzel-Regular.ttf"
+
+_FONTS = {}
+
+
+def get_font(path, size, freetype=False):
+    """
+    Police partagée pour (path, size). path=None → police par défaut de
+    pygame. freetype=True → pygame.freetype.Font au lieu de pygame.font.Font.
+    """
+    key = (path, size, freetype)
+    font = _FONTS.get(key)
+    if font is None:
+        file = resource_path(path) if path else None
+        if freetype:
+            font = pygame.freetype.Font(file, size)
+        else:
+            font = pygame.font.Font(file, size)
+        _FONTS[key] = font
+    return font
+
+
+@lru_cache(maxsize=512)
+def render_text(font, text, color):
+    """Surface du texte, mise en cache (LRU) par (police, texte, couleur)."""
+    if isinstance(font, pygame.freetype.Font):
+        return font.render(text, fgcolor=color)[0]
+    return font.render(text, True, color)
+
+
+def clear_cache():
+    render_text.cache_clear()
+    _FONTS.clear()
@@ -1,21 +1,20 @@
 # goblin_mage.py
 
-import os
 import math
-import pygame
 from .settings import MAP_WIDTH, MAP_HEIGHT, WIDTH, HEIGHT
-from .projectile import Fireball
-from .utils import resource_path
+from .projectile_manager import ProjectileManager
+from .hp_bars import bar_sprite
+from .sprites import get_sprite, FLASH_WHITE
 
 class GoblinMage:
-    def __init__(self, x, y):
-        # — Charger & scaler le sprite du mage —
-        raw = pygame.image.load(resource_path("assets/gobelin_mage.png")).convert_alpha()
+    def __init__(self, x, y, projectile_manager=None):
+        # — Sprite du mage (partagé, mis à l'échelle une seule fois) —
         scale_factor = 0.18  # ajustez pour plus petit ou plus grand
-        iw, ih = raw.get_size()
-        sw, sh = int(iw * scale_factor), int(ih * scale_factor)
-        self.image = pygame.transform.scale(raw, (sw, sh))
+        self.image = get_sprite("assets/gobelin_mage.png", scale=scale_factor)
+        self.flash_image = get_sprite("assets/gobelin_mage.png", scale=scale_factor,
+                                      flash=FLASH_WHITE)
         self.rect  = self.image.get_rect(center=(x, y))
+        self.fx, self.fy = self.rect.topleft
 
         # — Stats & timers —
         self.base_speed       = 80
@@ -25,7 +24,11 @@ class GoblinMage:
         self.fire_cooldown    = 5.0
         self.fire_timer       = 0.0
 
-        self.projectiles      = []
+        # Boules de feu : gestionnaire global de la simulation (Simulation.add_mage),
+        # à défaut un gestionnaire propre au mage
+        if projectile_manager is None:
+            projectile_manager = ProjectileManager()
+        self.projectile_manager = projectile_manager
 
         # HP, XP & dégâts
         self.max_hp           = 6
@@ -68,17 +71,21 @@ class GoblinMage:
         desired_max = getattr(player, "attack_range", 50) * self.max_mul
         move = self.base_speed * speed_factor * dt
 
+        # rect déplacé de l'extérieur (séparation…) → on reprend sa position
+        if self.rect.topleft != (round(self.fx), round(self.fy)):
+            self.fx, self.fy = self.rect.topleft
         if dist > desired_max:
-            self.rect.x += nx * move
-            self.rect.y += ny * move
+            self.fx += nx * move
+            self.fy += ny * move
         elif dist < desired_min:
-            self.rect.x -= nx * move
-            self.rect.y -= ny * move
+            self.fx -= nx * move
+            self.fy -= ny * move
         # sinon reste en place
 
         # Clamp aux limites de la map
-        self.rect.x = max(0, min(self.rect.x, MAP_WIDTH  - self.rect.width))
-        self.rect.y = max(0, min(self.rect.y, MAP_HEIGHT - self.rect.height))
+        self.fx = max(0, min(self.fx, MAP_WIDTH  - self.rect.width))
+        self.fy = max(0, min(self.fy, MAP_HEIGHT - self.rect.height))
+        self.rect.topleft = (round(self.fx), round(self.fy))
 
         # 3) Tir si à l’écran et cooldown terminé
         on_screen = (
@@ -87,38 +94,25 @@ class GoblinMage:
         )
         if on_screen and self.fire_timer <= 0:
             self.fire_timer = self.fire_cooldown
-            fx, fy = player.rect.center
-            self.projectiles.append(
-                Fireball(self.rect.centerx, self.rect.centery, (fx, fy))
-            )
-
-        # 4) Update projectiles
-        for fb in self.projectiles[:]:
-            fb.update(dt)
-            if fb.off_screen() or getattr(fb, "hit_target", False):
-                self.projectiles.remove(fb)
+            # déplacées, retirées et dessinées par le gestionnaire
+            self.projectile_manager.spawn(self.rect.centerx, self.rect.centery,
+                                          player.rect.center, damage=self.damage)
 
     def draw(self, surface, cam_x, cam_y):
-        # 1) Sprite
-        surface.blit(self.image, (self.rect.x - cam_x, self.rect.y - cam_y))
-
-        # 2) Flash blanc respectant la forme du sprite
-        if self.flash_timer > 0:
-            mask = pygame.mask.from_surface(self.image)
-            flash_surf = mask.to_surface(
-                setcolor=(255,255,255,150),
-                unsetcolor=(0,0,0,0)
-            )
-            surface.blit(flash_surf, (self.rect.x - cam_x, self.rect.y - cam_y))
-
-        # 3) Barre de PV
-        bar_w, bar_h = self.rect.width, 5
-        bx = self.rect.x - cam_x
-        by = self.rect.y - cam_y - bar_h - 2
-        pygame.draw.rect(surface, (100, 0, 0), (bx, by, bar_w, bar_h))
-        hp_ratio = max(0, self.hp) / self.max_hp
-        pygame.draw.rect(surface, (0, 200, 0), (bx, by, bar_w * hp_ratio, bar_h))
-
-        # 4) Projectiles
-        for fb in self.projectiles:
-            fb.draw(surface, cam_x, cam_y)
+        # les boules de feu sont dessinées par leur gestionnaire
+        self.draw_body(surface, cam_x, cam_y)
+
+    def sprite(self, cam_x, cam_y):
+        """Paire (image, position écran) du corps, sans barre ni projectiles."""
+        img = self.flash_image if self.flash_timer > 0 else self.image
+        return img, (self.rect.x - cam_x, self.rect.y - cam_y)
+
+    def draw_body(self, surface, cam_x, cam_y):
+        """Sprite + barre de PV, sans les projectiles (cullés à part)."""
+        # 1) Sprite (variante flash blanc pré-calculée pendant le flash)
+        surface.blit(*self.sprite(cam_x, cam_y))
+
+        # 2) Barre de PV (seulement si blessé)
+        bar = bar_sprite(self, cam_x, cam_y)
+        if bar:
+            surface.blit(*bar)
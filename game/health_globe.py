@@ -0,0 +1,64 @@
+# health_globe.py
+"""
+Globe de vie pré-calculé.
+
+Par rayon, on prépare une seule fois la texture mise à l'échelle et
+découpée en disque, ainsi que l'ornement. Le niveau de remplissage est
+quantifié (LEVELS pas) : la couche « globe » (fond + liquide + contour)
+n'est recomposée que quand ce niveau change, et chaque frame coûte deux
+blits (globe puis ornement).
+"""
+import math
+import pygame
+
+
+class HealthGlobe:
+    LEVELS = 256
+
+    def __init__(self, texture, ornament, radius,
+                 bg_color=(0,0,0,128), outline_color=(255,255,255), outline_width=2):
+        self.radius        = radius
+        self.bg_color      = bg_color
+        self.outline_color = outline_color
+        self.outline_width = outline_width
+        diameter = radius * 2
+
+        # texture découpée en disque, ligne par ligne (même règle qu'avant)
+        self.fill = pygame.transform.smoothscale(texture, (diameter, diameter))
+        mask = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        for local_y in range(diameter):
+            dy = local_y - radius
+            dx = int(math.sqrt(radius*radius - dy*dy))
+            mask.fill((255,255,255,255), (radius - dx, local_y, dx*2, 1))
+        self.fill.blit(mask, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
+
+        # ornement agrandi et retourné une fois pour toutes
+        orn_size = diameter + outline_width * 2 + 40
+        self.ornament = pygame.transform.flip(
+            pygame.transform.smoothscale(ornament, (orn_size, orn_size)), True, False)
+
+        # couche composée, réutilisée d'un niveau à l'autre
+        self.layer = pygame.Surface((diameter + 1, diameter + 1), pygame.SRCALPHA)
+        self.level = None
+
+    def quantise(self, hp_ratio):
+        return round(max(0.0, min(1.0, hp_ratio)) * (self.LEVELS - 1))
+
+    def compose(self, level):
+        """Redessine fond + liquide + contour pour un niveau quantifié."""
+        r, layer = self.radius, self.layer
+        layer.fill((0,0,0,0))
+        pygame.draw.circle(layer, self.bg_color, (r, r), r)
+        if level > 0:
+            ratio   = level / (self.LEVELS - 1)
+            y_start = max(int(math.ceil(2 * r * (1 - ratio))), 0)
+            layer.blit(self.fill, (0, y_start), area=(0, y_start, 2 * r, 2 * r - y_start))
+        pygame.draw.circle(layer, self.outline_color, (r, r), r, self.outline_width)
+        self.level = level
+
+    def draw(self, surface, cx, cy, hp_ratio):
+        level = self.quantise(hp_ratio)
+        if level != self.level:
+            self.compose(level)
+        surface.blit(self.layer, (cx - self.radius, cy - self.radius))
+        surface.blit(self.ornament, self.ornament.get_rect(center=(cx, cy)))
@@ -0,0 +1,49 @@
+# hp_bars.py
+"""
+Barres de PV blittées depuis une bande pré-rendue.
+
+Par style (largeur, hauteur, couleurs), une seule surface « bande » de
+2 × largeur px : remplissage à gauche, fond à droite. La barre d'une entité
+à `filled` px de PV est la fenêtre [largeur - filled, 2 × largeur - filled)
+de la bande : un blit avec `area`, aucune primitive. Les entités à PV
+pleins n'ont pas de barre.
+"""
+import pygame
+
+BAR_HEIGHT = 5
+ENEMY_BAR  = ((100, 0, 0), (0, 200, 0))   # (fond, remplissage)
+BOSS_BAR   = ((100, 0, 0), (200, 0, 0))
+
+_STRIPS = {}   # (largeur, hauteur, fond, remplissage) -> surface
+
+
+def get_strip(width, height, back, fill):
+    key = (width, height, back, fill)
+    strip = _STRIPS.get(key)
+    if strip is None:
+        strip = _STRIPS[key] = pygame.Surface((width * 2, height))
+        strip.fill(fill, (0, 0, width, height))
+        strip.fill(back, (width, 0, width, height))
+    return strip
+
+
+def filled_width(hp, max_hp, width):
+    return max(0, min(width, int(width * hp / max_hp)))
+
+
+def bar_sprite(obj, cam_x, cam_y, colors=ENEMY_BAR, offset=BAR_HEIGHT + 2, height=BAR_HEIGHT):
+    """
+    (bande, position écran, area) de la barre `offset` px au-dessus de
+    `obj`, ou None s'il a tous ses PV.
+    """
+    if obj.hp >= obj.max_hp:
+        return None
+    w = obj.rect.width
+    filled = filled_width(obj.hp, obj.max_hp, w)
+    return (get_strip(w, height, *colors),
+            (obj.rect.x - cam_x, obj.rect.y - cam_y - offset),
+            (w - filled, 0, w, height))
+
+
+def clear_cache():
+    _STRIPS.clear()
@@ -1,7 +1,6 @@
 import pygame
 import pygame.gfxdraw
 import random
-import math
 import sys
 import os
 import pygame.surfarray as surfarray
@@ -9,12 +8,20 @@ import numpy as np
 
 from .settings import *
 from .player import Player
-from .enemy import Enemy
-from .xp_orb import XPOrb
-from .goblin_mage import GoblinMage
-from .boss import Boss
 from PIL import Image
 from .utils import resource_path
+from . import sounds, sprites
+from .fonts import CINZEL, get_font, render_text
+from .health_globe import HealthGlobe
+from .background import get_background
+from .overlays import HudLayer, draw_veil
+from .render_queue import draw_layers
+from .snapshot import capture
+from .pipeline import Pipeline
+from .timestep import FixedTimestep
+from .replay import Recording, ReplayDriver, record as record_inputs
+from .profiler import FrameProfiler
+from .simulation import Simulation, FrameInput, BONUS_SIZE
 
 from .settings import WIDTH, HEIGHT   # ou votre constante de chemin
 
@@ -28,10 +35,6 @@ FONT_SMALL      = None
 HEALTH_ORNAMENT = None
 HEALTH_TEXTURE  = None
 
-# Cap de monstres, évolue avec le level
-BASE_MAX_ENEMIES   = 5   # mobs minimum level 1
-PER_LEVEL_ENEMIES  = 2   # mobs en plus par level
-
 TOUCHES_IMG_PATH = os.path.join("assets", "touches.png")
 
 
@@ -54,23 +57,13 @@ def get_cri_icons():
         gray_arr = np.stack([lum, lum, lum], axis=2)
         surfarray.blit_array(CRI_ICON_GRAY, gray_arr)
         # 3) Load a small Font for cooldown text
-        FONT_SMALL = pygame.font.Font(
-            resource_path("assets/fonts/Cinzel/static/Cinzel-Regular.ttf"),
-            20
-        )
+        FONT_SMALL = get_font(CINZEL, 20)
     return CRI_ICON, CRI_ICON_GRAY, FONT_SMALL
 
 
 def draw_tiled_background(surf, cx, cy, bg_img, bg_w, bg_h):
-    ox = -(cx % bg_w)
-    oy = -(cy % bg_h)
-    y = oy - bg_h
-    while y < HEIGHT:
-        x = ox - bg_w
-        while x < WIDTH:
-            surf.blit(bg_img, (x, y))
-            x += bg_w
-        y += bg_h
+    # couche répétée une fois pour toutes, puis un seul blit décalé
+    get_background(bg_img, step=(bg_w, bg_h)).draw(surf, cx, cy)
 
 
 class UpgradeMenu:
@@ -80,17 +73,11 @@ class UpgradeMenu:
         self.card_img = pygame.image.load(resource_path("assets/upgrade_card.png")).convert_alpha()
         self.btn_w, self.btn_h = self.card_img.get_size()
         self.margin        = 20
-        self.font_title = pygame.freetype.Font(
-            resource_path("assets/fonts/Cinzel/static/Cinzel-Regular.ttf"),
-            24
-        )
-        self.font_body = pygame.freetype.Font(
-            resource_path("assets/fonts/Cinzel/static/Cinzel-Regular.ttf"),
-            16
-        )
-
-    def open(self):
-        self.choices = random.sample(Player.UPGRADE_KEYS, 3)
+        self.font_title = get_font(CINZEL, 24, freetype=True)
+        self.font_body  = get_font(CINZEL, 16, freetype=True)
+
+    def open(self, choices=None, rng=random):
+        self.choices = choices if choices is not None else rng.sample(Player.UPGRADE_KEYS, 3)
         self.rects.clear()
         n = len(self.choices)
         group_w    = n * self.btn_w + (n - 1) * self.margin
@@ -101,15 +88,13 @@ class UpgradeMenu:
             self.rects.append(pygame.Rect(x, y, self.btn_w, self.btn_h))
 
     def draw(self, surf, alpha=255, show_choices=True):
-        ov = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        ov.fill((0, 0, 0, alpha//2))
-        surf.blit(ov, (0, 0))
+        draw_veil(surf, (0, 0, 0), alpha//2)
         if not show_choices:
             return
         for key, rect in zip(self.choices, self.rects):
             surf.blit(self.card_img, rect.topleft)
-            t_surf, t_rect = self.font_title.render(key, fgcolor=(255,255,255))
-            t_rect.center  = (rect.centerx, rect.centery - 30)
+            t_surf = render_text(self.font_title, key, (255,255,255))
+            t_rect = t_surf.get_rect(center=(rect.centerx, rect.centery - 30))
             surf.blit(t_surf, t_rect)
 
             info = Player.UPGRADE_INFO[key]
@@ -122,47 +107,32 @@ class UpgradeMenu:
                 sign = "+" if pct > 0 else ""
                 desc = f"{sign}{pct}% {info['unit']}"
 
-            d_surf, d_rect = self.font_body.render(desc, fgcolor=(200,200,200))
-            d_rect.center  = (rect.centerx, rect.centery + 30)
+            d_surf = render_text(self.font_body, desc, (200,200,200))
+            d_rect = d_surf.get_rect(center=(rect.centerx, rect.centery + 30))
             surf.blit(d_surf, d_rect)
 
 
 def draw_bottom_overlay(surface, overlay, y_offset=0, zoom=1):
-    if zoom != 1.0:
-        ov = pygame.transform.rotozoom(overlay, 0, zoom)
-    else:
-        ov = overlay
+    ov = sprites.zoomed(overlay, zoom)
     rect = ov.get_rect()
     rect.midbottom = (WIDTH // 2, HEIGHT + y_offset)
     surface.blit(ov, rect)
 
 
+_HEALTH_GLOBES = {}
+
 def draw_health_globe(surface, cx, cy, radius, hp_ratio,
                       bg_color=(0,0,0,128), fg_color=(149,26,26),
                       outline_color=(255,255,255), outline_width=2):
-    diameter = radius * 2
-    pygame.gfxdraw.filled_circle(surface, cx, cy, radius, bg_color)
-    if hp_ratio > 0:
-        level_y = cy + radius - hp_ratio * diameter
-        y_start = max(int(math.ceil(level_y)), cy - radius)
-        y_end   = cy + radius
-        texture = pygame.transform.smoothscale(HEALTH_TEXTURE, (diameter, diameter))
-        mask    = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
-        for y in range(y_start, y_end + 1):
-            dy      = y - cy
-            dx      = int(math.sqrt(radius*radius - dy*dy))
-            local_y = y - (cy - radius)
-            local_x = (cx - dx) - (cx - radius)
-            mask.fill((255,255,255,255), (local_x, local_y, dx*2, 1))
-        masked = texture.copy()
-        masked.blit(mask, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
-        surface.blit(masked, (cx - radius, cy - radius))
-    pygame.draw.circle(surface, outline_color, (cx, cy), radius, outline_width)
-    orn_size  = diameter + outline_width * 2 + 40
-    ornament  = pygame.transform.smoothscale(HEALTH_ORNAMENT, (orn_size, orn_size))
-    ornament  = pygame.transform.flip(ornament, True, False)
-    orn_rect  = ornament.get_rect(center=(cx, cy))
-    surface.blit(ornament, orn_rect)
+    # un globe pré-calculé par (textures, rayon, style), recomposé
+    # seulement quand le niveau de PV quantifié change
+    key = (HEALTH_TEXTURE, HEALTH_ORNAMENT, radius, bg_color, outline_color, outline_width)
+    globe = _HEALTH_GLOBES.get(key)
+    if globe is None:
+        globe = HealthGlobe(HEALTH_TEXTURE, HEALTH_ORNAMENT, radius,
+                            bg_color, outline_color, outline_width)
+        _HEALTH_GLOBES[key] = globe
+    globe.draw(surface, cx, cy, hp_ratio)
 
 def load_clean(path):
     """
@@ -268,12 +238,8 @@ def show_touches_screen(screen, clock):
     black   = pygame.Surface((sw, sh)); black.fill((0,0,0))
 
     # Prepare Cinzel text
-    font_path = os.path.join("assets","fonts","Cinzel","static","Cinzel-Regular.ttf")
     font_size = 36
-    font = pygame.font.Font(
-        resource_path("assets/fonts/Cinzel/static/Cinzel-Regular.ttf"),
-        font_size
-    )
+    font = get_font(CINZEL, font_size)
     lines     = ["Se déplacer : ZQSD", "Dash : ESPACE", "Cri : Clique droit"]
     spacing   = 10
     total_h   = len(lines)*font_size + (len(lines)-1)*spacing
@@ -290,7 +256,7 @@ def show_touches_screen(screen, clock):
         screen.fill((0,0,0))
         screen.blit(img, img_rect)
         for i, txt in enumerate(lines):
-            surf = font.render(txt, True, (255,255,255))
+            surf = render_text(font, txt, (255,255,255))
             r    = surf.get_rect(center=(sw//2,
                            y_start + i*(font_size+spacing) + font_size//2))
             screen.blit(surf, r)
@@ -309,7 +275,7 @@ def show_touches_screen(screen, clock):
         screen.fill((0,0,0))
         screen.blit(img, img_rect)
         for i, txt in enumerate(lines):
-            surf = font.render(txt, True, (255,255,255))
+            surf = render_text(font, txt, (255,255,255))
             r    = surf.get_rect(center=(sw//2,
                            y_start + i*(font_size+spacing) + font_size//2))
             screen.blit(surf, r)
@@ -327,7 +293,7 @@ def show_touches_screen(screen, clock):
         screen.fill((0,0,0))
         screen.blit(img, img_rect)
         for i, txt in enumerate(lines):
-            surf = font.render(txt, True, (255,255,255))
+            surf = render_text(font, txt, (255,255,255))
             r    = surf.get_rect(center=(sw//2,
                            y_start + i*(font_size+spacing) + font_size//2))
             screen.blit(surf, r)
@@ -339,20 +305,29 @@ def show_touches_screen(screen, clock):
 # game/main.py
 import pygame
 
+def scream_target(event, cam_x, cam_y):
+    """Cible monde du cri si `event` le déclenche (touche C ou clic droit), sinon None."""
+    if (event.type == pygame.KEYDOWN and event.key == pygame.K_c) or \
+            (event.type == pygame.MOUSEBUTTONDOWN and event.button == 3):
+        mx, my = pygame.mouse.get_pos()
+        return (mx+cam_x, my+cam_y)
+    return None
+
 def handle_scream_input(event, player, enemy_list, mages, cam_x, cam_y):
     """
     Gère un event pygame pour déclencher le cri :
     - si event est KEYDOWN et key == K_c, ou clic droit -> player.scream
     """
-    if event.type == pygame.KEYDOWN and event.key == pygame.K_c:
-        mx, my = pygame.mouse.get_pos()
-        player.scream(enemy_list, mages, (mx+cam_x, my+cam_y))
-        return True
-    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
-        mx, my = pygame.mouse.get_pos()
-        player.scream(enemy_list, mages, (mx+cam_x, my+cam_y))
-        return True
-    return False
+    target = scream_target(event, cam_x, cam_y)
+    if target is None:
+        return False
+    player.scream(enemy_list, mages, target)
+    return True
+
+
+def scream_label(timer):
+    """Texte du cooldown du cri, None quand il est prêt."""
+    return f"{timer:.1f}" if timer > 0 else None
 
 
 def draw_scream_cooldown(screen, player):
@@ -361,6 +336,11 @@ def draw_scream_cooldown(screen, player):
     100px from the bottom, with a gray border while on cooldown,
     and a green border when ready.
     """
+    return draw_scream_icon(screen, scream_label(player.scream_timer))
+
+
+def draw_scream_icon(screen, label):
+    """Icône du cri et son timer (`label`, None si prêt). Renvoie le rect touché."""
     icon, icon_gray, font_small = get_cri_icons()
     sw, sh   = screen.get_size()
     # position centrée :
@@ -368,51 +348,170 @@ def draw_scream_cooldown(screen, player):
     y        = sh - 50 - ICON_SIZE
 
     # Choix de l'icône et de la couleur de bordure
-    ready = (player.scream_timer <= 0)
+    ready = label is None
     to_draw = icon if ready else icon_gray
     border_color = (0, 255, 0) if ready else (150, 150, 150)
 
     # Dessiner le contour avec la couleur appropriée
     border_rect = pygame.Rect(x - 2, y - 2, ICON_SIZE + 4, ICON_SIZE + 4)
-    pygame.draw.rect(screen, border_color, border_rect, border_radius=4)
+    touched = pygame.draw.rect(screen, border_color, border_rect, border_radius=4)
 
     # Afficher l’icône du cri
     screen.blit(to_draw, (x, y))
 
     # Si en cooldown, afficher le timer
     if not ready:
-        text = f"{player.scream_timer:.1f}"
-        surf = font_small.render(text, True, (255,255,255))
+        surf = render_text(font_small, label, (255,255,255))
         rect = surf.get_rect(midbottom=(x + ICON_SIZE//2, y - 2))
-        screen.blit(surf, rect)
+        touched = touched.union(screen.blit(surf, rect))
+    return touched
+
+
+XP_BAR_W, XP_BAR_H, XP_BAR_Y = 300, 8, 20
+DASH_BAR_W, DASH_BAR_H = 40, 9
+_DASH_BARS = {}
+
+
+def build_hud(art, size):
+    """
+    Couche HUD fixe à l'écran : overlay du bas et cadre de la barre d'XP
+    pré-rendus, remplissage d'XP, niveau et icône du cri en éléments
+    redessinés seulement quand leur valeur change.
+    """
+    hud = HudLayer(size)
+    draw_bottom_overlay(hud.base, art.bottom_overlay, y_offset=art.overlay_y_offset, zoom=art.overlay_zoom)
+    bar = pygame.Rect((size[0] - XP_BAR_W) // 2, XP_BAR_Y, XP_BAR_W, XP_BAR_H)
+    pygame.draw.rect(hud.base, (50,50,50), bar)
+    pygame.draw.rect(hud.base, (255,255,255), bar, 2)
+    inner = bar.inflate(-4, -4)
+
+    def xp_fill(surf, filled):
+        # partie du remplissage qui dépasse du cadre (bordure de 2 px)
+        w = min(filled - 2, inner.width)
+        if w > 0:
+            return pygame.draw.rect(surf, (200,200,0), (inner.x, inner.y, w, inner.height))
+
+    def level_text(surf, level):
+        ts = render_text(art.font_hud, f"Level: {level}", (255,255,255))
+        return surf.blit(ts, ts.get_rect(midtop=(size[0]//2, bar.bottom + 5)))
+
+    hud.add("xp", xp_fill)
+    hud.add("level", level_text)
+    hud.add("scream", draw_scream_icon)
+    return hud
+
+
+def get_hud(art, size):
+    """HUD de `art`, reconstruit seulement si la résolution ou l'overlay change."""
+    key = (tuple(size), art.overlay_y_offset, art.overlay_zoom)
+    if art.hud is None or art.hud_key != key:
+        art.hud, art.hud_key = build_hud(art, size), key
+    return art.hud
+
+
+def get_dash_bar(filled):
+    """Barre de dash (fond, remplissage, contour) pré-rendue par largeur remplie."""
+    bar = _DASH_BARS.get(filled)
+    if bar is None:
+        bar = _DASH_BARS[filled] = pygame.Surface((DASH_BAR_W, DASH_BAR_H))
+        bar.fill((50,50,50))
+        bar.fill((0,200,200), (0, 0, filled, DASH_BAR_H))
+        pygame.draw.rect(bar, (255,255,255), bar.get_rect(), 1)
+    return bar
+
+
+class GameArt:
+    """Images et police du HUD, chargées une fois après set_mode()."""
+    def __init__(self):
+        global HEALTH_ORNAMENT, HEALTH_TEXTURE
+        self.bottom_overlay = pygame.image.load(resource_path("assets/bottom_overlay.png")).convert_alpha()
+        HEALTH_ORNAMENT     = pygame.image.load(resource_path("assets/health_orb_ornement.png")).convert_alpha()
+        HEALTH_TEXTURE      = pygame.image.load(resource_path("assets/health_texture.png")).convert_alpha()
+
+        self.overlay_y_offset = 335
+        self.overlay_zoom     = 0.9
+        self.hud = self.hud_key = None   # voir get_hud
+
+        raw_menu = pygame.image.load(resource_path("assets/main_menu.png")).convert()
+        self.main_menu = pygame.transform.scale(raw_menu, (WIDTH, HEIGHT))
+
+        self.background = pygame.image.load(resource_path("assets/background.png")).convert()
+        self.bg_w, self.bg_h = self.background.get_size()
+        magnet_raw  = pygame.image.load(resource_path("assets/magnet.png")).convert_alpha()
+        self.magnet = pygame.transform.smoothscale(magnet_raw, (BONUS_SIZE, BONUS_SIZE))
+
+        self.font_hud = get_font(CINZEL, 24, freetype=True)
+
+
+def read_frame_input(camera):
+    """Clavier + souris de la frame, souris convertie en coordonnées monde."""
+    mx, my = pygame.mouse.get_pos()
+    return FrameInput(keys=pygame.key.get_pressed(),
+                      mouse=(mx + camera.x, my + camera.y),
+                      attack=pygame.mouse.get_pressed()[0])
+
+
+def draw_world(screen, sim, art, alpha=1.0):
+    """
+    Dessine le monde et le HUD de la simulation (hors menus). `alpha`
+    interpole caméra et entités entre les deux derniers pas de simulation.
+    """
+    snap = capture(sim, alpha, art.magnet)
+    sim.profiler.lap("entities")
+    draw_snapshot(screen, snap, art, sim.profiler)
+    return snap
 
 
-def main():
+IDLE_PROFILER = FrameProfiler()
+
+
+def draw_snapshot(screen, snap, art, prof=IDLE_PROFILER):
+    """Dessine un RenderSnapshot : fond, couches d'entités puis HUD."""
+    cam_x, cam_y = snap.camera
+    draw_tiled_background(screen, cam_x, cam_y, art.background, art.bg_w, art.bg_h)
+    prof.lap("background")
+    draw_layers(screen, snap.layers)
+    prof.lap("entities")
+
+    # HUD fixe (overlay, XP, niveau, cri) : une couche, recomposée par morceaux
+    hud = get_hud(art, screen.get_size())
+    hud.set("xp", int(XP_BAR_W * snap.xp_ratio))
+    hud.set("level", snap.level)
+    hud.set("scream", scream_label(snap.scream_timer))
+    hud.draw(screen)
+
+    globe_x,globe_y,radius = 150,HEIGHT-150,100
+    draw_health_globe(screen,globe_x,globe_y,radius,snap.hp_ratio)
+
+    # Dash bar
+    px, py = snap.dash_pos
+    screen.blit(get_dash_bar(int(DASH_BAR_W*snap.dash_ratio)), (px-DASH_BAR_W//2, py))
+    prof.lap("hud")
+
+
+def draw_game_over(screen, snap):
+    """Écran de fin, d'après un RenderSnapshot."""
+    screen.fill((0,0,0))
+    f1=get_font(None,72); f2=get_font(None,48)
+    lines=["GAME OVER",f"Survived: {snap.survival_time:.1f}s",f"Level:    {snap.level}",f"Kills:    {snap.kills}"]
+    for i,t in enumerate(lines):
+        fn=f1 if i==0 else f2; surf=render_text(fn,t,(255,255,255))
+        screen.blit(surf,((WIDTH-surf.get_width())//2,150+i*80))
+
+
+def main(stress=False, profile_csv=None, pipeline=False, seed=None, record=None, replay=None):
     pygame.init()
     pygame.mixer.init()
     pygame.freetype.init()
+    # décode tous les effets une fois, avant la première partie
+    sounds.preload()
 
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Reincarnation of the unkillable last human against all gods")
 
     # now that display is ready, you can safely call get_cri_icons() once
     get_cri_icons()
-
-    # timers
-    screen_flash_timer = 0.0
-    FLASH_DURATION     = 0.08
-    HIT_FLASH_DURATION = 0.05
-
-    hit_flash_timer  = 0.0
-    hit_flash_target = None
-
-    global HEALTH_ORNAMENT, HEALTH_TEXTURE
-    bottom_overlay   = pygame.image.load(resource_path("assets/bottom_overlay.png")).convert_alpha()
-    HEALTH_ORNAMENT  = pygame.image.load(resource_path("assets/health_orb_ornement.png")).convert_alpha()
-    HEALTH_TEXTURE   = pygame.image.load(resource_path("assets/health_texture.png")).convert_alpha()
-
-    overlay_y_offset = 335
-    overlay_zoom     = 0.9
+    art = GameArt()
 
     clock = pygame.time.Clock()
     pygame.mixer.music.load(resource_path("fx/background_music.mp3"))
@@ -421,335 +520,119 @@ def main():
     pygame.mixer.music.play(-1, fade_ms=2000)
 
     main_menu       = True
-    raw_menu = pygame.image.load(resource_path("assets/main_menu.png")).convert()
-
-    main_menu_img   = pygame.transform.scale(raw_menu, (WIDTH, HEIGHT))
     play_button_rect= pygame.Rect(WIDTH//2 - 210, HEIGHT//2 + 50, 350, 120)
-
-    BONUS_SIZE      = 64
-    bg_img = pygame.image.load(resource_path("assets/background.png")).convert()
-
-    bg_w, bg_h      = bg_img.get_size()
-    magnet_raw = pygame.image.load(resource_path("assets/magnet.png")).convert_alpha()
-
-    magnet_img      = pygame.transform.smoothscale(magnet_raw, (BONUS_SIZE, BONUS_SIZE))
-
-    player     = Player(MAP_WIDTH // 2, MAP_HEIGHT // 2)
-    enemy_list = []
-    mages      = []
-    boss_list  = []
-    xp_orbs    = []
-
-    BONUS_TYPES = ["magnet"]
-    OFFSET      = 200
-    bonus_spawn_points = [
-        (OFFSET, OFFSET),
-        (MAP_WIDTH - BONUS_SIZE - OFFSET, OFFSET),
-        (OFFSET, MAP_HEIGHT - BONUS_SIZE - OFFSET),
-        (MAP_WIDTH - BONUS_SIZE - OFFSET, MAP_HEIGHT - BONUS_SIZE - OFFSET),
-    ]
-    current_bonus       = None
-
-    spawn_timer         = 0.0
-    base_spawn_interval = 3.0
-    mage_spawn_chance   = 0.1
-    start_ticks         = 0
-    kills               = 0
-    game_over           = False
-    survival_time       = 0.0
-
-    upgrade_menu         = UpgradeMenu()
-    upgrade_active       = False
-    upgrade_fade         = 0.0
-    fade_in_dur          = 0.5
-    fade_out_dur         = 1.0
-    upgrade_resume_timer = 0.0
-
+    sim             = None
+
+    upgrade_menu    = UpgradeMenu()
+    upgrade_fade    = 0.0
+    fade_in_dur     = 0.5
+    # simulation à pas fixe, rendu interpolé entre deux pas
+    timestep        = FixedTimestep()
+    # F3 : overlay du profileur ; profile_csv : une ligne par frame
+    profiler        = FrameProfiler(csv_path=profile_csv)
+    # pipeline : simulation de la frame N+1 sur un worker pendant le rendu de N
+    worker          = None
+    snap            = None
+    # graine de la partie (tirée au hasard sauf --seed) ; --record enregistre
+    # les entrées, --replay rejoue une partie enregistrée à la place du joueur
+    recorder        = None
+    driver          = None
+    if seed is None:
+        seed = random.randrange(2**32)
+    if replay:
+        # rejeu : pas de menu, la partie enregistrée démarre tout de suite
+        recording = Recording(replay)
+        sim       = recording.simulation(profiler)
+        driver    = ReplayDriver(recording)
+        main_menu = pipeline = False
 
     while True:
         dt = clock.tick(FPS) / 1000
-        screen_flash_timer = max(0.0, screen_flash_timer - dt)
-        hit_flash_timer    = max(0.0, hit_flash_timer    - dt)
-
-
-        hit_flash_timer = max(0.0, hit_flash_timer - dt)
-        if hit_flash_timer == 0:
-            hit_flash_target = None
-
-        # Level up → menu + boss spawn
-        if player.new_level:
-            upgrade_menu.open()
-            upgrade_active = True
-            upgrade_fade   = 0.0
-            if player.level % 10 == 0:
-                safe_dist = 800
-                while True:
-                    bx = random.randint(0, MAP_WIDTH)
-                    by = random.randint(0, MAP_HEIGHT)
-                    if math.hypot(bx - player.rect.centerx, by - player.rect.centery) >= safe_dist:
-                        break
-                b = Boss(bx, by, player.level)
-                boss_list.append(b)
-                b.hit_flash_timer = 0.0
-            player.new_level = False
+        profiler.begin_frame()
 
         # Événements
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                if worker:
+                    worker.close()
+                if recorder:
+                    recorder.close()
+                profiler.close()
                 pygame.quit()
                 sys.exit()
-
-        # au clic “Jouer” en menu principal, on affiche d’abord l’écran “touches” en fondu
-        if main_menu and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if play_button_rect.collidepoint(event.pos):
-                # 1) run the 7-image slideshow (skip on any key/mouse)
-                show_story_slideshow(screen, clock)
-
-                # 2) then show the controls screen (skip on any key/mouse)
-                show_touches_screen(screen, clock)
-
-                # 3) finally actually start the game
-                main_menu   = False
-                start_ticks = pygame.time.get_ticks()
-                kills       = 0
-                game_over   = False
-                enemy_list.clear()
-                mages.clear()
-                xp_orbs.clear()
-                boss_list.clear()
-                player.__init__(MAP_WIDTH // 2, MAP_HEIGHT // 2)
-                cam_x = max(0, min(player.rect.centerx - WIDTH//2, MAP_WIDTH  - WIDTH))
-                cam_y = max(0, min(player.rect.centery  - HEIGHT//2, MAP_HEIGHT - HEIGHT))
-
-            continue
-
-        if not main_menu and not game_over and not upgrade_active:
-            # on délègue au helper
-            if handle_scream_input(event, player, enemy_list, mages, cam_x, cam_y):
-                pass
-                 # ou juste passer à la suite
-        if upgrade_active and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for key, rect in zip(upgrade_menu.choices, upgrade_menu.rects):
-                if rect.collidepoint(event.pos):
-                    # applique tout de suite l'amélioration
-                    player.apply_upgrade(key)
-                    # on coupe le menu et on force le fade-out
-                    upgrade_active = False
-                    upgrade_fade   = fade_in_dur    # démarrer le fondu sortant
-                    upgrade_resume_timer = 0.7
-                    break
-
-        if upgrade_resume_timer > 0:
-            upgrade_resume_timer -= dt
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle()
+
+            # au clic “Jouer” en menu principal, on affiche d’abord l’écran “touches” en fondu
+            if main_menu:
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 \
+                        and play_button_rect.collidepoint(event.pos):
+                    # 1) run the 7-image slideshow (skip on any key/mouse)
+                    show_story_slideshow(screen, clock)
+
+                    # 2) then show the controls screen (skip on any key/mouse)
+                    show_touches_screen(screen, clock)
+
+                    # 3) finally actually start the game
+                    main_menu    = False
+                    # en pipeline, le worker ne chronomètre pas (profileur partagé)
+                    sim          = Simulation(seed=seed, stress=stress,
+                                              profiler=None if pipeline else profiler)
+                    if record:
+                        recorder = record_inputs(sim, record)
+                    timestep     = FixedTimestep()
+                    upgrade_fade = 0.0
+                    if pipeline:
+                        worker = Pipeline(sim, timestep, art.magnet)
+                        snap   = capture(sim, 1.0, art.magnet)
+                continue
+
+            if driver:
+                continue   # rejeu : les actions viennent de l'enregistrement
+            if sim.upgrade_choices:
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    for key, rect in zip(upgrade_menu.choices, upgrade_menu.rects):
+                        if rect.collidepoint(event.pos):
+                            # applique tout de suite l'amélioration
+                            sim.choose_upgrade(key)
+                            # on coupe le menu et on force le fade-out
+                            upgrade_fade = fade_in_dur    # démarrer le fondu sortant
+                            break
+            elif not sim.game_over:
+                # via la simulation : le cri est enregistré avec les entrées
+                target = scream_target(event, sim.camera.x, sim.camera.y)
+                if target:
+                    sim.scream(target)
 
         if main_menu:
-            screen.blit(main_menu_img, (0,0))
+            screen.blit(art.main_menu, (0,0))
             pygame.display.flip()
             continue
 
-        # Caméra
-        cam_x = max(0, min(player.rect.centerx - WIDTH//2, MAP_WIDTH  - WIDTH))
-        cam_y = max(0, min(player.rect.centery  - HEIGHT//2, MAP_HEIGHT - HEIGHT))
-
-        # Boucle de jeu
-        if upgrade_resume_timer <= 0 and not upgrade_active and not game_over:
-            keys = pygame.key.get_pressed()
-            player.update(keys, dt)
-
-            # Auto-attack (inclut boss)
-            if player.auto_attack and (enemy_list or mages or boss_list):
-                targets = enemy_list + mages + boss_list
-                t = min(targets, key=lambda e: math.hypot(e.rect.centerx-player.rect.centerx,
-                                                          e.rect.centery-player.rect.centery))
-                player.attack(targets, t.rect.center)
-                if t in boss_list:
-                    hit_flash_timer   = HIT_FLASH_DURATION
-                    hit_flash_target  = b       # on conserve la référence à l’objet Boss
-
-            # Clic pour attaquer
-            elif pygame.mouse.get_pressed()[0]:
-                mx, my = pygame.mouse.get_pos()
-                world_pos = (mx+cam_x, my+cam_y)
-                player.attack(enemy_list + mages + boss_list, world_pos)
-                for b in boss_list:
-                    if b.rect.collidepoint(world_pos):
-                        hit_flash_timer   = HIT_FLASH_DURATION
-                        hit_flash_target  = b       # on conserve la référence à l’objet Boss
-
-            # Spawn gobelins/mages
-            game_time    = (pygame.time.get_ticks() - start_ticks) / 1000
-            elite_chance = min(0.1, player.level * 0.005)
-            rare_chance  = min(0.3, player.level * 0.015)
-            time_mod     = 1 + game_time / 60
-            level_mod    = max(0.2, 1 - player.level * 0.01)
-            interval     = max(0.05, base_spawn_interval * level_mod / time_mod)
-            spawn_timer += dt
-            if spawn_timer >= interval:
-                spawn_timer = 0.0
-            # — Cap dynamique lié au niveau —
-                current_enemies = len(enemy_list) + len(mages) + len(boss_list)
-                cap = BASE_MAX_ENEMIES + PER_LEVEL_ENEMIES * (player.level - 1)
-                if current_enemies >= cap:
-                    continue   # on saute ce spawn-ci
-
-
-
-                edge = random.choice(['top','bottom','left','right'])
-                if edge == 'top':
-                    x = random.randint(int(cam_x), int(cam_x + WIDTH));  y = cam_y - 50
-                elif edge == 'bottom':
-                    x = random.randint(int(cam_x), int(cam_x + WIDTH));  y = cam_y + HEIGHT + 50
-                elif edge == 'left':
-                    x = cam_x - 50; y = random.randint(int(cam_y), int(cam_y + HEIGHT))
-                else:
-                    x = cam_x + WIDTH + 50; y = random.randint(int(cam_y), int(cam_y + HEIGHT))
-                if random.random() < mage_spawn_chance:
-                    mages.append(GoblinMage(x, y))
+        # Boucle de jeu : autant de pas fixes que le temps écoulé en demande
+        inputs = read_frame_input(sim.camera)
+        profiler.lap("input")
+        if worker:
+            # le worker simule N+1 pendant qu'on dessine N (snapshot figé)
+            worker.submit(dt, inputs)
+            draw_snapshot(screen, snap, art, profiler)
+        else:
+            steps = timestep.advance(dt)
+            for i in range(steps):
+                if i == steps - 1:
+                    sim.remember_positions()
+                if driver:
+                    driver.step(sim)   # pas suivant de la partie enregistrée
                 else:
-                    r = random.random()
-                    tier = 'elite' if r < elite_chance else 'rare' if r < elite_chance+rare_chance else 'normal'
-                    enemy_list.append(Enemy(x, y, speed=60, tier=tier, player_level=player.level))
-
-            # Update gobelins/mages
-            for e in enemy_list: e.update(player.rect.center, dt)
-            for m in mages:      m.update(player, dt, cam_x, cam_y)
-
-            # Update & attaque bosses
-            for b in boss_list:
-                b.update(player.rect.center, dt)
-                dx = b.rect.centerx - player.rect.centerx
-                dy = b.rect.centery  - player.rect.centery
-                if math.hypot(dx, dy) <= b.attack_range and b.attack_timer <= 0:
-                    player.take_damage(b.damage)
-                    b.attack_timer = b.attack_cooldown
-                    screen_flash_timer = FLASH_DURATION
-
-            for b in boss_list[:]:
-                if b.hp <= 0:
-                    xp_orbs.append(XPOrb(b.rect.centerx, b.rect.centery, b.xp_value))
-                    boss_list.remove(b)
-                    if hit_flash_target is b:
-                        hit_flash_target = None
-
-
-            # Separation
-            all_entities = enemy_list+mages
-            for i in range(len(all_entities)):
-                e1=all_entities[i]
-                for e2 in all_entities[i+1:]:
-                    dx=e1.rect.centerx-e2.rect.centerx; dy=e1.rect.centery-e2.rect.centery
-                    dist=math.hypot(dx,dy); md=(e1.rect.width+e2.rect.width)/2
-                    if 0<dist<md:
-                        nx,ny=dx/dist,dy/dist; overlap=md-dist
-                        e1.rect.x+=nx*overlap*0.5; e1.rect.y+=ny*overlap*0.5
-                        e2.rect.x-=nx*overlap*0.5; e2.rect.y-=ny*overlap*0.5
-
-            # Collisions & kills
-            inset=50
-            for e in enemy_list[:]:
-                hb=player.rect.inflate(-inset,-inset)
-                if e.rect.colliderect(hb) and e.attack_timer<=0:
-                    player.take_damage(e.damage); e.attack_timer=e.attack_cooldown; e.pause_timer=0.5; screen_flash_timer=FLASH_DURATION
-                if e.hp<=0:
-                    kills+=1; xp_orbs.append(XPOrb(e.rect.centerx,e.rect.centery,e.xp_value)); enemy_list.remove(e)
-                elif math.hypot(e.rect.centerx-player.rect.centerx,e.rect.centery-player.rect.centery)>max(WIDTH,HEIGHT)*2:
-                    enemy_list.remove(e)
-
-            # XP orbs & magnet
-            for orb in xp_orbs:
-                if player.magnet_active:
-                    orb.attract_radius=float('inf'); f=3+(player.magnet_duration-player.magnet_timer)/player.magnet_duration; orb.attract_speed=orb.base_attract_speed*f
-                else:
-                    orb.attract_radius=orb.base_attract_radius; orb.attract_speed=orb.base_attract_speed
-                orb.update(dt,player.rect.center)
-            for orb in xp_orbs[:]:
-                if orb.rect.colliderect(player.rect):
-                    orb.pickup_sound.play(); player.gain_xp(orb.value); xp_orbs.remove(orb)
-
-            if current_bonus is None:
-                btype=random.choice(BONUS_TYPES); bx,by=random.choice(bonus_spawn_points)
-                current_bonus=(btype,pygame.Rect(bx,by,BONUS_SIZE,BONUS_SIZE))
-            else:
-                _,br=current_bonus
-                if player.rect.colliderect(br):
-                    player.apply_bonus(_); current_bonus=None
-
-            for m in mages:
-                for fb in m.projectiles[:]:
-                    if fb.rect.colliderect(player.rect):
-                        player.take_damage(2); m.projectiles.remove(fb); screen_flash_timer=FLASH_DURATION
-            for m in mages[:]:
-                if m.hp<=0:
-                    kills+=1; xp_orbs.append(XPOrb(m.rect.centerx,m.rect.centery,m.xp_value)); mages.remove(m)
-
-            game_time=(pygame.time.get_ticks()-start_ticks)/1000
-            if player.hp<=0:
-                game_over=True; survival_time=game_time
-
+                    sim.step(timestep.dt, inputs)
  # --- DESSIN ---
-        draw_tiled_background(screen, cam_x, cam_y, bg_img, bg_w, bg_h)
-        for orb in xp_orbs: orb.draw(screen, cam_x, cam_y)
-        if current_bonus:
-            _, br = current_bonus
-            screen.blit(magnet_img, (br.x - cam_x, br.y - cam_y))
-        for e in enemy_list:
-            e.draw(screen, cam_x, cam_y)
-            ex, ey = e.rect.x - cam_x, e.rect.y - cam_y
-            bw, bh = e.rect.width, 5
-            pygame.draw.rect(screen, (100,0,0), (ex, ey-bh-2, bw, bh))
-            pygame.draw.rect(screen, (0,200,0), (ex, ey-bh-2, int(bw*(e.hp/e.max_hp)), bh))
-        for m in mages:
-            m.draw(screen, cam_x, cam_y)
-
-        # Dessin des bosses
-        for b in boss_list:
-            b.draw(screen, cam_x, cam_y)
-            # barre de vie
-            hp_w, hp_h = b.rect.width, 5
-            ex, ey = b.rect.x - cam_x, b.rect.y - cam_y - 10
-            pygame.draw.rect(screen, (100,0,0), (ex, ey, hp_w, hp_h))
-            pygame.draw.rect(screen, (200,0,0), (ex, ey, int(hp_w*(b.hp/b.max_hp)), hp_h))
-
-        # Flash blanc localisé sur le boss touché
-# Flash blanc localisé sur le boss touché, en respectant la forme du sprite
-# FLASH BLANC LOCALISÉ SUR LE BOSS TOUCHÉ
-        if hit_flash_timer > 0 and hit_flash_target:
-            a = int(255 * (hit_flash_timer / HIT_FLASH_DURATION))
-            # copie du sprite (avec son canal alpha)
-            flash_img = hit_flash_target.image.copy()
-            # multiplie les pixels opaques par du blanc semi-transparent
-            flash_img.fill((255,255,255,a), special_flags=pygame.BLEND_RGBA_MULT)
-            # blit à la position du boss
-            screen.blit(flash_img,
-                        (hit_flash_target.rect.x - cam_x,
-                        hit_flash_target.rect.y - cam_y))
-
-        player.draw(screen, cam_x, cam_y)
-        draw_bottom_overlay(screen, bottom_overlay, y_offset=overlay_y_offset, zoom=overlay_zoom)
-
-        globe_x,globe_y,radius = 150,HEIGHT-150,100
-        draw_health_globe(screen,globe_x,globe_y,radius,max(player.hp,0)/player.max_hp)
-
-        # Dash bar
-        bw,bh=40,9; px=player.rect.centerx-cam_x; py=player.rect.bottom-cam_y+6
-        pygame.draw.rect(screen,(50,50,50),(px-bw//2,py,bw,bh))
-        ratio=1.0 if player.dash_timer<=0 else max(0,1-player.dash_timer/player.dash_cooldown)
-        pygame.draw.rect(screen,(0,200,200),(px-bw//2,py,int(bw*ratio),bh))
-        pygame.draw.rect(screen,(255,255,255),(px-bw//2,py,bw,bh),1)
-
-        # XP bar & level
-        xr=player.xp/player.next_level_xp; bar_w,bar_h=300,8; bx=(WIDTH-bar_w)//2; by=20
-        pygame.draw.rect(screen,(50,50,50),(bx,by,bar_w,bar_h))
-        pygame.draw.rect(screen,(200,200,0),(bx,by,int(bar_w*xr),bar_h))
-        pygame.draw.rect(screen,(255,255,255),(bx,by,bar_w,bar_h),2)
-        FONT_HUD = pygame.freetype.Font(
-            resource_path("assets/fonts/Cinzel/static/Cinzel-Regular.ttf"),
-            24
-        )
-
-        ts,tr=FONT_HUD.render(f"Level: {player.level}",fgcolor=(255,255,255))
-        tr.midtop=(WIDTH//2,by+bar_h+5); screen.blit(ts,tr)
-        draw_scream_cooldown(screen, player)
+            snap = draw_world(screen, sim, art, timestep.alpha)
+
+        upgrade_active = bool(snap.upgrade_choices)
+        if upgrade_active and upgrade_menu.choices is not snap.upgrade_choices:
+            # Level up → menu
+            upgrade_menu.open(snap.upgrade_choices)
+            upgrade_fade = 0.0
 
         if upgrade_active or upgrade_fade > 0:
             # on augmente fade si on vient d'ouvrir, sinon on diminue
@@ -762,21 +645,22 @@ def main():
             alpha = int(255 * (upgrade_fade / fade_in_dur))
             # ne dessine les cartes qu'en phase de fade-in (upgrade_active=True)
             upgrade_menu.draw(screen, alpha, show_cards)
-        if game_over:
-            screen.fill((0,0,0))
-            f1=pygame.font.Font(None,72); f2=pygame.font.Font(None,48)
-            lines=["GAME OVER",f"Survived: {survival_time:.1f}s",f"Level:    {player.level}",f"Kills:    {kills}"]
-            for i,t in enumerate(lines):
-                fn=f1 if i==0 else f2; surf=fn.render(t,True,(255,255,255))
-                screen.blit(surf,((WIDTH-surf.get_width())//2,150+i*80))
-
-        if not game_over and screen_flash_timer > 0:
-            a = int(255 * 0.5 * (screen_flash_timer / FLASH_DURATION))
-            fs = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            fs.fill((255, 0, 0, a))
-            screen.blit(fs, (0, 0))
+        if snap.game_over:
+            draw_game_over(screen, snap)
+
+        draw_veil(screen, (255, 0, 0), snap.flash)
+        profiler.lap("ui")
 
+        profiler.draw(screen)
         pygame.display.flip()
+        profiler.lap("flip")
+        shown = snap
+        if worker:
+            # attente du worker : temps de simulation non recouvert par le rendu
+            snap, steps = worker.collect()
+            profiler.lap("sim")
+        profiler.end_frame(steps=steps, drawn=shown.drawn, culled=shown.culled,
+                           **dict(shown.counts))
 
 if __name__ == "__main__":
     main()
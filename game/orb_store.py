@@ -0,0 +1,152 @@
+# orb_store.py
+"""
+Stockage « struct-of-arrays » des orbes d'XP.
+
+Positions (flottantes), tailles et valeurs vivent dans des tableaux NumPy :
+l'attraction (rampe de l'aimant comprise) est un seul pas vectorisé, et le
+ramassage un seul test masqué dont la somme part en un appel à
+Player.gain_xp. Les XPOrb restent des vues : leur valeur est lue/écrite
+dans le store (voir `xp_orb.XPOrb.value`) et seuls les rects des orbes qui bougent sont
+recopiés après chaque pas.
+"""
+import numpy as np
+
+
+class OrbStore:
+    COLUMNS = ("x", "y", "w", "h", "value")
+
+    def __init__(self, capacity=256):
+        self.orbs    = []
+        self.columns = {c: np.zeros(capacity) for c in self.COLUMNS}
+        # dernières positions entières écrites dans les rects
+        self._rx = np.zeros(capacity, dtype=np.int64)
+        self._ry = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.orbs)
+
+    def __iter__(self):
+        return iter(self.orbs)
+
+    def _grow(self):
+        cap = len(self._rx) * 2
+        for c, arr in self.columns.items():
+            new = np.zeros(cap)
+            new[:len(arr)] = arr
+            self.columns[c] = new
+        for name in ("_rx", "_ry"):
+            old = getattr(self, name)
+            new = np.zeros(cap, dtype=np.int64)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, orb):
+        """Recopie l'orbe dans les tableaux et la rattache."""
+        i = len(self.orbs)
+        if i == len(self._rx):
+            self._grow()
+        col, r = self.columns, orb.rect
+        col["x"][i], col["y"][i] = r.x, r.y
+        col["w"][i], col["h"][i] = r.width, r.height
+        col["value"][i] = orb.value
+        self._rx[i], self._ry[i] = r.x, r.y
+        orb._store, orb._slot = self, i
+        self.orbs.append(orb)
+        return orb
+
+    def _detach(self, orb):
+        value = orb.value
+        orb._store, orb._slot = None, None
+        orb.value = value
+
+    def compact(self, keep, pool=None):
+        """
+        Garde (dans l'ordre) les orbes pour lesquelles keep(orb) est vrai,
+        détache et rend les autres à `pool`. Renvoie le nombre de retraits.
+        """
+        mask = np.fromiter((keep(o) for o in self.orbs), bool, len(self.orbs))
+        return self._remove_where(~mask, pool)
+
+    def _remove_where(self, dead, pool=None):
+        n = len(self.orbs)
+        if not dead.any():
+            return 0
+        # détache d'abord (les valeurs sont encore à leur place)…
+        kept = []
+        for orb, is_dead in zip(self.orbs, dead.tolist()):
+            if is_dead:
+                self._detach(orb)
+                if pool is not None:
+                    pool.release(orb)
+            else:
+                orb._slot = len(kept)
+                kept.append(orb)
+        # …puis tasse les tableaux dans le même ordre que la liste
+        alive = ~dead
+        k = len(kept)
+        for arr in list(self.columns.values()) + [self._rx, self._ry]:
+            arr[:k] = arr[:n][alive]
+        self.orbs[:] = kept
+        return n - k
+
+    def clear(self, pool=None):
+        self._remove_where(np.ones(len(self.orbs), bool), pool)
+
+    def _resync(self):
+        """Reprend les rects modifiés de l'extérieur (fusion, tests…)."""
+        n, col = len(self.orbs), self.columns
+        rx = np.fromiter((o.rect.x for o in self.orbs), np.int64, n)
+        ry = np.fromiter((o.rect.y for o in self.orbs), np.int64, n)
+        moved = (rx != self._rx[:n]) | (ry != self._ry[:n])
+        if moved.any():
+            col["x"][:n][moved] = rx[moved]
+            col["y"][:n][moved] = ry[moved]
+            col["w"][:n] = np.fromiter((o.rect.width  for o in self.orbs), float, n)
+            col["h"][:n] = np.fromiter((o.rect.height for o in self.orbs), float, n)
+            self._rx[:n], self._ry[:n] = rx, ry
+
+    def step(self, player_pos, dt, attract_radius, attract_speed):
+        """Équivalent vectorisé d'XPOrb.update pour toutes les orbes."""
+        n = len(self.orbs)
+        if n == 0:
+            return
+        self._resync()
+        col = self.columns
+        x, y = col["x"][:n], col["y"][:n]
+        dx = player_pos[0] - (x + col["w"][:n] // 2)
+        dy = player_pos[1] - (y + col["h"][:n] // 2)
+        dist = np.hypot(dx, dy)
+        moving = (dist > 0) & (dist < attract_radius)
+        if not moving.any():
+            return
+        step = attract_speed * dt / dist[moving]
+        x[moving] += dx[moving] * step
+        y[moving] += dy[moving] * step
+
+        # seuls les rects des orbes en mouvement sont recopiés
+        idx = np.flatnonzero(moving)
+        rx = np.rint(x[idx]).astype(np.int64)
+        ry = np.rint(y[idx]).astype(np.int64)
+        self._rx[idx], self._ry[idx] = rx, ry
+        orbs = self.orbs
+        for i, ox, oy in zip(idx.tolist(), rx.tolist(), ry.tolist()):
+            orbs[i].rect.topleft = (ox, oy)
+
+    def collect(self, rect, pool=None):
+        """
+        Retire les orbes qui touchent `rect` (test masqué, comme colliderect)
+        et renvoie la somme de leurs valeurs.
+        """
+        n = len(self.orbs)
+        if n == 0:
+            return 0
+        self._resync()
+        col = self.columns
+        x, y = col["x"][:n], col["y"][:n]
+        hit = ((x < rect.right) & (x + col["w"][:n] > rect.left) &
+               (y < rect.bottom) & (y + col["h"][:n] > rect.top))
+        if not hit.any():
+            return 0
+        total = float(col["value"][:n][hit].sum())
+        self._remove_where(hit, pool)
+        return total
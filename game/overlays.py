@@ -0,0 +1,95 @@
+# overlays.py
+"""
+Couches plein écran réutilisées.
+
+- Voiles (flash rouge des dégâts, assombrissement du menu d'upgrade) : une
+  surface opaque par (taille, couleur), allouée une fois puis dessinée avec
+  un alpha de surface (`set_alpha`) au lieu d'une surface SRCALPHA neuve à
+  chaque frame.
+- HudLayer : le HUD fixe à l'écran composé dans une seule couche. Le décor
+  statique est pré-rendu une fois ; chaque élément dynamique n'est redessiné
+  que quand sa valeur change (drapeau « sale »), et une frame ordinaire se
+  réduit à un blit.
+"""
+import pygame
+
+_VEILS = {}   # (taille, couleur) -> surface opaque
+
+
+def get_veil(size, color):
+    key = (tuple(size), tuple(color[:3]))
+    veil = _VEILS.get(key)
+    if veil is None:
+        veil = _VEILS[key] = pygame.Surface(key[0])
+        veil.fill(key[1])
+    return veil
+
+
+def draw_veil(surface, color, alpha):
+    """Recouvre toute `surface` de `color` à l'opacité `alpha` (0-255)."""
+    alpha = min(int(alpha), 255)
+    if alpha <= 0:
+        return
+    veil = get_veil(surface.get_size(), color)
+    veil.set_alpha(alpha)
+    surface.blit(veil, (0, 0))
+
+
+def clear_cache():
+    _VEILS.clear()
+
+
+class HudLayer:
+    """
+    Couche SRCALPHA de la taille de l'écran : `base` (décor statique) plus
+    des éléments nommés. `draw(surface, value)` d'un élément dessine sur la
+    couche et renvoie le rect touché (ou None) ; à chaque changement de
+    valeur, ce rect est d'abord restauré depuis `base` (les éléments ne
+    doivent donc pas se chevaucher).
+    """
+    def __init__(self, size):
+        self.size   = tuple(size)
+        self.base   = pygame.Surface(self.size, pygame.SRCALPHA)
+        self.layer  = pygame.Surface(self.size, pygame.SRCALPHA)
+        self.pieces = {}   # nom -> [draw, valeur, rect, sale]
+        self.base_dirty = True
+
+    def add(self, name, draw):
+        self.pieces[name] = [draw, None, None, True]
+
+    def set(self, name, value):
+        piece = self.pieces[name]
+        if piece[1] != value:
+            piece[1] = value
+            piece[3] = True
+
+    def invalidate(self):
+        """À appeler après avoir redessiné `base`."""
+        self.base_dirty = True
+
+    def _restore(self, rect):
+        # blit sur des pixels vidés : copie exacte de la base
+        self.layer.fill((0, 0, 0, 0), rect)
+        self.layer.blit(self.base, rect, area=rect)
+
+    def compose(self):
+        """Redessine les éléments sales. Renvoie le nombre redessinés."""
+        pieces = self.pieces.values()
+        if self.base_dirty:
+            self.layer.fill((0, 0, 0, 0))
+            self.layer.blit(self.base, (0, 0))
+            for piece in pieces:
+                piece[2], piece[3] = None, True
+            self.base_dirty = False
+        dirty = [p for p in pieces if p[3]]
+        for piece in dirty:
+            if piece[2]:
+                self._restore(piece[2])
+        for piece in dirty:
+            piece[2] = piece[0](self.layer, piece[1])
+            piece[3] = False
+        return len(dirty)
+
+    def draw(self, surface):
+        self.compose()
+        surface.blit(self.layer, (0, 0))
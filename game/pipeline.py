@@ -0,0 +1,73 @@
+# pipeline.py
+"""
+Mode pipeline (optionnel, `--pipeline`) : simulation sur un thread de
+travail.
+
+Pendant que le thread principal dessine le snapshot de la frame N (les
+blits et `display.flip` relâchent le GIL), le worker avance la simulation
+et capture le snapshot de la frame N+1. Une seule frame est en vol :
+`submit` puis `collect` à chaque frame, la latence reste bornée à une
+frame. Entre `collect` et le `submit` suivant, le worker est à l'arrêt et
+le thread principal peut modifier la simulation (clics du menu, cri…).
+"""
+import queue
+import threading
+
+from .snapshot import capture
+
+
+class Pipeline:
+    def __init__(self, sim, timestep, bonus_image=None):
+        self.sim         = sim
+        self.timestep    = timestep
+        self.bonus_image = bonus_image
+        self.busy        = False
+        self._jobs    = queue.Queue(maxsize=1)
+        self._results = queue.Queue(maxsize=1)
+        self._thread  = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            try:
+                self._results.put((self._advance(*job), None))
+            except Exception as exc:   # relancée dans le thread principal
+                self._results.put((None, exc))
+
+    def _advance(self, frame_dt, inputs):
+        """Pas fixes de la frame puis snapshot : (snapshot, nombre de pas)."""
+        sim, timestep = self.sim, self.timestep
+        steps = timestep.advance(frame_dt)
+        for i in range(steps):
+            if i == steps - 1:
+                sim.remember_positions()
+            sim.step(timestep.dt, inputs)
+        return capture(sim, timestep.alpha, self.bonus_image), steps
+
+    def submit(self, frame_dt, inputs):
+        """Lance la frame suivante sur le worker (une seule à la fois)."""
+        if self.busy:
+            raise RuntimeError("une frame est déjà en cours de simulation")
+        self.busy = True
+        self._jobs.put((frame_dt, inputs))
+
+    def collect(self):
+        """Attend la frame lancée : (snapshot, nombre de pas)."""
+        if not self.busy:
+            raise RuntimeError("aucune frame en cours de simulation")
+        result, exc = self._results.get()
+        self.busy = False
+        if exc is not None:
+            raise exc
+        return result
+
+    def close(self):
+        try:
+            if self.busy:
+                self.collect()
+        finally:
+            self._jobs.put(None)
+            self._thread.join()
@@ -4,20 +4,18 @@ import pygame
 import math
 import os
 from .settings import MAP_WIDTH, MAP_HEIGHT
-from .utils import resource_path
+from .sprites import load_image, get_sprite, get_rotated, get_cone
+from .sounds import get_sound
+from .combat import centers_and_radii, cone_hits
+
+SLASH = "assets/slash.png"
 
 class Player:
     def __init__(self, x, y):
-
-        if not pygame.display.get_init():
-            pygame.display.init()
-            pygame.display.set_mode((1,1))
-
-        if pygame.mixer.get_init() is None:
-            pygame.mixer.init()
-        self.attack_sound  = pygame.mixer.Sound(resource_path("fx/attack.mp3"))
-        self.levelup_sound = pygame.mixer.Sound(resource_path("fx/levelup.mp3"))
-        self.scream_sound  = pygame.mixer.Sound(resource_path("fx/eagle_scream.mp3"))
+        # sans fenêtre ni mixer (simulation headless), sprites bruts et sons muets
+        self.attack_sound  = get_sound("fx/attack.mp3")
+        self.levelup_sound = get_sound("fx/levelup.mp3")
+        self.scream_sound  = get_sound("fx/eagle_scream.mp3")
 
 
         # — Sprites & animation —
@@ -26,36 +24,33 @@ class Player:
 
         # droite (3 frames)
         self.walk_frames_right = []
+        self.walk_frames_left  = []
         for i in range(1, 4):
-            img = pygame.image.load(resource_path(f"assets/knight{i}.png")).convert_alpha()
-            ow, oh = img.get_size()
-            scale = horz_height / oh
-            nw = int(ow * scale)
-            self.walk_frames_right.append(pygame.transform.scale(img, (nw, horz_height)))
-        self.walk_frames_left = [pygame.transform.flip(f, True, False) for f in self.walk_frames_right]
+            asset = f"assets/knight{i}.png"
+            ow, oh = load_image(asset).get_size()
+            size = (int(ow * (horz_height / oh)), horz_height)
+            self.walk_frames_right.append(get_sprite(asset, size=size))
+            self.walk_frames_left.append(get_sprite(asset, size=size, flip=True))
 
         # haut (2 frames)
         self.up_frames = []
         for i in range(1, 3):
-            img = pygame.image.load(resource_path(f"assets/knight_up{i}.png")).convert_alpha()
-            ow, oh = img.get_size()
-            scale = vert_height / oh
-            nw = int(ow * scale)
-            self.up_frames.append(pygame.transform.scale(img, (nw, vert_height)))
+            asset = f"assets/knight_up{i}.png"
+            ow, oh = load_image(asset).get_size()
+            self.up_frames.append(get_sprite(asset, size=(int(ow * (vert_height / oh)), vert_height)))
 
         # bas (2 frames)
         self.down_frames = []
         for i in range(1, 3):
-            img = pygame.image.load(resource_path(f"assets/knightdown_{i}.png")).convert_alpha()
-
-            ow, oh = img.get_size()
-            scale = vert_height / oh
-            nw = int(ow * scale)
-            self.down_frames.append(pygame.transform.scale(img, (nw, vert_height)))
+            asset = f"assets/knightdown_{i}.png"
+            ow, oh = load_image(asset).get_size()
+            self.down_frames.append(get_sprite(asset, size=(int(ow * (vert_height / oh)), vert_height)))
 
         # image initiale & hitbox
         self.image = self.down_frames[0]
         self.rect  = self.image.get_rect(center=(x, y))
+        # position flottante : les petits pas (sim à 120 Hz) ne sont pas arrondis à 0
+        self.fx, self.fy = self.rect.topleft
 
         # animation
         self.anim_index    = 0
@@ -82,10 +77,7 @@ class Player:
         self.attack_timer_visual = 0.0
         self.last_attack_angle   = 0
 
-        # slash visuel
-        raw = pygame.image.load(resource_path("assets/slash.png")).convert_alpha()
-
-        self.raw_slash   = raw
+        # slash visuel (pivots mis en cache, voir sprites.get_rotated)
         self.slash_scale = 0.15
 
         # XP & progression
@@ -156,14 +148,16 @@ class Player:
             if self.scream_cone_timer <= 0:
                 self.show_scream_cone = False
 
+        # rect déplacé de l'extérieur → on reprend sa position
+        if self.rect.topleft != (round(self.fx), round(self.fy)):
+            self.fx, self.fy = self.rect.topleft
+
         # 2) dash en cours
         if self.dash_time_left > 0:
             self.dash_time_left -= dt
-            self.rect.x += self.dash_dir[0] * self.dash_speed * dt
-            self.rect.y += self.dash_dir[1] * self.dash_speed * dt
-            # clamp X et Y
-            self.rect.x = max(0, min(self.rect.x, MAP_WIDTH  - self.rect.width))
-            self.rect.y = max(0, min(self.rect.y, MAP_HEIGHT - self.rect.height))
+            self.fx += self.dash_dir[0] * self.dash_speed * dt
+            self.fy += self.dash_dir[1] * self.dash_speed * dt
+            self._clamp()
             return
 
         # 3) lecture des touches
@@ -229,12 +223,15 @@ class Player:
         mag = math.hypot(dx, dy)
         if mag > 0:
             nx, ny = dx / mag, dy / mag
-            self.rect.x += nx * self.speed * dt
-            self.rect.y += ny * self.speed * dt
+            self.fx += nx * self.speed * dt
+            self.fy += ny * self.speed * dt
+        self._clamp()
 
-        # clamp X et Y dans la map
-        self.rect.x = max(0, min(self.rect.x, MAP_WIDTH  - self.rect.width))
-        self.rect.y = max(0, min(self.rect.y, MAP_HEIGHT - self.rect.height))
+    def _clamp(self):
+        """Borne la position flottante à la map et la recopie dans le rect."""
+        self.fx = max(0, min(self.fx, MAP_WIDTH  - self.rect.width))
+        self.fy = max(0, min(self.fy, MAP_HEIGHT - self.rect.height))
+        self.rect.topleft = (round(self.fx), round(self.fy))
 
     def can_attack(self):
         return self.attack_timer >= self.attack_cooldown
@@ -254,26 +251,21 @@ class Player:
         angle = math.degrees(math.atan2(-dym, dxm)) % 360
         self.last_attack_angle = angle
 
-        half = self.attack_angle / 2
-        for e in enemies:
-            # vecteur joueur→ennemi
-            dxe = e.rect.centerx - self.rect.centerx
-            dye = e.rect.centery  - self.rect.centery
-            dist = math.hypot(dxe, dye)
-            r = e.rect.width / 2
-            # si dans la portée
-            if dist - r <= self.attack_range:
-                # calcule l’angle joueur→ennemi
-                a2e = math.degrees(math.atan2(-dye, dxe)) % 360
-                delta = abs((angle - a2e + 180) % 360 - 180)
-                if delta <= half:
-                    # si l’ennemi implémente take_damage(), on l’appelle
-                    if hasattr(e, "take_damage"):
-                        e.take_damage(self.attack_damage)
-                    else:
-                        # sinon on retire directement les PV et on déclenche le flash
-                        e.hp -= self.attack_damage
-                        e.flash_timer = getattr(e, "flash_duration", 0)
+        if not enemies:
+            return
+        # test de touche vectorisé : portée (moins le rayon) + écart angulaire
+        xs, ys, rs = centers_and_radii(enemies)
+        hits = cone_hits(self.rect.centerx, self.rect.centery, angle,
+                         self.attack_angle / 2, self.attack_range, xs, ys, rs)
+        for i in hits:
+            e = enemies[i]
+            # si l’ennemi implémente take_damage(), on l’appelle
+            if hasattr(e, "take_damage"):
+                e.take_damage(self.attack_damage)
+            else:
+                # sinon on retire directement les PV et on déclenche le flash
+                e.hp -= self.attack_damage
+                e.flash_timer = getattr(e, "flash_duration", 0)
 
     def scream(self, normal_enemies, mages, mouse_pos):
         """Cri en cône de 45° vers la souris : slow + dégâts."""
@@ -291,17 +283,16 @@ class Player:
         self.scream_angle = center_angle
         half_cone = 45 / 2
 
-        for e in normal_enemies + mages:
-            dx = e.rect.centerx - self.rect.centerx
-            dy = e.rect.centery  - self.rect.centery
-            dist = math.hypot(dx, dy)
-            if dist > self.scream_range:
-                continue
-            angle_to_enemy = math.degrees(math.atan2(-dy, dx)) % 360
-            delta = abs((center_angle - angle_to_enemy + 180) % 360 - 180)
-            if delta <= half_cone:
-                e.hp -= self.scream_damage
-                e.slow_timer = self.scream_slow_duration
+        targets = normal_enemies + mages
+        if not targets:
+            return
+        # même test en cône, sans le rayon des cibles
+        xs, ys, _ = centers_and_radii(targets)
+        for i in cone_hits(self.rect.centerx, self.rect.centery, center_angle,
+                           half_cone, self.scream_range, xs, ys):
+            e = targets[i]
+            e.hp -= self.scream_damage
+            e.slow_timer = self.scream_slow_duration
 
     def take_damage(self, amount):
         self.hp = max(self.hp - amount, 0)
@@ -314,41 +305,42 @@ class Player:
             self.xp -= self.next_level_xp
             self.level_up()
 
+    # progression par niveau (voir game/sweep.py pour les équilibrer)
+    XP_GROWTH    = 1.18   # facteur d'XP requise au niveau suivant
+    LEVEL_DAMAGE = 1.2    # dégâts gagnés par niveau
+
     def level_up(self):
         self.level += 1
-        self.next_level_xp = int(self.next_level_xp * 1.18)
+        self.next_level_xp = int(self.next_level_xp * self.XP_GROWTH)
         self.new_level     = True
         self.levelup_sound.play()
-        self.attack_damage += 1.2
+        self.attack_damage += self.LEVEL_DAMAGE
 
     # pool d’améliorations
     UPGRADE_KEYS = [
         "Strength Boost", "Vitality Surge", "Quick Reflexes",
         "Haste", "Extended Reach", "XP Bonus"
     ]
+    # attr : attribut modifié ; "mult" le multiplie, "flat"/"percent" s'y ajoutent
     UPGRADE_INFO = {
-        "Strength Boost":   {"type":"flat",   "value": 3,  "unit":"Damage"},
-        "Vitality Surge":   {"type":"flat",   "value": 5,    "unit":"Max HP"},
-        "Quick Reflexes":   {"type":"mult",   "value": 0.85,  "unit":"Cooldown"},
-        "Haste":            {"type":"flat",   "value": 30,  "unit":"Speed"},
-        "Extended Reach":   {"type":"flat",   "value": 30,    "unit":"Range"},
-        "XP Bonus":         {"type":"percent","value": 0.25, "unit":"XP"}
+        "Strength Boost":   {"type":"flat",   "value": 3,  "unit":"Damage",   "attr":"attack_damage"},
+        "Vitality Surge":   {"type":"flat",   "value": 5,    "unit":"Max HP", "attr":"max_hp"},
+        "Quick Reflexes":   {"type":"mult",   "value": 0.85,  "unit":"Cooldown", "attr":"attack_cooldown"},
+        "Haste":            {"type":"flat",   "value": 30,  "unit":"Speed",    "attr":"speed"},
+        "Extended Reach":   {"type":"flat",   "value": 30,    "unit":"Range",  "attr":"attack_range"},
+        "XP Bonus":         {"type":"percent","value": 0.25, "unit":"XP",      "attr":"xp_bonus"}
     }
 
     def apply_upgrade(self, key):
-        if key == "Strength Boost":
-            self.attack_damage += 3
-        elif key == "Vitality Surge":
-            self.max_hp += 5
-            self.hp     += 5
-        elif key == "Quick Reflexes":
-            self.attack_cooldown *= 0.85
-        elif key == "Haste":
-            self.speed += 30
-        elif key == "Extended Reach":
-            self.attack_range += 30
-        elif key == "XP Bonus":
-            self.xp_bonus += 0.25
+        info  = self.UPGRADE_INFO[key]
+        attr  = info["attr"]
+        value = info["value"]
+        if info["type"] == "mult":
+            setattr(self, attr, getattr(self, attr) * value)
+        else:
+            setattr(self, attr, getattr(self, attr) + value)
+        if attr == "max_hp":
+            self.hp += value   # la vie gagnée est aussi soignée
 
 
     def apply_bonus(self, bonus_type):
@@ -357,40 +349,35 @@ class Player:
             self.magnet_active = True
             self.magnet_timer  = self.magnet_duration
 
-    def draw(self, surface, cam_x, cam_y):
+    def sprites(self, cam_x, cam_y):
+        """Paires (image, position écran) : cône du cri, corps, slash."""
+        out = []
         # 1) afficher cône
         if self.show_scream_cone:
-            cone_surf = pygame.Surface((surface.get_width(), surface.get_height()), pygame.SRCALPHA)
-            apex_x = self.rect.centerx - cam_x
-            apex_y = self.rect.centery  - cam_y
-            half_cone = 45 / 2
-            length    = self.scream_range
-            angles = [self.scream_angle - half_cone, self.scream_angle + half_cone]
-            points = [(apex_x, apex_y)]
-            for a in angles:
-                rad = math.radians(a)
-                x = apex_x + math.cos(rad) * length
-                y = apex_y - math.sin(rad) * length
-                points.append((x, y))
-            pygame.draw.polygon(cone_surf, (0,0,255,51), points)
-            surface.blit(cone_surf, (0,0))
+            # cône pré-calculé par angle quantifié (plus de surface plein écran)
+            cone, (ax, ay) = get_cone(self.scream_range, 45 / 2, self.scream_angle, (0,0,255,51))
+            out.append((cone, (self.rect.centerx - cam_x - ax, self.rect.centery - cam_y - ay)))
 
         # 2) dessiner joueur
         if   self.direction == 'up':    y_off = self.offset_up
         elif self.direction == 'down':  y_off = self.offset_down
         else:                           y_off = 0
 
-        surface.blit(self.image, (self.rect.x - cam_x,
-                                  self.rect.y - cam_y + y_off))
+        out.append((self.image, (self.rect.x - cam_x,
+                                 self.rect.y - cam_y + y_off)))
 
         # 3) slash si attaque
         if self.attacking:
             rot   = self.last_attack_angle - 225
-            slash = pygame.transform.rotozoom(self.raw_slash, rot, self.slash_scale)
+            slash = get_rotated(SLASH, rot, self.slash_scale)
             sw, sh = slash.get_size()
             rad    = math.radians(self.last_attack_angle)
             dx_off = math.cos(rad) * (self.attack_range * 0.5)
             dy_off = -math.sin(rad) * (self.attack_range * 0.5)
             px     = self.rect.centerx + dx_off - sw//2 - cam_x
             py     = self.rect.centery  + dy_off - sh//2 - cam_y + y_off
-            surface.blit(slash, (px, py))
+            out.append((slash, (px, py)))
+        return out
+
+    def draw(self, surface, cam_x, cam_y):
+        surface.blits(self.sprites(cam_x, cam_y), doreturn=False)
@@ -0,0 +1,62 @@
+# pool.py
+"""
+Réserves d'objets réutilisables (orbes, gobelins).
+
+Une entité morte est rendue à sa réserve au lieu d'être jetée ; le spawn
+suivant la ressort et la réinitialise avec `reset(...)` (mêmes arguments
+que le constructeur). En régime établi, tuer un gobelin ou lâcher une
+orbe n'alloue plus rien.
+
+Les retraits se font en une passe : `compact` garde les survivants en
+place dans la liste (au lieu de `list.remove` dans une copie, O(n) par
+retrait) et rend les autres à la réserve.
+"""
+
+
+class Pool:
+    LIMIT = 4096   # instances libres gardées au plus
+
+    def __init__(self, cls, limit=LIMIT):
+        self.cls   = cls
+        self.limit = limit
+        self.free  = []
+        # compteurs pour les tests / le diagnostic
+        self.created = 0
+        self.reused  = 0
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, *args, **kwargs):
+        """Instance prête à l'emploi : recyclée si possible, neuve sinon."""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        if len(self.free) < self.limit:
+            self.free.append(obj)
+
+    def clear(self):
+        self.free.clear()
+
+
+def compact(items, keep, pool=None):
+    """
+    Retire de `items` (en place, ordre conservé) les éléments pour lesquels
+    keep(x) est faux et les rend à `pool`. Renvoie le nombre de retraits.
+    """
+    kept = 0
+    for x in items:
+        if keep(x):
+            items[kept] = x
+            kept += 1
+        elif pool is not None:
+            pool.release(x)
+    removed = len(items) - kept
+    del items[kept:]
+    return removed
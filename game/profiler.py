@@ -0,0 +1,131 @@
+# profiler.py
+"""
+Profileur de frame par sous-système.
+
+Le temps d'une frame est découpé en tranches consécutives : chaque appel à
+`lap(nom)` attribue à `nom` le temps écoulé depuis l'appel précédent (ou
+depuis `begin_frame`), mesuré avec perf_counter_ns. Une tranche appelée
+plusieurs fois dans la frame (plusieurs pas de simulation) est cumulée.
+
+L'overlay (F3 en jeu) affiche moyenne, p95 et max glissants par tranche
+ainsi que les compteurs d'entités ; chaque frame peut aussi être écrite
+dans un CSV. Désactivé, chaque appel se réduit à un test de booléen.
+"""
+import csv
+from collections import deque
+from time import perf_counter_ns
+
+import pygame
+from .fonts import get_font
+
+# Tranches connues, dans l'ordre de la boucle (colonnes du CSV)
+SECTIONS = (
+    "input", "sim", "player", "spawn", "enemies", "separation",
+    "collisions", "orbs", "background", "entities", "hud", "ui", "flip",
+)
+COUNTS = ("steps", "enemies", "mages", "bosses", "orbs", "fireballs", "drawn", "culled")
+
+
+class FrameProfiler:
+    WINDOW        = 120   # frames gardées pour les stats glissantes
+    REFRESH       = 15    # l'overlay n'est re-rendu que toutes les N frames
+    OVERLAY_COLOR = (0, 0, 0, 170)
+
+    def __init__(self, enabled=False, csv_path=None, window=WINDOW):
+        self.enabled  = enabled
+        self.window   = window
+        self.history  = {name: deque(maxlen=window) for name in SECTIONS + ("total",)}
+        self.frame    = dict.fromkeys(SECTIONS, 0)
+        self.counts   = dict.fromkeys(COUNTS, 0)
+        self.frames   = 0
+        self._t0 = self._t = 0
+        self._overlay = None
+
+        self._csv_file = self._csv = None
+        if csv_path:
+            self._csv_file = open(csv_path, "w", newline="")
+            self._csv = csv.writer(self._csv_file)
+            self._csv.writerow(("frame", "total_ns") + SECTIONS
+                               + tuple("n_" + c for c in COUNTS))
+
+    def toggle(self):
+        measuring     = self.enabled or self._csv
+        self.enabled  = not self.enabled
+        self._overlay = None
+        if self.enabled and not measuring:
+            # activé en cours de frame (F3) : la frame repart d'ici, sans
+            # horodatage périmé ni tranches d'une ancienne frame
+            self.begin_frame()
+
+    # — mesure —
+    def begin_frame(self):
+        if not (self.enabled or self._csv):
+            return
+        frame = self.frame
+        for name in frame:
+            frame[name] = 0
+        self._t0 = self._t = perf_counter_ns()
+
+    def lap(self, name):
+        """Attribue à `name` le temps écoulé depuis la tranche précédente."""
+        if not (self.enabled or self._csv):
+            return
+        t = perf_counter_ns()
+        self.frame[name] = self.frame.get(name, 0) + t - self._t
+        self._t = t
+
+    def end_frame(self, **counts):
+        if not (self.enabled or self._csv):
+            return
+        total = perf_counter_ns() - self._t0
+        self.frames += 1
+        self.counts.update(counts)
+        hist = self.history
+        for name, ns in self.frame.items():
+            hist.setdefault(name, deque(maxlen=self.window)).append(ns)
+        hist["total"].append(total)
+        if self._csv:
+            self._csv.writerow((self.frames, total)
+                               + tuple(self.frame.get(n, 0) for n in SECTIONS)
+                               + tuple(self.counts.get(c, 0) for c in COUNTS))
+
+    def stats(self, name):
+        """(moyenne, p95, max) en millisecondes sur la fenêtre glissante."""
+        values = sorted(self.history.get(name, ()))
+        if not values:
+            return 0.0, 0.0, 0.0
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        return sum(values) / len(values) / 1e6, p95 / 1e6, values[-1] / 1e6
+
+    def close(self):
+        if self._csv_file:
+            self._csv_file.close()
+            self._csv_file = self._csv = None
+
+    # — overlay —
+    def draw(self, screen):
+        if not self.enabled:
+            return
+        if self._overlay is None or self.frames % self.REFRESH == 0:
+            self._overlay = self._render_overlay()
+        screen.blit(self._overlay, (10, 60))
+
+    def _render_overlay(self):
+        font  = get_font(None, 18)
+        lines = [f"{'section':<11}{'mean':>7}{'p95':>7}{'max':>7}  ms"]
+        for name in SECTIONS + ("total",):
+            mean, p95, peak = self.stats(name)
+            lines.append(f"{name:<11}{mean:7.2f}{p95:7.2f}{peak:7.2f}")
+        lines.append("  ".join(f"{c}={self.counts.get(c, 0)}" for c in COUNTS[:4]))
+        lines.append("  ".join(f"{c}={self.counts.get(c, 0)}" for c in COUNTS[4:]))
+
+        rows   = [font.render(l, True, (230, 230, 230)) for l in lines]
+        width  = max(r.get_width() for r in rows) + 12
+        height = sum(r.get_height() for r in rows) + 12
+        panel  = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill(self.OVERLAY_COLOR)
+        y = 6
+        for r in rows:
+            panel.blit(r, (6, y))
+            y += r.get_height()
+        return panel
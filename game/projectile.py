@@ -4,13 +4,19 @@ import pygame
 import math
 from .settings import MAP_WIDTH, MAP_HEIGHT
 from .utils import resource_path
+from .sprites import get_disc
 
 class Fireball:
     def __init__(self, x, y, target_pos, speed=300):
-        # create a simple circular fireball
-        self.image = pygame.Surface((16, 16), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (255, 100, 0), (8, 8), 8)
-        self.rect = self.image.get_rect(center=(x, y))
+        # simple circular fireball (surface partagée)
+        self.image = get_disc(8, (255, 100, 0))
+        self.rect  = self.image.get_rect()
+        self.reset(x, y, target_pos, speed)
+
+    def reset(self, x, y, target_pos, speed=300):
+        """Place le projectile en (x, y), lancé vers target_pos."""
+        self.rect.center = (x, y)
+        self.fx, self.fy = self.rect.topleft
         # compute velocity towards target_pos tuple
         dx, dy = target_pos[0] - x, target_pos[1] - y
         dist = math.hypot(dx, dy) or 1
@@ -20,9 +26,10 @@ class Fireball:
         self.hit_target = False
 
     def update(self, dt):
-        # move
-        self.rect.x += self.vx * dt
-        self.rect.y += self.vy * dt
+        # move (position flottante, arrondie dans le rect)
+        self.fx += self.vx * dt
+        self.fy += self.vy * dt
+        self.rect.topleft = (round(self.fx), round(self.fy))
         # if outside map bounds, mark for removal
         if self.off_screen():
             self.hit_target = True
@@ -36,5 +43,8 @@ class Fireball:
             self.rect.top    > MAP_HEIGHT
         )
 
+    def sprite(self, cam_x, cam_y):
+        return self.image, (self.rect.x - cam_x, self.rect.y - cam_y)
+
     def draw(self, surf, cam_x, cam_y):
         surf.blit(self.image, (self.rect.x - cam_x, self.rect.y - cam_y))
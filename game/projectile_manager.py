@@ -0,0 +1,142 @@
+# projectile_manager.py
+"""
+Gestionnaire global des projectiles ennemis.
+
+Tous les projectiles (position du centre, vitesse, durée de vie, dégâts,
+type) vivent dans des tableaux NumPy : un seul pas vectorisé les déplace,
+élimine ceux qui sortent de la map ou expirent, puis un test masqué
+renvoie les dégâts infligés au joueur. Les emplacements libérés sont
+réutilisés (tableaux tassés), sans objet Python par tir.
+
+Un nouveau type de projectile = une entrée dans KINDS.
+"""
+import math
+import numpy as np
+from .settings import MAP_WIDTH, MAP_HEIGHT
+from .sprites import get_disc
+
+# Types : id -> (rayon px, couleur)
+FIREBALL = 0
+KINDS = {
+    FIREBALL: (8, (255, 100, 0)),
+}
+
+LIFETIME = 12.0   # s, au-delà un projectile disparaît même s'il est sur la map
+
+
+class ProjectileManager:
+    COLUMNS = ("x", "y", "vx", "vy", "life", "damage", "radius", "kind", "px", "py")
+
+    def __init__(self, capacity=64):
+        self.count   = 0
+        self.columns = {c: np.zeros(capacity) for c in self.COLUMNS}
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        cap = len(self.columns["x"]) * 2
+        for c, arr in self.columns.items():
+            new = np.zeros(cap)
+            new[:len(arr)] = arr
+            self.columns[c] = new
+
+    def spawn(self, x, y, target_pos, speed=300, damage=2, kind=FIREBALL, lifetime=LIFETIME):
+        """Tire un projectile de (x, y) vers target_pos."""
+        i = self.count
+        if i == len(self.columns["x"]):
+            self._grow()
+        dx, dy = target_pos[0] - x, target_pos[1] - y
+        dist = math.hypot(dx, dy) or 1
+        values = {
+            "x": x, "y": y, "vx": dx / dist * speed, "vy": dy / dist * speed,
+            "life": lifetime, "damage": damage, "radius": KINDS[kind][0], "kind": kind,
+            "px": x, "py": y,
+        }
+        for c, v in values.items():
+            self.columns[c][i] = v
+        self.count += 1
+        return i
+
+    def _keep(self, alive):
+        """Tasse les tableaux sur les projectiles encore vivants."""
+        n = self.count
+        k = int(alive.sum())
+        if k != n:
+            for arr in self.columns.values():
+                arr[:k] = arr[:n][alive]
+            self.count = k
+
+    def clear(self):
+        self.count = 0
+
+    def step(self, dt):
+        """Déplacement, durée de vie et sortie de map, en un passage."""
+        n = self.count
+        if n == 0:
+            return
+        col = self.columns
+        x, y, r = col["x"][:n], col["y"][:n], col["radius"][:n]
+        x += col["vx"][:n] * dt
+        y += col["vy"][:n] * dt
+        life = col["life"][:n]
+        life -= dt
+        alive = ((life > 0) &
+                 (x + r >= 0) & (x - r <= MAP_WIDTH) &
+                 (y + r >= 0) & (y - r <= MAP_HEIGHT))
+        self._keep(alive)
+
+    def hit_rect(self, rect):
+        """
+        Retire les projectiles qui touchent `rect` (boîte du projectile contre
+        le rect, comme colliderect) et renvoie la somme de leurs dégâts.
+        """
+        n = self.count
+        if n == 0:
+            return 0
+        col = self.columns
+        x, y, r = col["x"][:n], col["y"][:n], col["radius"][:n]
+        hit = ((x - r < rect.right) & (x + r > rect.left) &
+               (y - r < rect.bottom) & (y + r > rect.top))
+        if not hit.any():
+            return 0
+        damage = float(col["damage"][:n][hit].sum())
+        self._keep(~hit)
+        return damage
+
+    # — rendu —
+    def remember(self):
+        """Positions courantes, pour l'interpolation (voir Simulation)."""
+        n, col = self.count, self.columns
+        col["px"][:n] = col["x"][:n]
+        col["py"][:n] = col["y"][:n]
+
+    def sprites(self, cam_x, cam_y, view, alpha=1.0):
+        """
+        Paires (image, position écran) des projectiles qui touchent `view`
+        (rect monde), à leur position interpolée.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        col = self.columns
+        px, py = col["px"][:n], col["py"][:n]
+        x = px + (col["x"][:n] - px) * alpha
+        y = py + (col["y"][:n] - py) * alpha
+        r = col["radius"][:n]
+        idx = np.flatnonzero((x + r > view.left) & (x - r < view.right) &
+                             (y + r > view.top)  & (y - r < view.bottom))
+        if len(idx) == 0:
+            return []
+        left = np.rint(x[idx] - r[idx] - cam_x).astype(np.int64).tolist()
+        top  = np.rint(y[idx] - r[idx] - cam_y).astype(np.int64).tolist()
+        images = {k: get_disc(rad, color) for k, (rad, color) in KINDS.items()}
+        kinds = col["kind"][idx].astype(np.int64).tolist()
+        return [(images[k], (lx, ty)) for k, lx, ty in zip(kinds, left, top)]
+
+    def draw(self, surface, cam_x, cam_y, view, alpha=1.0):
+        """Dessine (un seul blits) les projectiles visibles. Renvoie le nombre dessinés."""
+        pairs = self.sprites(cam_x, cam_y, view, alpha)
+        if pairs:
+            surface.blits(pairs, doreturn=False)
+        return len(pairs)
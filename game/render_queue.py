@@ -0,0 +1,63 @@
+# render_queue.py
+"""
+File de rendu par couches.
+
+Les entités ne dessinent plus elles-mêmes : elles fournissent des paires
+(image, position) rangées dans des seaux par couche, puis `flush` vide
+chaque seau en un seul appel `fblits` (pygame-ce) ou `blits` ; une
+entrée peut porter un `area` (barres de PV, voir hp_bars). L'ordre des
+couches fixe l'empilement : orbes au sol, corps, flashs, barres, projectiles,
+joueur.
+"""
+GROUND, BODIES, TINTS, BARS, PROJECTILES, PLAYER = range(6)
+LAYERS = 6
+
+
+def _blits(surface, pairs):
+    # fblits (pygame-ce) évite de construire la liste des rects de retour,
+    # mais n'accepte que des paires : un seau avec des `area` passe par blits
+    fblits = getattr(surface, "fblits", None)
+    if fblits is not None and not any(len(p) > 2 for p in pairs):
+        fblits(pairs)
+    else:
+        surface.blits(pairs, doreturn=False)
+
+
+class RenderQueue:
+    def __init__(self):
+        self.blits = [[] for _ in range(LAYERS)]
+
+    def __len__(self):
+        return sum(map(len, self.blits))
+
+    def add(self, layer, image, pos):
+        self.blits[layer].append((image, pos))
+
+    def extend(self, layer, pairs):
+        self.blits[layer].extend(pairs)
+
+    def clear(self):
+        for bucket in self.blits:
+            bucket.clear()
+
+    def freeze(self):
+        """Contenu figé (tuples par couche) pour un rendu différé, puis vidé."""
+        frozen = tuple(tuple(b) for b in self.blits)
+        self.clear()
+        return frozen
+
+    def flush(self, surface):
+        """Dessine puis vide toutes les couches. Renvoie le nombre d'éléments."""
+        count = draw_layers(surface, self.blits)
+        self.clear()
+        return count
+
+
+def draw_layers(surface, layers):
+    """Dessine des couches (seaux de blits) dans l'ordre. Renvoie le nombre d'éléments."""
+    count = 0
+    for blits in layers:
+        if blits:
+            _blits(surface, blits)
+            count += len(blits)
+    return count
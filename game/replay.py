@@ -0,0 +1,246 @@
+# replay.py
+"""
+Enregistrement et rejeu des entrées d'une partie.
+
+Une Simulation est déterministe à graine et entrées égales : il suffit
+donc d'enregistrer la graine, les entrées de chaque pas et les actions
+hors tick (choix d'amélioration, cri) pour rejouer une partie pas pour
+pas — et reproduire une régression de performance sur exactement les
+mêmes frames.
+
+Format binaire (little-endian) : un en-tête puis des enregistrements
+étiquetés d'un octet.
+
+    en-tête  b"GRPL", version (B), graine (Q), stress (?)
+    b"D"     dt des pas suivants (d)
+    b"T"     n pas identiques (H), touches + clic (B), souris monde (dd)
+    b"U"     amélioration choisie (B, indice dans Player.UPGRADE_KEYS)
+    b"S"     cri vers une cible monde (dd)
+
+Les pas consécutifs identiques (la même FrameInput sert à tous les pas
+d'une frame, et au repos rien ne change) sont fusionnés : quelques
+dizaines d'octets par seconde de jeu.
+
+    python run.py --record partie.rpl     # joue et enregistre
+    python run.py --replay partie.rpl     # rejoue avec le rendu
+    python -m game.replay partie.rpl      # rejoue headless, coût par pas
+"""
+import argparse
+import os
+import struct
+import time
+
+import pygame
+
+from .player import Player
+from .profiler import FrameProfiler
+from .simulation import Simulation, FrameInput
+
+MAGIC   = b"GRPL"
+VERSION = 1
+
+HEADER  = struct.Struct("<4sBQ?")
+DT      = struct.Struct("<d")
+TICKS   = struct.Struct("<HBdd")
+UPGRADE = struct.Struct("<B")
+SCREAM  = struct.Struct("<dd")
+
+# touches lues par le joueur, un bit chacune ; bit suivant : clic gauche
+KEYS       = (pygame.K_z, pygame.K_q, pygame.K_s, pygame.K_d, pygame.K_SPACE)
+ATTACK_BIT = 1 << len(KEYS)
+MAX_RUN    = 0xFFFF
+
+
+def _pressed(keys, k):
+    """Même lecture que Player.update (dict ou get_pressed())."""
+    if hasattr(keys, "get"):
+        return keys.get(k, False)
+    try:
+        return keys[k]
+    except Exception:
+        return False
+
+
+def pack_input(inputs):
+    """FrameInput -> (octet de touches/clic, souris)."""
+    flags = 0
+    for bit, k in enumerate(KEYS):
+        if _pressed(inputs.keys, k):
+            flags |= 1 << bit
+    if inputs.attack:
+        flags |= ATTACK_BIT
+    return flags, (float(inputs.mouse[0]), float(inputs.mouse[1]))
+
+
+def unpack_input(flags, mouse):
+    keys = {k: True for bit, k in enumerate(KEYS) if flags & (1 << bit)}
+    return FrameInput(keys=keys, mouse=mouse, attack=bool(flags & ATTACK_BIT))
+
+
+class InputRecorder:
+    """
+    Écrit les entrées d'une simulation dans `path`. S'attache via
+    `sim.recorder` (voir `record`) : step, choose_upgrade et scream s'y
+    déclarent d'eux-mêmes, quel que soit le thread qui les appelle.
+    """
+
+    def __init__(self, path, seed, stress=False):
+        if seed is None:
+            raise ValueError("une partie enregistrée doit avoir une graine")
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, seed, stress))
+        self._dt  = None
+        self._run = None     # [n, flags, mouse] : pas identiques en attente
+        self.ticks = 0
+
+    def tick(self, dt, inputs):
+        if dt != self._dt:
+            self._flush()
+            self._dt = dt
+            self._file.write(b"D" + DT.pack(dt))
+        flags, mouse = pack_input(inputs)
+        run = self._run
+        if run and run[0] < MAX_RUN and run[1] == flags and run[2] == mouse:
+            run[0] += 1
+        else:
+            self._flush()
+            self._run = [1, flags, mouse]
+        self.ticks += 1
+
+    def upgrade(self, key):
+        self._flush()
+        self._file.write(b"U" + UPGRADE.pack(Player.UPGRADE_KEYS.index(key)))
+
+    def scream(self, target):
+        self._flush()
+        self._file.write(b"S" + SCREAM.pack(*target))
+
+    def _flush(self):
+        if self._run:
+            n, flags, (mx, my) = self._run
+            self._file.write(b"T" + TICKS.pack(n, flags, mx, my))
+            self._run = None
+
+    def close(self):
+        if not self._file.closed:
+            self._flush()
+            self._file.close()
+
+
+def record(sim, path):
+    """Enregistre désormais les entrées de `sim` dans `path`."""
+    sim.recorder = InputRecorder(path, sim.seed, sim.stress)
+    return sim.recorder
+
+
+class Recording:
+    """
+    Partie relue : `seed`, `stress` et la liste `events` de
+    ("tick", dt, n, FrameInput), ("upgrade", clé) et ("scream", cible).
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.seed, self.stress = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} : pas un enregistrement de partie (v{VERSION})")
+        self.events = []
+        self.ticks  = 0
+        pos, dt = HEADER.size, None
+        while pos < len(data):
+            tag, pos = data[pos:pos + 1], pos + 1
+            if tag == b"D":
+                (dt,) = DT.unpack_from(data, pos); pos += DT.size
+            elif tag == b"T":
+                n, flags, mx, my = TICKS.unpack_from(data, pos); pos += TICKS.size
+                self.events.append(("tick", dt, n, unpack_input(flags, (mx, my))))
+                self.ticks += n
+            elif tag == b"U":
+                (i,) = UPGRADE.unpack_from(data, pos); pos += UPGRADE.size
+                self.events.append(("upgrade", Player.UPGRADE_KEYS[i]))
+            elif tag == b"S":
+                target = SCREAM.unpack_from(data, pos); pos += SCREAM.size
+                self.events.append(("scream", target))
+            else:
+                raise ValueError(f"{path} : enregistrement inconnu {tag!r} à l'octet {pos - 1}")
+
+    def simulation(self, profiler=None):
+        """Simulation neuve dans l'état initial de la partie enregistrée."""
+        return Simulation(seed=self.seed, stress=self.stress, profiler=profiler)
+
+
+class ReplayDriver:
+    """Rejoue une Recording pas à pas sur une simulation fournie par l'appelant."""
+
+    def __init__(self, recording):
+        self.recording = recording
+        self._events = iter(recording.events)
+        self._dt = self._inputs = None
+        self._left = 0
+        self.ticks = 0
+
+    def step(self, sim):
+        """Actions hors tick en attente puis un pas enregistré ; False à la fin."""
+        while self._left == 0:
+            event = next(self._events, None)
+            if event is None:
+                return False
+            if event[0] == "tick":
+                _, self._dt, self._left, self._inputs = event
+            elif event[0] == "upgrade":
+                sim.choose_upgrade(event[1])
+            else:
+                sim.scream(event[1])
+        sim.step(self._dt, self._inputs)
+        self._left -= 1
+        self.ticks += 1
+        return True
+
+
+def replay(path, profiler=None):
+    """Rejoue `path` headless ; renvoie (simulation, durées des pas en s)."""
+    recording = Recording(path)
+    sim    = recording.simulation(profiler)
+    driver = ReplayDriver(recording)
+    prof   = sim.profiler
+    times  = []
+    while True:
+        prof.begin_frame()
+        t0 = time.perf_counter()
+        if not driver.step(sim):
+            break
+        times.append(time.perf_counter() - t0)
+        prof.end_frame(steps=1, enemies=len(sim.enemy_list), mages=len(sim.mages),
+                       bosses=len(sim.boss_list), orbs=len(sim.xp_orbs),
+                       fireballs=len(sim.projectiles))
+    return sim, times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path")
+    parser.add_argument("--profile-csv", default=None, help="une ligne par pas (ns)")
+    args = parser.parse_args(argv)
+    # pas de fenêtre ni de son (main.py importe ce module : pas au niveau module)
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    profiler = FrameProfiler(csv_path=args.profile_csv)
+    try:
+        sim, times = replay(args.path, profiler)
+    finally:
+        profiler.close()
+    times.sort()
+    n = max(len(times), 1)
+    print(f"{len(times)} pas, {sim.time:.1f} s simulées, niveau {sim.player.level}, "
+          f"{sim.kills} kills{', game over' if sim.game_over else ''}")
+    if times:
+        print(f"pas : moyenne {sum(times) / n * 1000:.3f} ms, "
+              f"p50 {times[n // 2] * 1000:.3f} ms, "
+              f"p99 {times[min(n - 1, int(n * 0.99))] * 1000:.3f} ms, "
+              f"max {times[-1] * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
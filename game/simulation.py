@@ -0,0 +1,418 @@
+# simulation.py
+"""
+Monde du jeu, découplé du rendu et de l'audio.
+
+Simulation.step(dt, inputs) avance toute la logique d'une frame (spawns,
+joueur, gobelins, mages, boss, séparation, collisions, XP, bonus) avec un
+dt explicite et un RNG initialisé par `seed`. Aucun blit ni fenêtre : le
+même objet sert au jeu (main.py le dessine) et aux runs headless pour
+l'équilibrage et les benchmarks.
+"""
+import math
+import random
+from itertools import chain
+
+import pygame
+
+from .settings import WIDTH, HEIGHT, MAP_WIDTH, MAP_HEIGHT
+from .player import Player
+from .enemy import POOL as ENEMIES
+from .xp_orb import (
+    POOL as ORBS, MERGE_INTERVAL, ATTRACT_RADIUS, ATTRACT_SPEED, PICKUP_SOUND, bound_orbs,
+)
+from .sounds import get_sound
+from .projectile_manager import ProjectileManager
+from .pool import compact
+from .orb_store import OrbStore
+from .goblin_mage import GoblinMage
+from .boss import Boss
+from .spatial import SpatialHash, separate
+from .enemy_store import EnemyStore
+from .camera import Camera
+from .profiler import FrameProfiler
+
+# Cap de monstres, évolue avec le level
+BASE_MAX_ENEMIES   = 5   # mobs minimum level 1
+PER_LEVEL_ENEMIES  = 2   # mobs en plus par level
+
+# Mode stress (python run.py --stress) : milliers de gobelins via EnemyStore
+STRESS_MAX_ENEMIES = 3000
+STRESS_SPAWN_BATCH = 25
+
+# Retours visuels (durées en secondes)
+FLASH_DURATION     = 0.08
+HIT_FLASH_DURATION = 0.05
+
+# Au-delà (px en un pas), un objet n'est pas interpolé : il a été recyclé
+TELEPORT_DISTANCE = 64
+
+# Pause après le choix d'une amélioration
+UPGRADE_RESUME_DELAY = 0.7
+
+BONUS_SIZE  = 64
+BONUS_TYPES = ["magnet"]
+BONUS_OFFSET = 200
+BONUS_SPAWN_POINTS = [
+    (BONUS_OFFSET, BONUS_OFFSET),
+    (MAP_WIDTH - BONUS_SIZE - BONUS_OFFSET, BONUS_OFFSET),
+    (BONUS_OFFSET, MAP_HEIGHT - BONUS_SIZE - BONUS_OFFSET),
+    (MAP_WIDTH - BONUS_SIZE - BONUS_OFFSET, MAP_HEIGHT - BONUS_SIZE - BONUS_OFFSET),
+]
+
+
+class FrameInput:
+    """Entrées d'une frame : touches, souris (coordonnées monde), clic gauche."""
+    __slots__ = ("keys", "mouse", "attack")
+
+    def __init__(self, keys=None, mouse=(0, 0), attack=False):
+        self.keys   = keys if keys is not None else {}
+        self.mouse  = mouse
+        self.attack = attack
+
+
+NO_INPUT = FrameInput()
+
+
+class Simulation:
+    def __init__(self, seed=None, stress=False, profiler=None):
+        self.seed   = seed
+        self.rng    = random.Random(seed)
+        self.stress = stress
+
+        self.player    = Player(MAP_WIDTH // 2, MAP_HEIGHT // 2)
+        self.mages     = []
+        self.boss_list = []
+        # Orbes en tableaux NumPy (attraction et ramassage vectorisés)
+        self.orb_store = OrbStore()
+        self.xp_orbs   = self.orb_store.orbs
+        # Tous les projectiles ennemis, en tableaux (voir add_mage)
+        self.projectiles = ProjectileManager()
+
+        # Mode stress : gobelins en tableaux NumPy, cap relevé, spawns groupés
+        self.enemy_store = EnemyStore() if stress else None
+        self.enemy_list  = self.enemy_store.enemies if stress else []
+        self.spawn_batch = STRESS_SPAWN_BATCH if stress else 1
+
+        self.current_bonus       = None
+        self.spawn_timer         = 0.0
+        self.orb_merge_timer     = 0.0
+        self.base_spawn_interval = 3.0
+        self.mage_spawn_chance   = 0.1
+        # Courbe de spawn et cap (réglables par run, voir game/sweep.py)
+        self.base_max_enemies    = BASE_MAX_ENEMIES
+        self.per_level_enemies   = PER_LEVEL_ENEMIES
+        self.spawn_time_scale    = 60.0   # s : l'intervalle est divisé par 1 + t/scale
+        self.spawn_level_factor  = 0.01   # raccourcissement par niveau (plancher 0.2)
+        self.min_spawn_interval  = 0.05
+
+        self.time          = 0.0
+        self.frames        = 0
+        self.kills         = 0
+        self.game_over     = False
+        self.survival_time = 0.0
+
+        # Level up : choix proposés (non vide → monde en pause)
+        self.upgrade_choices = []
+        self.resume_timer    = 0.0
+
+        # Retours visuels lus par le rendu
+        self.screen_flash_timer = 0.0
+        self.hit_flash_timer    = 0.0
+        self.hit_flash_target   = None
+
+        # Broadphase : grilles reconstruites à chaque frame
+        self.enemy_grid    = SpatialHash()
+        self.orb_grid      = SpatialHash()
+        self.camera        = Camera()
+        self.camera.follow(self.player.rect)
+
+        # Tranches chronométrées (profileur désactivé par défaut)
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        # Enregistreur d'entrées (voir replay.py), None hors enregistrement
+        self.recorder = None
+
+        # Positions avant le dernier pas, pour l'interpolation du rendu
+        self.prev_positions = {}
+        self.prev_camera    = (self.camera.x, self.camera.y)
+
+    # — état —
+    @property
+    def paused(self):
+        return bool(self.upgrade_choices) or self.resume_timer > 0 or self.game_over
+
+    def enemy_count(self):
+        return len(self.enemy_list) + len(self.mages) + len(self.boss_list)
+
+    def enemy_cap(self):
+        if self.stress:
+            return STRESS_MAX_ENEMIES
+        return self.base_max_enemies + self.per_level_enemies * (self.player.level - 1)
+
+    def add_enemy(self, e):
+        if self.enemy_store is not None:
+            self.enemy_store.add(e)
+        else:
+            self.enemy_list.append(e)
+
+    def remove_enemy(self, e):
+        if self.enemy_store is not None:
+            self.enemy_store.remove(e)
+        else:
+            self.enemy_list.remove(e)
+        ENEMIES.release(e)
+
+    def remove_enemies(self, dead):
+        """Retire un ensemble de gobelins en une passe et les recycle."""
+        if not dead:
+            return
+        if self.enemy_store is not None:
+            # ordre de la liste, pas celui du set (ids) : rejouable à l'identique
+            for e in [e for e in self.enemy_list if e in dead]:
+                self.enemy_store.remove(e)   # swap-remove O(1)
+                ENEMIES.release(e)
+        else:
+            compact(self.enemy_list, lambda e: e not in dead, ENEMIES)
+
+    def add_mage(self, m):
+        """Ajoute un mage ; ses tirs passent par le gestionnaire global."""
+        m.projectile_manager = self.projectiles
+        self.mages.append(m)
+        return m
+
+    def drop_orb(self, x, y, value):
+        self.orb_store.add(ORBS.acquire(x, y, value))
+
+    # — actions hors tick (menu, événements) —
+    def choose_upgrade(self, key):
+        """Applique l'amélioration choisie et relance le monde après un délai."""
+        if self.recorder:
+            self.recorder.upgrade(key)
+        self.player.apply_upgrade(key)
+        self.upgrade_choices = []
+        self.resume_timer    = UPGRADE_RESUME_DELAY
+
+    def scream(self, mouse_world):
+        if self.recorder:
+            self.recorder.scream(mouse_world)
+        self.player.scream(self.enemy_list, self.mages, mouse_world)
+
+    # — interpolation —
+    def moving_objects(self):
+        return chain(self.enemy_list, self.mages, self.boss_list, self.xp_orbs, (self.player,))
+
+    def remember_positions(self):
+        """Mémorise les positions courantes ; à appeler avant le dernier pas d'une frame."""
+        self.prev_positions = {o: o.rect.topleft for o in self.moving_objects()}
+        self.projectiles.remember()
+        self.prev_camera    = (self.camera.x, self.camera.y)
+
+    def interp_offset(self, obj, alpha):
+        """
+        Décalage (dx, dy) à ajouter à obj.rect pour le dessiner à la position
+        interpolée entre le pas précédent (alpha=0) et le pas courant (alpha=1).
+        """
+        prev = self.prev_positions.get(obj)
+        if prev is None:
+            return 0, 0
+        # objet recyclé (ou téléporté) depuis : pas de glissement à l'écran
+        if abs(prev[0] - obj.rect.x) + abs(prev[1] - obj.rect.y) > TELEPORT_DISTANCE:
+            return 0, 0
+        k = 1.0 - alpha
+        return round((prev[0] - obj.rect.x) * k), round((prev[1] - obj.rect.y) * k)
+
+    def interp_camera(self, alpha):
+        (px, py), cam = self.prev_camera, self.camera
+        return round(px + (cam.x - px) * alpha), round(py + (cam.y - py) * alpha)
+
+    # — boucle —
+    def step(self, dt, inputs=NO_INPUT):
+        """Avance le monde de `dt` secondes."""
+        if self.recorder:
+            self.recorder.tick(dt, inputs)
+        self.time   += dt
+        self.frames += 1
+        self.screen_flash_timer = max(0.0, self.screen_flash_timer - dt)
+        self.hit_flash_timer    = max(0.0, self.hit_flash_timer    - dt)
+        if self.hit_flash_timer == 0:
+            self.hit_flash_target = None
+
+        self._check_level_up()
+        if self.resume_timer > 0:
+            self.resume_timer -= dt
+        self.camera.follow(self.player.rect)
+        if not self.paused:
+            self._tick(dt, inputs)
+
+    def _check_level_up(self):
+        """Level up → choix d'améliorations + boss tous les 10 niveaux."""
+        player = self.player
+        if not player.new_level:
+            return
+        self.upgrade_choices = self.rng.sample(Player.UPGRADE_KEYS, 3)
+        if player.level % 10 == 0:
+            safe_dist = 800
+            while True:
+                bx = self.rng.randint(0, MAP_WIDTH)
+                by = self.rng.randint(0, MAP_HEIGHT)
+                if math.hypot(bx - player.rect.centerx, by - player.rect.centery) >= safe_dist:
+                    break
+            b = Boss(bx, by, player.level)
+            self.boss_list.append(b)
+            b.hit_flash_timer = 0.0
+        player.new_level = False
+
+    def _tick(self, dt, inputs):
+        player     = self.player
+        enemy_list = self.enemy_list
+        mages      = self.mages
+        boss_list  = self.boss_list
+        cam_x, cam_y = self.camera.x, self.camera.y
+        prof = self.profiler
+        prof.lap("sim")
+
+        player.update(inputs.keys, dt)
+
+        # Auto-attack (inclut boss)
+        if player.auto_attack and (enemy_list or mages or boss_list):
+            targets = enemy_list + mages + boss_list
+            t = min(targets, key=lambda e: math.hypot(e.rect.centerx-player.rect.centerx,
+                                                      e.rect.centery-player.rect.centery))
+            player.attack(targets, t.rect.center)
+            if t in boss_list:
+                self.hit_flash_timer  = HIT_FLASH_DURATION
+                self.hit_flash_target = t
+
+        # Clic pour attaquer
+        elif inputs.attack:
+            world_pos = inputs.mouse
+            player.attack(enemy_list + mages + boss_list, world_pos)
+            for b in boss_list:
+                if b.rect.collidepoint(world_pos):
+                    self.hit_flash_timer  = HIT_FLASH_DURATION
+                    self.hit_flash_target = b
+
+        prof.lap("player")
+        self._spawn(dt, cam_x, cam_y)
+        prof.lap("spawn")
+
+        # Update gobelins/mages
+        if self.enemy_store is not None:
+            self.enemy_store.step(player.rect.center, dt)
+        else:
+            for e in enemy_list: e.update(player.rect.center, dt)
+        for m in mages:      m.update(player, dt, cam_x, cam_y)
+        self.projectiles.step(dt)
+
+        # Update & attaque bosses
+        for b in boss_list:
+            b.update(player.rect.center, dt)
+            dx = b.rect.centerx - player.rect.centerx
+            dy = b.rect.centery  - player.rect.centery
+            if math.hypot(dx, dy) <= b.attack_range and b.attack_timer <= 0:
+                player.take_damage(b.damage)
+                b.attack_timer = b.attack_cooldown
+                self.screen_flash_timer = FLASH_DURATION
+
+        for b in boss_list[:]:
+            if b.hp <= 0:
+                self.drop_orb(b.rect.centerx, b.rect.centery, b.xp_value)
+                boss_list.remove(b)
+                if self.hit_flash_target is b:
+                    self.hit_flash_target = None
+
+        prof.lap("enemies")
+
+        # Separation (grille : seules les paires voisines sont testées)
+        separate(enemy_list+mages, self.enemy_grid)
+        prof.lap("separation")
+
+        # Kills & despawn, puis contacts sur la grille des survivants
+        # (la grille reste valide pour le culling au dessin)
+        dead = set()
+        for e in enemy_list:
+            if e.hp<=0:
+                self.kills+=1; self.drop_orb(e.rect.centerx,e.rect.centery,e.xp_value); dead.add(e)
+            elif math.hypot(e.rect.centerx-player.rect.centerx,e.rect.centery-player.rect.centery)>max(WIDTH,HEIGHT)*2:
+                dead.add(e)
+        self.remove_enemies(dead)
+        inset=50
+        hb=player.rect.inflate(-inset,-inset)
+        self.enemy_grid.rebuild(enemy_list)
+        for e in self.enemy_grid.query_rect(hb):
+            if e.attack_timer<=0:
+                player.take_damage(e.damage); e.attack_timer=e.attack_cooldown; e.pause_timer=0.5; self.screen_flash_timer=FLASH_DURATION
+
+        prof.lap("collisions")
+
+        # XP orbs & magnet
+        # fusion périodique : le nombre d'orbes reste borné sur une longue partie
+        self.orb_merge_timer += dt
+        if self.orb_merge_timer >= MERGE_INTERVAL:
+            self.orb_merge_timer = 0.0
+            bound_orbs(self.orb_store, self.orb_grid)
+        # attraction (rampe de vitesse tant que l'aimant est actif) puis ramassage
+        if player.magnet_active:
+            f = 3 + (player.magnet_duration - player.magnet_timer) / player.magnet_duration
+            self.orb_store.step(player.rect.center, dt, math.inf, ATTRACT_SPEED * f)
+        else:
+            self.orb_store.step(player.rect.center, dt, ATTRACT_RADIUS, ATTRACT_SPEED)
+        xp = self.orb_store.collect(player.rect, ORBS)
+        if xp:
+            get_sound(PICKUP_SOUND).play(); player.gain_xp(xp)
+        prof.lap("orbs")
+
+        if self.current_bonus is None:
+            btype=self.rng.choice(BONUS_TYPES); bx,by=self.rng.choice(BONUS_SPAWN_POINTS)
+            self.current_bonus=(btype,pygame.Rect(bx,by,BONUS_SIZE,BONUS_SIZE))
+        else:
+            btype,br=self.current_bonus
+            if player.rect.colliderect(br):
+                player.apply_bonus(btype); self.current_bonus=None
+
+        # un seul test masqué pour tous les projectiles
+        damage = self.projectiles.hit_rect(player.rect)
+        if damage:
+            player.take_damage(damage); self.screen_flash_timer=FLASH_DURATION
+        # les boules de feu d'un mage mort continuent leur course
+        for m in mages:
+            if m.hp<=0:
+                self.kills+=1; self.drop_orb(m.rect.centerx,m.rect.centery,m.xp_value)
+        compact(mages, lambda m: m.hp > 0)
+
+        if player.hp<=0:
+            self.game_over=True; self.survival_time=self.time
+        prof.lap("collisions")
+
+    def _spawn(self, dt, cam_x, cam_y):
+        """Spawn gobelins/mages au bord de l'écran, fréquence selon temps et niveau."""
+        rng, level = self.rng, self.player.level
+        elite_chance = min(0.1, level * 0.005)
+        rare_chance  = min(0.3, level * 0.015)
+        time_mod     = 1 + self.time / self.spawn_time_scale
+        level_mod    = max(0.2, 1 - level * self.spawn_level_factor)
+        interval     = max(self.min_spawn_interval, self.base_spawn_interval * level_mod / time_mod)
+        self.spawn_timer += dt
+        if self.spawn_timer < interval:
+            return
+        self.spawn_timer = 0.0
+        # — Cap dynamique lié au niveau —
+        cap = self.enemy_cap()
+        for _ in range(self.spawn_batch):
+            if self.enemy_count() >= cap:
+                break   # on saute ce spawn-ci
+
+            edge = rng.choice(['top','bottom','left','right'])
+            if edge == 'top':
+                x = rng.randint(int(cam_x), int(cam_x + WIDTH));  y = cam_y - 50
+            elif edge == 'bottom':
+                x = rng.randint(int(cam_x), int(cam_x + WIDTH));  y = cam_y + HEIGHT + 50
+            elif edge == 'left':
+                x = cam_x - 50; y = rng.randint(int(cam_y), int(cam_y + HEIGHT))
+            else:
+                x = cam_x + WIDTH + 50; y = rng.randint(int(cam_y), int(cam_y + HEIGHT))
+            if rng.random() < self.mage_spawn_chance:
+                self.add_mage(GoblinMage(x, y))
+            else:
+                r = rng.random()
+                tier = 'elite' if r < elite_chance else 'rare' if r < elite_chance+rare_chance else 'normal'
+                self.add_enemy(ENEMIES.acquire(x, y, speed=60, tier=tier, player_level=level))
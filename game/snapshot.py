@@ -0,0 +1,101 @@
+# snapshot.py
+"""
+Instantané de rendu d'une frame.
+
+`capture(sim, alpha)` lit la simulation une fois et fige tout ce que le
+rendu consomme : caméra interpolée, couches de la file de rendu (paires
+image/position déjà cullées), valeurs du HUD, flashs et écran de fin. Le
+snapshot ne référence plus d'objet mutable de la simulation : il peut être
+dessiné pendant qu'un autre thread avance le monde (voir pipeline.py).
+"""
+from . import sprites
+from .hp_bars import bar_sprite, BOSS_BAR
+from .render_queue import RenderQueue, GROUND, BODIES, TINTS, BARS, PROJECTILES, PLAYER
+from .simulation import FLASH_DURATION, HIT_FLASH_DURATION
+
+
+class RenderSnapshot:
+    """Valeurs figées d'une frame ; toute affectation après capture échoue."""
+    __slots__ = (
+        "frame", "camera", "layers", "drawn", "culled",
+        "xp_ratio", "level", "scream_timer", "hp_ratio", "dash_ratio", "dash_pos",
+        "flash", "game_over", "survival_time", "kills", "upgrade_choices", "counts",
+    )
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RenderSnapshot est en lecture seule")
+
+
+def capture(sim, alpha=1.0, bonus_image=None):
+    """Snapshot de `sim`, positions interpolées de `alpha` entre les deux derniers pas."""
+    player, camera = sim.player, sim.camera
+    cam_x, cam_y   = sim.interp_camera(alpha)
+
+    def at(obj):
+        """Caméra à passer au sprite de `obj` pour sa position interpolée."""
+        dx, dy = sim.interp_offset(obj, alpha)
+        return cam_x - dx, cam_y - dy
+
+    # culling : seuls les objets qui touchent la vue entrent dans la file
+    camera.begin_frame()
+    rq = RenderQueue()
+    rq.extend(GROUND, [orb.sprite(*at(orb)) for orb in camera.visible(sim.xp_orbs)])
+    if sim.current_bonus and bonus_image and camera.is_visible(sim.current_bonus[1]):
+        _, br = sim.current_bonus
+        rq.add(GROUND, bonus_image, (br.x - cam_x, br.y - cam_y))
+    # barres de PV : une fenêtre de bande pré-rendue, seulement pour les blessés
+    bars = rq.blits[BARS]
+    for e in camera.visible(sim.enemy_list, sim.enemy_grid):
+        ox, oy = at(e)
+        rq.add(BODIES, *e.sprite(ox, oy))
+        if e.hp < e.max_hp:
+            bars.append(bar_sprite(e, ox, oy))
+    for m in camera.visible(sim.mages):
+        ox, oy = at(m)
+        rq.add(BODIES, *m.sprite(ox, oy))
+        if m.hp < m.max_hp:
+            bars.append(bar_sprite(m, ox, oy))
+    # projectiles : culling vectorisé, indépendant des mages
+    fireballs = sim.projectiles.sprites(cam_x, cam_y, camera.view, alpha)
+    camera.tally(len(fireballs), len(sim.projectiles))
+    rq.extend(PROJECTILES, fireballs)
+
+    for b in camera.visible(sim.boss_list):
+        ox, oy = at(b)
+        rq.add(BODIES, *b.sprite(ox, oy))
+        if b.hp < b.max_hp:
+            bars.append(bar_sprite(b, ox, oy, BOSS_BAR, offset=10))
+
+    # Flash blanc localisé sur le boss touché, en respectant la forme du sprite
+    target = sim.hit_flash_target
+    if sim.hit_flash_timer > 0 and target and target.rect.colliderect(camera.view):
+        a = int(255 * (sim.hit_flash_timer / HIT_FLASH_DURATION))
+        ox, oy = at(target)
+        rq.add(TINTS, sprites.faded(target.image, a), (target.rect.x - ox, target.rect.y - oy))
+
+    px_cam, py_cam = at(player)
+    rq.extend(PLAYER, player.sprites(px_cam, py_cam))
+
+    dash = 1.0 if player.dash_timer <= 0 else max(0, 1 - player.dash_timer / player.dash_cooldown)
+    flash = 0
+    if not sim.game_over and sim.screen_flash_timer > 0:
+        flash = int(255 * 0.5 * (sim.screen_flash_timer / FLASH_DURATION))
+    return RenderSnapshot(
+        frame=sim.frames, camera=(cam_x, cam_y), layers=rq.freeze(),
+        drawn=camera.drawn, culled=camera.culled,
+        xp_ratio=player.xp / player.next_level_xp, level=player.level,
+        scream_timer=player.scream_timer, hp_ratio=max(player.hp, 0) / player.max_hp,
+        dash_ratio=dash,
+        dash_pos=(player.rect.centerx - px_cam, player.rect.bottom - py_cam + 6),
+        flash=flash, game_over=sim.game_over, survival_time=sim.survival_time,
+        kills=sim.kills,
+        # liste remplacée (jamais modifiée en place) à chaque level up
+        upgrade_choices=sim.upgrade_choices,
+        counts=(("enemies", len(sim.enemy_list)), ("mages", len(sim.mages)),
+                ("bosses", len(sim.boss_list)), ("orbs", len(sim.xp_orbs)),
+                ("fireballs", len(sim.projectiles))),
+    )
@@ -0,0 +1,57 @@
+# sounds.py
+"""
+Banque de sons partagée : chaque effet est décodé une seule fois
+(au démarrage via preload(), sinon au premier appel) puis réutilisé.
+Si le mixer n'est pas initialisé, on renvoie un son muet.
+"""
+import pygame
+from .utils import resource_path
+
+SFX = (
+    "fx/attack.mp3",
+    "fx/levelup.mp3",
+    "fx/eagle_scream.mp3",
+    "fx/xp_orb.mp3",
+)
+
+_SOUNDS = {}
+
+
+class SilentSound:
+    """Remplaçant muet quand aucun périphérique audio n'est disponible."""
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        pass
+
+    def set_volume(self, value):
+        pass
+
+
+SILENT = SilentSound()
+
+
+def get_sound(path):
+    """Renvoie le Sound partagé pour `path`, décodé au premier appel."""
+    if pygame.mixer.get_init() is None:
+        return SILENT
+    snd = _SOUNDS.get(path)
+    if snd is None:
+        snd = pygame.mixer.Sound(resource_path(path))
+        _SOUNDS[path] = snd
+    return snd
+
+
+def preload(paths=SFX):
+    """Décode d'avance tous les effets (à appeler après mixer.init())."""
+    for path in paths:
+        get_sound(path)
+
+
+def clear_cache():
+    _SOUNDS.clear()
+
+
+# les Sound ne survivent pas à pygame.quit() : on vide la banque avec lui
+pygame.register_quit(clear_cache)
@@ -0,0 +1,172 @@
+# sprites.py
+"""
+Registre global de sprites (flyweight).
+
+Chaque variante (asset, taille, zoom, flip, teinte) est chargée et
+transformée une seule fois, puis partagée par toutes les instances :
+spawner un gobelin ne coûte plus qu'un Rect et quelques stats.
+
+Les surfaces renvoyées sont partagées : ne jamais les modifier en place
+(faire un .copy() avant tout fill/blit dessus).
+"""
+import math
+
+import pygame
+from .utils import resource_path
+
+# Couleurs de surimpression communes
+TINT_RARE   = (0, 0, 255, 80)
+TINT_ELITE  = (255, 255, 0, 80)
+TINT_BOSS   = (255, 0, 0, 120)
+FLASH_WHITE = (255, 255, 255, 150)
+
+FADE_STEPS    = 16   # niveaux d'alpha pré-calculés pour faded()
+ROTATION_STEP = 5    # degrés entre deux rotations pré-calculées
+
+_RAW     = {}   # asset -> surface brute (convert_alpha)
+_SPRITES = {}   # (asset, size, scale, zoom, flip, tint, flash) -> surface
+_FADES   = {}   # (surface, niveau) -> surface
+_ZOOMS   = {}   # (surface, zoom) -> surface
+_DISCS   = {}   # (rayon, couleur) -> surface
+_ROTATED = {}   # (asset, angle quantifié, échelle) -> surface
+_CONES   = {}   # (longueur, demi-angle, angle quantifié, couleur) -> (surface, apex)
+
+
+def load_image(asset):
+    """
+    Charge (une seule fois) l'image brute d'un asset. Sans fenêtre
+    (simulation headless), l'image n'est pas convertie au format d'écran.
+    """
+    surf = _RAW.get(asset)
+    if surf is None:
+        surf = pygame.image.load(resource_path(asset))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        _RAW[asset] = surf
+    return surf
+
+
+def get_sprite(asset, size=None, scale=None, zoom=1.0, flip=False,
+               tint=None, flash=None):
+    """
+    Renvoie la variante partagée d'un sprite.
+    - size  : (w, h) absolu, via transform.scale
+    - scale : facteur appliqué à la taille brute (ignoré si size est donné)
+    - zoom  : rotozoom lissé appliqué après la mise à l'échelle
+    - flip  : miroir horizontal
+    - tint  : (r, g, b, a) superposé sur la silhouette du sprite
+    - flash : seconde surimpression (flash de coup) par-dessus la teinte
+    Teinte et flash sont « cuits » dans la surface : un seul blit au dessin.
+    """
+    key = (asset, size, scale, zoom, flip, tint, flash)
+    surf = _SPRITES.get(key)
+    if surf is not None:
+        return surf
+
+    surf = load_image(asset)
+    if size is not None:
+        surf = pygame.transform.scale(surf, size)
+    elif scale is not None:
+        iw, ih = surf.get_size()
+        surf = pygame.transform.scale(surf, (int(iw * scale), int(ih * scale)))
+    if zoom != 1.0:
+        surf = pygame.transform.rotozoom(surf, 0, zoom)
+    if flip:
+        surf = pygame.transform.flip(surf, True, False)
+    if tint or flash:
+        mask = pygame.mask.from_surface(surf)
+        surf = surf.copy()
+        for color in (tint, flash):
+            if color:
+                surf.blit(mask.to_surface(setcolor=color, unsetcolor=(0, 0, 0, 0)), (0, 0))
+
+    _SPRITES[key] = surf
+    return surf
+
+
+def faded(surf, alpha):
+    """
+    Copie de `surf` dont l'alpha est multiplié par alpha/255 (flash du boss),
+    quantifiée sur FADE_STEPS niveaux et mise en cache.
+    """
+    level = max(0, min(FADE_STEPS, round(alpha * FADE_STEPS / 255)))
+    key = (surf, level)
+    out = _FADES.get(key)
+    if out is None:
+        a = level * 255 // FADE_STEPS
+        out = surf.copy()
+        out.fill((255, 255, 255, a), special_flags=pygame.BLEND_RGBA_MULT)
+        _FADES[key] = out
+    return out
+
+
+def zoomed(surf, zoom):
+    """Rotozoom (sans rotation) de `surf`, calculé une fois par zoom."""
+    if zoom == 1:
+        return surf
+    key = (surf, zoom)
+    out = _ZOOMS.get(key)
+    if out is None:
+        out = _ZOOMS[key] = pygame.transform.rotozoom(surf, 0, zoom)
+    return out
+
+
+def get_disc(radius, color):
+    """Disque plein partagé (orbes d'XP, boules de feu), dessiné une fois."""
+    key = (radius, color)
+    surf = _DISCS.get(key)
+    if surf is None:
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (radius, radius), radius)
+        _DISCS[key] = surf
+    return surf
+
+
+def quantise_angle(angle, step=ROTATION_STEP):
+    return round(angle / step) * step % 360
+
+
+def get_rotated(asset, angle, scale=1.0, step=ROTATION_STEP):
+    """Rotozoom de l'asset, pré-calculé par pas de `step` degrés."""
+    key = (asset, quantise_angle(angle, step), scale)
+    surf = _ROTATED.get(key)
+    if surf is None:
+        surf = pygame.transform.rotozoom(load_image(asset), key[1], scale)
+        _ROTATED[key] = surf
+    return surf
+
+
+def get_cone(length, half_angle, angle, color, step=ROTATION_STEP):
+    """
+    Cône (triangle apex + deux bords de `length` px autour de `angle`, en
+    degrés, y vers le haut) pré-calculé par pas de `step` degrés. Renvoie
+    (surface, (ax, ay)) : position de l'apex dans la surface, à soustraire
+    de la position écran de l'apex pour le blit.
+    """
+    key = (length, half_angle, quantise_angle(angle, step), color)
+    cone = _CONES.get(key)
+    if cone is None:
+        a = key[2]
+        points = [(0.0, 0.0)]
+        for edge in (a - half_angle, a + half_angle):
+            rad = math.radians(edge)
+            points.append((math.cos(rad) * length, -math.sin(rad) * length))
+        x0 = math.floor(min(x for x, _ in points))
+        y0 = math.floor(min(y for _, y in points))
+        w  = math.ceil(max(x for x, _ in points)) - x0 + 1
+        h  = math.ceil(max(y for _, y in points)) - y0 + 1
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.polygon(surf, color, [(x - x0, y - y0) for x, y in points])
+        cone = _CONES[key] = (surf, (-x0, -y0))
+    return cone
+
+
+def clear_cache():
+    """Vide le registre (changement de mode vidéo, tests)."""
+    _RAW.clear()
+    _SPRITES.clear()
+    _FADES.clear()
+    _ZOOMS.clear()
+    _DISCS.clear()
+    _ROTATED.clear()
+    _CONES.clear()
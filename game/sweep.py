@@ -0,0 +1,180 @@
+# sweep.py
+"""
+Balayage de paramètres d'équilibrage sur des runs headless.
+
+Chaque run est une Simulation à graine fixe pilotée par le Bot, jusqu'au
+game over ou `max_time` secondes simulées. Les combinaisons de la grille
+× les graines sont réparties sur un ProcessPoolExecutor (un worker par
+cœur) puis agrégées par combinaison : survie, niveau atteint, kills et
+coût moyen d'un pas de simulation.
+
+    python -m game.sweep base_max_enemies=5,8,12 per_level_enemies=1,2,3
+    python -m game.sweep xp_growth=1.12,1.18,1.25 upgrade.Haste=20,30,45 --seeds 8 --out sweep.csv
+
+Paramètres : ceux de SIM_PARAMS (attributs de Simulation), xp_growth et
+level_damage (Player.XP_GROWTH / LEVEL_DAMAGE), upgrade.<Nom> (valeur de
+Player.UPGRADE_INFO, espaces remplacés par des _).
+"""
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from .simulation import Simulation
+from .timestep import SIM_HZ
+from .bot import Bot
+
+SIM_PARAMS = (
+    "base_max_enemies", "per_level_enemies", "base_spawn_interval",
+    "spawn_time_scale", "spawn_level_factor", "min_spawn_interval", "mage_spawn_chance",
+)
+PLAYER_PARAMS = {"xp_growth": "XP_GROWTH", "level_damage": "LEVEL_DAMAGE"}
+MAX_TIME = 300.0   # s simulées par run au plus
+SEEDS    = 4
+METRICS  = ("survival", "died", "level", "kills", "step_ms")
+
+
+def apply_params(sim, params):
+    """Applique `params` (nom -> valeur) à une simulation neuve, sans toucher aux classes."""
+    player = sim.player
+    for name, value in params.items():
+        if name in SIM_PARAMS:
+            setattr(sim, name, value)
+        elif name in PLAYER_PARAMS:
+            setattr(player, PLAYER_PARAMS[name], value)
+        elif name.startswith("upgrade."):
+            key = name[len("upgrade."):].replace("_", " ")
+            if key not in player.UPGRADE_INFO:
+                raise KeyError(f"amélioration inconnue : {key}")
+            # copie propre au joueur de ce run
+            info = {k: dict(v) for k, v in player.UPGRADE_INFO.items()}
+            info[key]["value"] = value
+            player.UPGRADE_INFO = info
+        else:
+            raise KeyError(f"paramètre inconnu : {name}")
+
+
+def run_one(params, seed, max_time=MAX_TIME, dt=1 / SIM_HZ):
+    """Un run headless piloté par le bot ; renvoie ses mesures."""
+    sim = Simulation(seed=seed)
+    apply_params(sim, params)
+    bot = Bot(seed)
+    steps, busy = 0, 0.0
+    while not sim.game_over and sim.time < max_time:
+        inputs = bot.act(sim)
+        t0 = time.perf_counter()
+        sim.step(dt, inputs)
+        busy  += time.perf_counter() - t0
+        steps += 1
+    return {
+        "params":   params,
+        "seed":     seed,
+        "survival": sim.survival_time if sim.game_over else sim.time,
+        "died":     sim.game_over,
+        "level":    sim.player.level,
+        "kills":    sim.kills,
+        "step_ms":  busy / max(steps, 1) * 1000,
+    }
+
+
+def _run_job(job):
+    return run_one(*job)
+
+
+def parse_grid(specs):
+    """["a=1,2", "b=0.5"] -> {"a": [1, 2], "b": [0.5]}"""
+    grid = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if not values:
+            raise ValueError(f"attendu nom=v1,v2,… : {spec!r}")
+        grid[name] = [_number(v) for v in values.split(",")]
+    return grid
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def combinations(grid):
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def sweep(grid, seeds=SEEDS, max_time=MAX_TIME, workers=None, dt=1 / SIM_HZ):
+    """
+    Tous les runs (combinaisons × graines). `workers` : taille du pool de
+    processus (défaut : un par cœur) ; 0 exécute tout dans ce processus.
+    """
+    jobs = [(params, seed, max_time, dt)
+            for params in combinations(grid) for seed in range(seeds)]
+    if workers == 0:
+        return [_run_job(job) for job in jobs]
+    workers = workers or os.cpu_count() or 1
+    chunk   = max(1, len(jobs) // (4 * workers))   # quelques lots par worker
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_job, jobs, chunksize=chunk))
+
+
+def aggregate(runs):
+    """Moyennes par combinaison, dans l'ordre de la grille."""
+    groups = {}
+    for run in runs:
+        groups.setdefault(tuple(run["params"].items()), []).append(run)
+    rows = []
+    for key, group in groups.items():
+        row = dict(key)
+        row["runs"] = len(group)
+        for m in METRICS:
+            row[m] = sum(float(r[m]) for r in group) / len(group)
+        rows.append(row)
+    return rows
+
+
+def print_table(rows, names, out=None):
+    out = out or sys.stdout
+    header = [*names, "runs", "survival s", "died %", "level", "kills", "step ms"]
+    cells = [[*(str(row[n]) for n in names), str(row["runs"]),
+              f"{row['survival']:.1f}", f"{row['died'] * 100:.0f}",
+              f"{row['level']:.1f}", f"{row['kills']:.1f}", f"{row['step_ms']:.3f}"]
+             for row in rows]
+    widths = [max(len(h), *(len(c[i]) for c in cells)) for i, h in enumerate(header)]
+    print(" | ".join(h.rjust(w) for h, w in zip(header, widths)), file=out)
+    print("-+-".join("-" * w for w in widths), file=out)
+    for c in cells:
+        print(" | ".join(v.rjust(w) for v, w in zip(c, widths)), file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("params", nargs="*", help="nom=v1,v2,… (une dimension de la grille)")
+    parser.add_argument("--seeds",    type=int,   default=SEEDS)
+    parser.add_argument("--max-time", type=float, default=MAX_TIME)
+    parser.add_argument("--workers",  type=int,   default=None)
+    parser.add_argument("--out",      default=None, help="CSV du tableau agrégé")
+    args = parser.parse_args(argv)
+
+    grid = parse_grid(args.params)
+    t0 = time.perf_counter()
+    rows = aggregate(sweep(grid, args.seeds, args.max_time, args.workers))
+    print_table(rows, list(grid))
+    print(f"\n{sum(r['runs'] for r in rows)} runs en {time.perf_counter() - t0:.1f} s")
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=[*grid, "runs", *METRICS])
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"→ {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# timestep.py
+"""
+Pas de simulation fixe, découplé du rendu.
+
+Le temps réel de chaque frame s'accumule ; la simulation avance par pas
+constants (SIM_HZ) tant qu'il en reste, au plus MAX_STEPS par frame : un
+gros à-coup (chargement, GC…) est abandonné au lieu de faire boule de
+neige. `alpha` (fraction du pas suivant déjà écoulée) sert au rendu pour
+interpoler les positions entre les deux derniers pas.
+"""
+
+SIM_HZ    = 120
+MAX_STEPS = 8     # rattrapage max par frame (~66 ms à 120 Hz)
+
+
+class FixedTimestep:
+    def __init__(self, hz=SIM_HZ, max_steps=MAX_STEPS):
+        self.dt          = 1.0 / hz
+        self.max_steps   = max_steps
+        self.accumulator = 0.0
+        self.dropped     = 0.0   # temps abandonné (s), pour le diagnostic
+
+    def advance(self, frame_dt):
+        """Ajoute `frame_dt` secondes et renvoie le nombre de pas à simuler."""
+        self.accumulator += frame_dt
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # à-coup : on simule max_steps pas, le retard restant est perdu
+            steps = self.max_steps
+            self.dropped    += self.accumulator - steps * self.dt
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.dt
@@ -1,33 +1,133 @@
 import pygame
 import math
-import os
-from .utils import resource_path
+from .sounds import get_sound
+from .sprites import get_disc
+from .pool import Pool, compact
+from .enemy_store import Stored
+
+# Fusion des orbes proches (toutes les MERGE_INTERVAL s) et plafond global
+MERGE_RADIUS   = 48
+MERGE_INTERVAL = 0.5
+MAX_ORBS       = 300
+
+# Attraction vers le joueur (hors aimant)
+ATTRACT_RADIUS = 200   # px à partir desquels l’orb s’attire
+ATTRACT_SPEED  = 300   # px/s
+PICKUP_SOUND   = "fx/xp_orb.mp3"
 
 class XPOrb:
-    def __init__(self, x, y, value):
-        self.value = value
-        pickup_path = resource_path("fx/xp_orb.mp3")
-        self.pickup_sound = pygame.mixer.Sound(pickup_path)
+    # valeur redirigée vers l'OrbStore quand l'orbe y est rattachée
+    _store = None
+    _slot  = None
+    value  = Stored("value")
 
+    # paliers de taille selon la valeur : (valeur min, rayon, couleur)
+    TIERS = (
+        (150, 15, (255, 120, 40)),
+        (40,  12, (255, 170, 20)),
+        (10,  10, (255, 200, 0)),
+        (0,    8, (255, 215, 0)),
+    )
 
-        self.image = pygame.Surface((16, 16), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (255, 215, 0), (8, 8), 8)
-        self.rect = self.image.get_rect(center=(x, y))
+    def __init__(self, x, y, value):
+        # son et images partagés par tous les orbes (créés une seule fois)
+        self.pickup_sound = get_sound(PICKUP_SOUND)
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, value)
+
+    def reset(self, x, y, value):
+        """Réinitialise l'orbe (création ou recyclage via POOL)."""
+        self.set_value(value)
+        self.rect.center = (x, y)
+        self.fx, self.fy = self.rect.topleft
 
         # attraction
-        self.attract_radius      = 200   # px à partir desquels l’orb s’attire
+        self.attract_radius      = ATTRACT_RADIUS
         self.base_attract_radius = self.attract_radius
-        self.attract_speed       = 300   # px/s
+        self.attract_speed       = ATTRACT_SPEED
         self.base_attract_speed  = self.attract_speed
 
+    def set_value(self, value):
+        """Change la valeur et le palier visuel, centre conservé."""
+        self.value = value
+        for threshold, radius, color in self.TIERS:
+            if value >= threshold:
+                break
+        center = self.rect.center
+        self.image = get_disc(radius, color)
+        self.rect.size = self.image.get_size()
+        self.rect.center = center
+        self.fx, self.fy = self.rect.topleft
+
     def update(self, dt, player_pos):
         dx = player_pos[0] - self.rect.centerx
         dy = player_pos[1] - self.rect.centery
         dist = math.hypot(dx, dy)
         # si dans le rayon d’attraction, on se rapproche
         if 0 < dist < self.attract_radius:
+            if self.rect.topleft != (round(self.fx), round(self.fy)):
+                self.fx, self.fy = self.rect.topleft
             nx, ny = dx / dist, dy / dist
-            self.rect.x += nx * self.attract_speed * dt
-            self.rect.y += ny * self.attract_speed * dt
+            self.fx += nx * self.attract_speed * dt
+            self.fy += ny * self.attract_speed * dt
+            self.rect.topleft = (round(self.fx), round(self.fy))
+
+    def sprite(self, cam_x, cam_y):
+        return self.image, (self.rect.x - cam_x, self.rect.y - cam_y)
+
     def draw(self, surface, cam_x, cam_y):
         surface.blit(self.image, (self.rect.x - cam_x, self.rect.y - cam_y))
+
+
+# orbes recyclées entre deux morts
+POOL = Pool(XPOrb)
+
+
+def merge_orbs(orbs, grid, radius=MERGE_RADIUS, pool=POOL):
+    """
+    Fusionne (en place, liste ou OrbStore) les orbes à moins de `radius` px l'un de l'autre :
+    la première orbe d'un groupe absorbe les autres, prend la somme des
+    valeurs et se place au barycentre pondéré. Renvoie le nombre d'orbes
+    absorbées (rendues à `pool`).
+    """
+    if len(orbs) < 2:
+        return 0
+    grid.rebuild(orbs)
+    absorbed = set()
+    r2 = radius * radius
+    for orb in orbs:
+        if orb in absorbed:
+            continue
+        cx, cy = orb.rect.center
+        total = orb.value
+        sx, sy = cx * total, cy * total
+        for other in grid.query_radius(cx, cy, radius):
+            if other is orb or other in absorbed:
+                continue
+            ox, oy = other.rect.center
+            if (ox - cx) ** 2 + (oy - cy) ** 2 <= r2:
+                absorbed.add(other)
+                total += other.value
+                sx += ox * other.value
+                sy += oy * other.value
+        if total != orb.value:
+            orb.set_value(total)
+            if total > 0:
+                orb.rect.center = (round(sx / total), round(sy / total))
+                orb.fx, orb.fy = orb.rect.topleft
+    keep = lambda o: o not in absorbed
+    if isinstance(orbs, list):
+        return compact(orbs, keep, pool)
+    return orbs.compact(keep, pool)   # OrbStore
+
+
+def bound_orbs(orbs, grid, cap=MAX_ORBS, radius=MERGE_RADIUS, pool=POOL):
+    """
+    Fusion normale, puis rayon doublé tant qu'il reste plus de `cap`
+    orbes : le nombre d'orbes vivantes (et donc leur coût) reste borné.
+    """
+    merged = merge_orbs(orbs, grid, radius, pool)
+    while len(orbs) > cap:
+        radius *= 2
+        merged += merge_orbs(orbs, grid, radius, pool)
+    return merged
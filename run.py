@@ -1,5 +1,17 @@
+import sys
 import pygame.freetype   # force PyInstaller à embarquer pygame.freetype
 from game.main import main
 
+
+def option(name):
+    """Valeur de `--name VALEUR` sur la ligne de commande, sinon None."""
+    if name in sys.argv[:-1]:
+        return sys.argv[sys.argv.index(name) + 1]
+    return None
+
+
 if __name__ == "__main__":
-    main()
+    seed = option("--seed")
+    main(stress="--stress" in sys.argv, profile_csv=option("--profile-csv"),
+         pipeline="--pipeline" in sys.argv, seed=int(seed) if seed is not None else None,
+         record=option("--record"), replay=option("--replay"))
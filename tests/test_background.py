@@ -0,0 +1,42 @@
+import pygame
+from game.background import TiledBackground, get_background
+
+def make_tile(w, h):
+    tile = pygame.Surface((w, h))
+    for x in range(w):
+        for y in range(h):
+            tile.set_at((x, y), (x * 7 % 256, y * 5 % 256, (x + y) % 256))
+    return tile
+
+def per_tile_reference(surf, cx, cy, tile):
+    """Ancienne version : un blit par tuile visible."""
+    bw, bh = tile.get_size()
+    sw, sh = surf.get_size()
+    y = -(cy % bh) - bh
+    while y < sh:
+        x = -(cx % bw) - bw
+        while x < sw:
+            surf.blit(tile, (x, y))
+            x += bw
+        y += bh
+
+def test_matches_per_tile_blits():
+    tile = make_tile(37, 23)
+    bg = TiledBackground(tile, 120, 90)
+    for cx, cy in [(0, 0), (15, 20), (-50, -75), (1000, 999), (36, 22)]:
+        a = pygame.Surface((120, 90)); b = pygame.Surface((120, 90))
+        bg.draw(a, cx, cy)
+        per_tile_reference(b, cx, cy, tile)
+        assert pygame.image.tostring(a, "RGB") == pygame.image.tostring(b, "RGB")
+
+def test_single_blit_per_frame():
+    class Counter:
+        calls = 0
+        def blit(self, *args):
+            Counter.calls += 1
+    get_background(make_tile(8, 8), 200, 100).draw(Counter(), 123, 45)
+    assert Counter.calls == 1
+
+def test_layer_is_shared_per_tile():
+    tile = make_tile(16, 16)
+    assert get_background(tile, 64, 64) is get_background(tile, 64, 64)
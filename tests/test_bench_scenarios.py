@@ -0,0 +1,10 @@
+import pytest
+from benchmarks.bench_scenarios import SCENARIOS, run_scenario
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+def test_scenario_runs_and_reports(name):
+    """Chaque scénario tourne (quelques frames) et produit des mesures JSON."""
+    r = run_scenario(name, frames=3, warmup=1)
+    assert r["frames"] == 3 and r["entities"] > 0
+    assert r["fps"] > 0 and r["p50_ms"] <= r["p99_ms"] <= r["max_ms"]
+    assert "alloc_peak_kb" in r
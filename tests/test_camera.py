@@ -1,5 +1,8 @@
+import pygame
 import pytest
 from game.settings import WIDTH, HEIGHT, MAP_WIDTH, MAP_HEIGHT
+from game.camera import Camera
+from game.spatial import SpatialHash
 
 def clamp_camera(px, py):
     """Reproduit la logique de clamp de la caméra du main loop."""
@@ -26,3 +29,54 @@ def test_camera_clamp_out_of_bounds(px, py):
     cam_x, cam_y = clamp_camera(px, py)
     assert 0 <= cam_x <= MAP_WIDTH - WIDTH
     assert 0 <= cam_y <= MAP_HEIGHT - HEIGHT
+
+
+class Thing:
+    def __init__(self, x, y, size=40):
+        self.rect = pygame.Rect(x, y, size, size)
+
+@pytest.mark.parametrize("px,py", [
+    (0, 0), (MAP_WIDTH, MAP_HEIGHT), (1234, 777), (-100, MAP_HEIGHT + 100),
+])
+def test_camera_follow_matches_clamp(px, py):
+    cam = Camera()
+    target = pygame.Rect(0, 0, 10, 10)
+    target.center = (px, py)
+    assert cam.follow(target) == clamp_camera(target.centerx, target.centery)
+
+def test_camera_culls_offscreen_and_counts():
+    cam = Camera()
+    cam.follow(pygame.Rect(MAP_WIDTH // 2, MAP_HEIGHT // 2, 0, 0))
+    inside  = Thing(cam.x + 100, cam.y + 100)
+    edge    = Thing(cam.x - 30, cam.y + 200)       # déborde à gauche : visible
+    outside = Thing(cam.x + WIDTH + 200, cam.y)
+    cam.begin_frame()
+    assert cam.visible([inside, edge, outside]) == [inside, edge]
+    assert (cam.drawn, cam.culled) == (2, 1)
+
+def test_camera_visible_with_grid_keeps_list_order():
+    """Deux ennemis superposés de part et d'autre d'une frontière de cellule."""
+    cam = Camera()
+    cam.follow(pygame.Rect(0, 0, 0, 0))
+    front, back = Thing(130, 100), Thing(90, 100)    # centres en cellule 1 puis 0
+    things = [front, back]
+    grid = SpatialHash(cell_size=128)
+    grid.rebuild(things)
+    assert cam.visible(things, grid) == [front, back]
+    # l'un franchit la frontière : l'ordre de dessin ne bouge pas
+    front.rect.x, back.rect.x = 90, 130
+    grid.rebuild(things)
+    assert cam.visible(things, grid) == [front, back]
+
+def test_camera_visible_with_grid_is_region_query():
+    cam = Camera()
+    cam.follow(pygame.Rect(MAP_WIDTH // 2, MAP_HEIGHT // 2, 0, 0))
+    things = [Thing(x, y) for x in range(0, MAP_WIDTH, 150) for y in range(0, MAP_HEIGHT, 150)]
+    grid = SpatialHash()
+    grid.rebuild(things)
+    cam.begin_frame()
+    via_grid = cam.visible(things, grid)
+    cam.begin_frame()
+    via_scan = cam.visible(things)
+    assert {id(t) for t in via_grid} == {id(t) for t in via_scan}
+    assert cam.culled == len(things) - len(via_scan) > 0
@@ -0,0 +1,36 @@
+import math
+import random
+import numpy as np
+import pytest
+from game.combat import cone_hits
+
+def reference_hits(ox, oy, angle, half, rng, pts):
+    """Ancienne boucle de Player.attack, cible par cible."""
+    out = []
+    for i, (x, y, r) in enumerate(pts):
+        dx, dy = x - ox, y - oy
+        dist = math.hypot(dx, dy)
+        if dist - r <= rng:
+            a2e = math.degrees(math.atan2(-dy, dx)) % 360
+            if abs((angle - a2e + 180) % 360 - 180) <= half:
+                out.append(i)
+    return out
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cone_hits_matches_per_enemy_loop(seed):
+    rnd = random.Random(seed)
+    pts = [(rnd.randint(-400, 400), rnd.randint(-400, 400), rnd.choice((0, 5, 40)))
+           for _ in range(300)]
+    angle = rnd.uniform(0, 360)
+    xs, ys, rs = (np.array(c, dtype=float) for c in zip(*pts))
+    got = cone_hits(0, 0, angle, 45, 150, xs, ys, rs)
+    assert list(got) == reference_hits(0, 0, angle, 45, 150, pts)
+
+def test_cone_hits_wraps_around_zero_degrees():
+    # cône vers la droite (0°) : cibles juste au-dessus et juste en dessous
+    xs = np.array([100.0, 100.0, -100.0])
+    ys = np.array([-10.0, 10.0, 0.0])
+    assert list(cone_hits(0, 0, 0, 45, 150, xs, ys)) == [0, 1]
+
+def test_cone_hits_empty():
+    assert len(cone_hits(0, 0, 0, 45, 150, np.array([]), np.array([]))) == 0
@@ -11,9 +11,9 @@ def test_enemy_hp_by_tier():
     assert e_normal.max_hp < e_rare.max_hp < e_elite.max_hp
 
 def test_goblin_mage_init():
-    """Le GoblinMage doit avoir des PV, dégâts et la liste de projectiles."""
+    """Le GoblinMage doit avoir des PV, dégâts et un gestionnaire de projectiles."""
     gm = GoblinMage(50, 50)
-    assert hasattr(gm, 'projectiles')
+    assert hasattr(gm, 'projectile_manager')
     assert gm.max_hp > 0
     assert gm.damage > 0
 
@@ -0,0 +1,64 @@
+import pytest
+from game.enemy import Enemy
+from game.enemy_store import EnemyStore
+
+def make_pair(x, y, **kw):
+    return Enemy(x, y, **kw), Enemy(x, y, **kw)
+
+def test_store_step_matches_enemy_update():
+    """Le pas vectorisé donne les mêmes positions/timers que Enemy.update."""
+    store = EnemyStore(capacity=2)   # force aussi un agrandissement
+    solo, stored = [], []
+    for i, (x, y) in enumerate([(100, 100), (900, 400), (500, 1500), (1400, 1400)]):
+        a, b = make_pair(x, y, speed=60, tier=('normal', 'rare')[i % 2], player_level=3)
+        if i == 1:
+            a.slow_timer = b.slow_timer = 0.5
+        if i == 2:
+            a.pause_timer = b.pause_timer = 0.3
+        solo.append(a)
+        stored.append(store.add(b))
+    player = (1000, 1000)
+    for _ in range(30):
+        for e in solo:
+            e.update(player, 1 / 60)
+        store.step(player, 1 / 60)
+    for a, b in zip(solo, stored):
+        assert abs(a.rect.x - b.rect.x) <= 1 and abs(a.rect.y - b.rect.y) <= 1
+        assert b.slow_timer == pytest.approx(a.slow_timer)
+        assert b.pause_timer == pytest.approx(a.pause_timer)
+        assert b.image is a.image
+
+def test_views_read_and_write_store():
+    store = EnemyStore()
+    e = store.add(Enemy(100, 100))
+    e.hp -= 3
+    assert store.columns["hp"][e._slot] == e.max_hp - 3
+    e.slow_timer = 2.0
+    assert store.columns["slow"][e._slot] == 2.0
+
+def test_remove_swaps_last_and_detaches():
+    store = EnemyStore()
+    a, b, c = (store.add(Enemy(x, 100)) for x in (100, 200, 300))
+    c.hp = 1
+    store.remove(a)
+    assert store.enemies == [c, b]
+    assert c._slot == 0 and c.hp == 1
+    # a garde son état une fois détaché
+    a.hp = 42
+    assert a.hp == 42 and a._store is None
+
+def test_external_rect_move_is_picked_up():
+    """Un rect déplacé par la séparation n'est pas écrasé au pas suivant."""
+    store = EnemyStore()
+    e = store.add(Enemy(100, 100, speed=0, player_level=0))
+    e.rect.x += 30
+    store.step((100, 100), 0.0)
+    assert e.rect.x == 100 - e.rect.width // 2 + 30
+
+def test_slow_movement_is_not_truncated():
+    """Un déplacement < 1 px par frame finit par faire avancer l'ennemi."""
+    e = Enemy(100, 100, speed=10, player_level=0)
+    x0 = e.rect.x
+    for _ in range(60):
+        e.update((2000, e.rect.centery), 1 / 60)
+    assert e.rect.x - x0 == pytest.approx(10, abs=1)
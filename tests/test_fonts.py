@@ -0,0 +1,33 @@
+import pygame
+import pygame.freetype
+import pytest
+from game import fonts
+
+@pytest.fixture(autouse=True)
+def fonts_ready():
+    # d'autres modules de tests appellent pygame.quit()
+    pygame.font.init()
+    pygame.freetype.init()
+    fonts.clear_cache()
+    yield
+
+def test_get_font_opens_each_face_once():
+    a = fonts.get_font(fonts.CINZEL, 24)
+    assert fonts.get_font(fonts.CINZEL, 24) is a
+    assert fonts.get_font(fonts.CINZEL, 20) is not a
+    ft = fonts.get_font(fonts.CINZEL, 24, freetype=True)
+    assert isinstance(ft, pygame.freetype.Font)
+    assert isinstance(fonts.get_font(None, 48), pygame.font.Font)
+
+def test_render_text_is_cached_per_text_and_colour():
+    font = fonts.get_font(fonts.CINZEL, 24, freetype=True)
+    s1 = fonts.render_text(font, "Level: 3", (255, 255, 255))
+    assert fonts.render_text(font, "Level: 3", (255, 255, 255)) is s1
+    assert fonts.render_text(font, "Level: 4", (255, 255, 255)) is not s1
+    assert fonts.render_text(font, "Level: 3", (255, 0, 0)) is not s1
+    assert s1.get_width() > 0
+
+def test_render_text_with_pygame_font():
+    font = fonts.get_font(None, 48)
+    surf = fonts.render_text(font, "GAME OVER", (255, 255, 255))
+    assert surf.get_size() == font.size("GAME OVER")
@@ -1,7 +1,7 @@
 import pytest
 import pygame
 from game.goblin_mage import GoblinMage
-from game.projectile import Fireball
+from game.projectile_manager import ProjectileManager
 from game.player import Player
 
 @pytest.fixture
@@ -11,10 +11,10 @@ def player():
     return p
 
 def test_goblin_mage_init():
-    """Le GoblinMage doit être initialisé avec des PV, dégâts et une liste vide de projectiles."""
+    """Le GoblinMage doit être initialisé avec des PV, dégâts et un gestionnaire de projectiles vide."""
     gm = GoblinMage(50, 50)
-    assert hasattr(gm, 'projectiles')
-    assert isinstance(gm.projectiles, list) and gm.projectiles == []
+    assert isinstance(gm.projectile_manager, ProjectileManager)
+    assert len(gm.projectile_manager) == 0
     assert gm.max_hp > 0 and gm.hp == gm.max_hp
     assert hasattr(gm, 'damage') and gm.damage > 0
 
@@ -30,29 +30,27 @@ def test_goblin_mage_fire_cooldown(player):
 
     # 1) Premier update → tir
     gm.update(player, dt=0.1, cam_x=gm.rect.x, cam_y=gm.rect.y)
-    assert len(gm.projectiles) == 1
+    assert len(gm.projectile_manager) == 1
 
     # 2) update immédiat → pas de tir (cooldown)
     gm.update(player, dt=0.1, cam_x=gm.rect.x, cam_y=gm.rect.y)
-    assert len(gm.projectiles) == 1
+    assert len(gm.projectile_manager) == 1
 
     # 3) simuler expiration du cooldown
     gm.fire_timer = 0.0
     gm.update(player, dt=0, cam_x=gm.rect.x, cam_y=gm.rect.y)
-    assert len(gm.projectiles) == 2
+    assert len(gm.projectile_manager) == 2
 
-def test_fireball_off_screen_removal(player, monkeypatch):
+def test_fireball_off_screen_removal(player):
     """
-    Si un Fireball.off_screen() devient True, il doit être retiré de gm.projectiles.
+    Une boule de feu sortie de la map est retirée au pas suivant du gestionnaire.
     """
-    gm = GoblinMage(player.rect.centerx, player.rect.centery)
-    # Empêcher tout nouveau tir
-    gm.fire_timer = gm.fire_cooldown
-
-    # Créer une fireball et forcer off_screen → True
-    fb = Fireball(gm.rect.centerx, gm.rect.centery, player.rect.center)
-    monkeypatch.setattr(fb, 'off_screen', lambda: True)
-
-    gm.projectiles = [fb]
+    pm = ProjectileManager()
+    gm = GoblinMage(player.rect.centerx, player.rect.centery, pm)
+    gm.fire_timer = 0.0
+    # un tir, puis on le place hors de la map
     gm.update(player, dt=0.1, cam_x=gm.rect.x, cam_y=gm.rect.y)
-    assert fb not in gm.projectiles
+    assert len(pm) == 1
+    pm.columns["x"][0] = -50
+    pm.step(0.1)
+    assert len(pm) == 0
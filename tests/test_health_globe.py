@@ -0,0 +1,32 @@
+import pygame
+import pytest
+from game.health_globe import HealthGlobe
+
+@pytest.fixture
+def globe():
+    tex = pygame.Surface((10, 10)); tex.fill((200, 0, 0))
+    orn = pygame.Surface((14, 14), pygame.SRCALPHA)
+    return HealthGlobe(tex, orn, radius=30)
+
+def test_recomposes_only_when_level_changes(globe, monkeypatch):
+    calls = []
+    compose = globe.compose
+    monkeypatch.setattr(globe, "compose", lambda lvl: (calls.append(lvl), compose(lvl)))
+    surf = pygame.Surface((200, 200))
+    globe.draw(surf, 100, 100, 0.5)
+    globe.draw(surf, 100, 100, 0.5)
+    globe.draw(surf, 100, 100, 0.5 + 1e-4)   # même niveau quantifié
+    assert len(calls) == 1
+    globe.draw(surf, 100, 100, 0.25)
+    assert len(calls) == 2
+
+def test_fill_level_follows_hp(globe):
+    surf = pygame.Surface((200, 200)); surf.fill((0, 0, 255))
+    globe.draw(surf, 100, 100, 0.5)
+    # moitié basse remplie de liquide rouge, moitié haute non
+    assert surf.get_at((100, 115))[:3] == (200, 0, 0)
+    assert surf.get_at((100, 85))[0] < 100
+
+def test_quantise_bounds(globe):
+    assert globe.quantise(-1) == 0
+    assert globe.quantise(2) == HealthGlobe.LEVELS - 1
@@ -0,0 +1,45 @@
+import pygame
+import pytest
+
+from game.hp_bars import bar_sprite, get_strip, BOSS_BAR
+from game.enemy import Enemy
+from game.goblin_mage import GoblinMage
+
+
+def reference_bar(surface, obj, cam_x, cam_y, fill=(0, 200, 0), offset=7):
+    """Ancien dessin : fond puis remplissage en draw.rect."""
+    x, y, w = obj.rect.x - cam_x, obj.rect.y - cam_y - offset, obj.rect.width
+    pygame.draw.rect(surface, (100, 0, 0), (x, y, w, 5))
+    pygame.draw.rect(surface, fill, (x, y, int(w * max(obj.hp, 0) / obj.max_hp), 5))
+
+@pytest.mark.parametrize("ratio", [0.0, 0.01, 0.37, 0.5, 0.99])
+def test_strip_window_matches_primitive_bar(ratio):
+    e = Enemy(150, 150, speed=0)
+    e.hp = e.max_hp * ratio
+    a, b = pygame.Surface((300, 300)), pygame.Surface((300, 300))
+    reference_bar(a, e, 10, 20)
+    b.blit(*bar_sprite(e, 10, 20))
+    assert pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+
+def test_full_hp_has_no_bar():
+    e = Enemy(150, 150, speed=0)
+    assert bar_sprite(e, 0, 0) is None
+    e.hp = -5
+    strip, pos, area = bar_sprite(e, 0, 0)
+    assert area[0] == e.rect.width   # fenêtre entièrement sur le fond
+
+def test_one_strip_per_style():
+    assert get_strip(80, 5, *BOSS_BAR) is get_strip(80, 5, *BOSS_BAR)
+    assert get_strip(80, 5, *BOSS_BAR).get_size() == (160, 5)
+
+def test_mage_bar_only_when_damaged():
+    mage = GoblinMage(100, 100)
+    calls = []
+    class Spy:
+        def blit(self, *args):
+            calls.append(args)
+    mage.draw_body(Spy(), 0, 0)
+    assert len(calls) == 1
+    mage.hp = mage.max_hp / 2
+    mage.draw_body(Spy(), 0, 0)
+    assert len(calls) == 3 and len(calls[-1]) == 3
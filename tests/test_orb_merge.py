@@ -0,0 +1,31 @@
+import random
+from game.spatial import SpatialHash
+from game.xp_orb import XPOrb, merge_orbs, bound_orbs, MERGE_RADIUS
+
+def test_nearby_orbs_merge_and_keep_total_value():
+    orbs = [XPOrb(100, 100, 3), XPOrb(110, 100, 5), XPOrb(1000, 1000, 2)]
+    merged = merge_orbs(orbs, SpatialHash())
+    assert merged == 1 and len(orbs) == 2
+    big, far = orbs
+    assert big.value == 8 and far.value == 2
+    # barycentre pondéré par la valeur
+    assert abs(big.rect.centerx - (100 * 3 + 110 * 5) / 8) <= 1
+
+def test_far_orbs_are_left_alone():
+    orbs = [XPOrb(0, 0, 1), XPOrb(MERGE_RADIUS * 3, 0, 1)]
+    assert merge_orbs(orbs, SpatialHash()) == 0 and len(orbs) == 2
+
+def test_size_tier_grows_with_value():
+    orb = XPOrb(500, 500, 1)
+    small = orb.rect.width
+    orb.set_value(200)
+    assert orb.rect.width > small
+    assert orb.rect.center == (500, 500)
+    assert orb.image is XPOrb(0, 0, 999).image
+
+def test_cap_bounds_live_orbs():
+    rng = random.Random(3)
+    orbs = [XPOrb(rng.randint(0, 3000), rng.randint(0, 3000), 1) for _ in range(2000)]
+    bound_orbs(orbs, SpatialHash(), cap=100)
+    assert len(orbs) <= 100
+    assert sum(o.value for o in orbs) == 2000
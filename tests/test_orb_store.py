@@ -0,0 +1,63 @@
+import math
+import pygame
+from game.orb_store import OrbStore
+from game.xp_orb import XPOrb, merge_orbs
+from game.spatial import SpatialHash
+
+def test_store_step_matches_orb_update():
+    """Le pas vectorisé déplace les orbes comme XPOrb.update."""
+    store = OrbStore(capacity=2)   # force aussi un agrandissement
+    solo, stored = [], []
+    for x, y in [(100, 100), (250, 120), (900, 900), (160, 300)]:
+        solo.append(XPOrb(x, y, 1))
+        stored.append(store.add(XPOrb(x, y, 1)))
+    player = (200, 200)
+    for _ in range(12):
+        for o in solo:
+            o.update(1 / 60, player)
+        store.step(player, 1 / 60, 200, 300)
+    for a, b in zip(solo, stored):
+        assert abs(a.rect.x - b.rect.x) <= 1 and abs(a.rect.y - b.rect.y) <= 1
+    assert stored[2].rect.center == (900, 900)   # hors rayon : immobile
+
+def test_magnet_pulls_from_anywhere():
+    store = OrbStore()
+    far = store.add(XPOrb(2900, 2900, 1))
+    x0 = far.rect.x
+    store.step((100, 100), 0.1, math.inf, 900)
+    assert far.rect.x < x0
+
+def test_collect_sums_values_and_removes():
+    store = OrbStore()
+    rect = pygame.Rect(100, 100, 50, 50)
+    a = store.add(XPOrb(120, 120, 3))
+    b = store.add(XPOrb(500, 500, 4))
+    c = store.add(XPOrb(140, 110, 5))
+    assert store.collect(rect) == 8
+    assert store.orbs == [b] and b._slot == 0
+    assert a._store is None and a.value == 3
+    assert store.columns["value"][0] == 4
+
+def test_collect_sees_externally_moved_rects():
+    store = OrbStore()
+    o = store.add(XPOrb(1000, 1000, 2))
+    o.rect.center = (20, 20)
+    assert store.collect(pygame.Rect(0, 0, 40, 40)) == 2
+
+def test_merge_inside_store():
+    store = OrbStore()
+    for x in (100, 110, 120):
+        store.add(XPOrb(x, 100, 1))
+    assert merge_orbs(store, SpatialHash()) == 2
+    assert len(store) == 1 and store.orbs[0].value == 3
+    assert store.columns["value"][0] == 3
+
+def test_single_gain_xp_call_per_pickup():
+    from game.simulation import Simulation
+    sim = Simulation(seed=1)
+    calls = []
+    sim.player.gain_xp = calls.append
+    for _ in range(5):
+        sim.drop_orb(*sim.player.rect.center, 2)
+    sim.step(1 / 120)
+    assert calls == [10] and not sim.xp_orbs
@@ -0,0 +1,71 @@
+import pygame
+
+from game import sprites
+from game.overlays import HudLayer, draw_veil, get_veil
+from game.main import get_dash_bar
+
+
+def test_veil_is_reused_and_matches_srcalpha_fill():
+    a = pygame.Surface((40, 30)); a.fill((10, 120, 200))
+    b = a.copy()
+    draw_veil(a, (255, 0, 0), 100)
+    draw_veil(a, (255, 0, 0), 60)
+    assert get_veil((40, 30), (255, 0, 0, 99)) is get_veil((40, 30), (255, 0, 0))
+    for alpha in (100, 60):
+        ov = pygame.Surface((40, 30), pygame.SRCALPHA)
+        ov.fill((255, 0, 0, alpha))
+        b.blit(ov, (0, 0))
+    # alpha de surface ou par pixel : au plus une unité d'arrondi d'écart
+    assert all(abs(x - y) <= 1 for x, y in zip(a.get_at((5, 5)), b.get_at((5, 5))))
+
+def test_veil_with_zero_alpha_draws_nothing():
+    s = pygame.Surface((4, 4)); s.fill((1, 2, 3))
+    draw_veil(s, (255, 0, 0), 0)
+    assert s.get_at((0, 0))[:3] == (1, 2, 3)
+
+def test_zoomed_is_computed_once():
+    src = pygame.Surface((40, 20), pygame.SRCALPHA)
+    z = sprites.zoomed(src, 0.5)
+    assert z.get_size() == (20, 10)
+    assert sprites.zoomed(src, 0.5) is z
+    assert sprites.zoomed(src, 1) is src
+
+def test_hud_redraws_only_changed_pieces():
+    calls = []
+    def square(surf, value):
+        calls.append(value)
+        return pygame.draw.rect(surf, (255, 255, 255), (0, 0, value, 4))
+
+    hud = HudLayer((20, 10))
+    hud.base.fill((0, 0, 255, 255))
+    hud.add("bar", square)
+    hud.set("bar", 8)
+    screen = pygame.Surface((20, 10))
+    hud.draw(screen)
+    hud.draw(screen)
+    assert calls == [8]
+    # la valeur baisse : la partie découverte revient au décor de base
+    hud.set("bar", 3)
+    hud.set("bar", 3)
+    hud.draw(screen)
+    assert calls == [8, 3]
+    assert screen.get_at((2, 1))[:3] == (255, 255, 255)
+    assert screen.get_at((6, 1))[:3] == (0, 0, 255)
+
+def test_hud_base_change_redraws_everything():
+    calls = []
+    hud = HudLayer((10, 10))
+    hud.add("a", lambda surf, v: calls.append(v))
+    hud.set("a", 1)
+    hud.compose()
+    hud.base.fill((255, 0, 0, 255))
+    hud.invalidate()
+    assert hud.compose() == 1 and calls == [1, 1]
+    assert hud.layer.get_at((5, 5)) == (255, 0, 0, 255)
+
+def test_dash_bar_cached_per_fill():
+    bar = get_dash_bar(20)
+    assert get_dash_bar(20) is bar
+    assert bar.get_at((10, 4))[:3] == (0, 200, 200)
+    assert bar.get_at((30, 4))[:3] == (50, 50, 50)
+    assert bar.get_at((0, 0))[:3] == (255, 255, 255)
@@ -0,0 +1,70 @@
+from game.pool import Pool, compact
+from game.xp_orb import XPOrb, POOL as ORBS
+from game.projectile import Fireball
+from game.enemy import Enemy, POOL as ENEMIES
+from game.simulation import Simulation
+
+def test_acquire_reuses_released_instances():
+    pool = Pool(XPOrb)
+    a = pool.acquire(0, 0, 1)
+    pool.release(a)
+    b = pool.acquire(50, 60, 7)
+    assert b is a
+    assert b.rect.center == (50, 60) and b.value == 7
+    assert (pool.created, pool.reused) == (1, 1)
+
+def test_compact_keeps_order_and_releases():
+    pool = Pool(XPOrb)
+    items = list(range(10))
+    removed = compact(items, lambda x: x % 3, pool)
+    assert items == [1, 2, 4, 5, 7, 8]
+    assert removed == 4 and pool.free == [0, 3, 6, 9]
+
+def test_recycled_enemy_is_fully_reset():
+    e = Enemy(0, 0, tier='elite', player_level=9)
+    e.hp, e.slow_timer, e.flash_timer = 0, 2.0, 0.1
+    rect = e.rect
+    e.reset(300, 400, tier='normal', player_level=1)
+    assert e.rect is rect and e.rect.center == (300, 400)
+    assert e.rect.size == Enemy(0, 0).rect.size
+    assert e.hp == e.max_hp and e.slow_timer == 0 and e.flash_timer == 0
+    assert e.tint_color is None
+
+def test_shared_surfaces():
+    assert XPOrb(0, 0, 1).image is XPOrb(5, 5, 2).image
+    assert Fireball(0, 0, (1, 1)).image is Fireball(5, 5, (0, 0)).image
+
+def test_kills_recycle_enemies_and_orbs():
+    sim = Simulation(seed=11)
+    sim.player.next_level_xp = 10**9
+    for _ in range(3):
+        created = ENEMIES.created, ORBS.created
+        for k in range(20):
+            sim.add_enemy(ENEMIES.acquire(sim.player.rect.centerx + 300 + k, 100, speed=0))
+        for e in sim.enemy_list:
+            e.hp = 0
+        sim.step(1 / 120)
+        assert not sim.enemy_list and len(sim.xp_orbs) >= 20
+        for orb in sim.xp_orbs:
+            orb.rect.center = sim.player.rect.center
+        sim.step(1 / 120)
+        assert not sim.xp_orbs
+    # en régime établi, plus aucune création
+    assert (ENEMIES.created, ORBS.created) == created
+
+def test_stress_kills_keep_a_seeded_order():
+    """Swap-remove dans l'ordre de la liste : même graine, même ordre des survivants."""
+    def run():
+        sim = Simulation(seed=4, stress=True)
+        sim.base_spawn_interval = 10**9
+        cx, cy = sim.player.rect.center
+        for k in range(40):
+            sim.add_enemy(ENEMIES.acquire(cx + 300 + 7 * k, cy + 200 + 3 * (k % 5), speed=0))
+        for e in sim.enemy_list[::3]:
+            e.hp = 0
+        sim.step(1 / 120)
+        return [e.rect.topleft for e in sim.enemy_list]
+    first = run()
+    assert len(first) == 26
+    for _ in range(3):
+        assert run() == first
@@ -0,0 +1,66 @@
+import csv
+import pygame
+import pytest
+from game.profiler import FrameProfiler, SECTIONS
+from game.simulation import Simulation
+
+@pytest.fixture(autouse=True)
+def font_ready():
+    # d'autres modules de tests appellent pygame.quit()
+    if not pygame.font.get_init():
+        pygame.font.init()
+    yield
+
+def test_disabled_profiler_records_nothing():
+    prof = FrameProfiler()
+    prof.begin_frame(); prof.lap("sim"); prof.end_frame(steps=1)
+    assert prof.frames == 0
+    assert prof.stats("sim") == (0.0, 0.0, 0.0)
+
+def test_laps_are_cumulated_per_frame():
+    prof = FrameProfiler(enabled=True)
+    for _ in range(5):
+        prof.begin_frame()
+        prof.lap("input"); prof.lap("sim"); prof.lap("sim")
+        prof.end_frame(steps=2)
+    assert prof.frames == 5
+    assert len(prof.history["sim"]) == 5
+    mean, p95, peak = prof.stats("total")
+    assert 0 < mean <= peak and p95 <= peak
+    assert prof.counts["steps"] == 2
+
+def test_enabling_mid_frame_starts_from_the_toggle():
+    prof = FrameProfiler()
+    prof.frame["input"] = 10**12   # reste d'une ancienne frame
+    prof.begin_frame()             # désactivé : aucun horodatage
+    prof.toggle()                  # F3 pendant la frame
+    prof.lap("input"); prof.lap("sim")
+    prof.end_frame(steps=1)
+    assert prof.frames == 1
+    # quelques ms au plus, pas le temps écoulé depuis perf_counter_ns() == 0
+    assert prof.stats("input")[2] < 100
+    assert prof.stats("total")[2] < 100
+
+def test_simulation_sections_and_overlay():
+    prof = FrameProfiler(enabled=True)
+    sim = Simulation(seed=4, profiler=prof)
+    prof.begin_frame()
+    for _ in range(3):
+        sim.step(1 / 120)
+    prof.end_frame()
+    for name in ("sim", "player", "spawn", "enemies", "separation", "collisions", "orbs"):
+        assert prof.history[name][-1] > 0
+    screen = pygame.Surface((800, 600))
+    prof.draw(screen)
+    assert prof._overlay.get_width() > 0
+
+def test_csv_rows(tmp_path):
+    path = tmp_path / "frames.csv"
+    prof = FrameProfiler(csv_path=str(path))   # CSV actif même sans overlay
+    for _ in range(3):
+        prof.begin_frame(); prof.lap("flip"); prof.end_frame(enemies=7)
+    prof.close()
+    rows = list(csv.reader(open(path)))
+    assert rows[0][:2] == ["frame", "total_ns"] and len(rows) == 4
+    assert rows[0][2:2 + len(SECTIONS)] == list(SECTIONS)
+    assert rows[-1][rows[0].index("n_enemies")] == "7"
@@ -0,0 +1,57 @@
+import pygame
+import pytest
+from game.projectile_manager import ProjectileManager, LIFETIME
+from game.goblin_mage import GoblinMage
+from game.simulation import Simulation
+
+def test_batched_move_and_bounds():
+    pm = ProjectileManager(capacity=1)     # force aussi un agrandissement
+    pm.spawn(100, 100, (200, 100), speed=100)
+    pm.spawn(5, 100, (-100, 100), speed=100)
+    pm.step(0.5)
+    assert len(pm) == 1                    # le second est sorti de la map
+    assert pm.columns["x"][0] == pytest.approx(150)
+
+def test_lifetime_expires():
+    pm = ProjectileManager()
+    pm.spawn(1500, 1500, (1500, 1501), speed=0)
+    pm.step(LIFETIME - 0.01)
+    assert len(pm) == 1
+    pm.step(0.02)
+    assert len(pm) == 0
+
+def test_hit_rect_sums_damage_and_removes_hits():
+    pm = ProjectileManager()
+    pm.spawn(100, 100, (0, 0), damage=2)
+    pm.spawn(105, 100, (0, 0), damage=3)
+    pm.spawn(900, 900, (0, 0), damage=5)
+    assert pm.hit_rect(pygame.Rect(90, 90, 30, 30)) == 5
+    assert len(pm) == 1 and pm.columns["damage"][0] == 5
+
+def test_mage_fires_through_manager_and_fireballs_outlive_it():
+    sim = Simulation(seed=9)
+    p = sim.player
+    mage = sim.add_mage(GoblinMage(p.rect.centerx + 400, p.rect.centery))
+    mage.fire_timer = 0.0
+    sim.step(1 / 120)
+    assert len(sim.projectiles) == 1 and mage.projectile_manager is sim.projectiles
+    mage.hp = 0
+    sim.step(1 / 120)
+    assert mage not in sim.mages and len(sim.projectiles) == 1
+
+def test_player_hit_damages_once():
+    sim = Simulation(seed=9)
+    p = sim.player
+    p.regen_rate = 0
+    hp = p.hp
+    sim.projectiles.spawn(*p.rect.center, (0, 0), speed=0, damage=2)
+    sim.step(1 / 120)
+    assert p.hp == hp - 2 and len(sim.projectiles) == 0
+
+def test_draw_culls_outside_view():
+    pm = ProjectileManager()
+    pm.spawn(50, 50, (0, 0))
+    pm.spawn(2000, 2000, (0, 0))
+    screen = pygame.Surface((200, 200))
+    assert pm.draw(screen, 0, 0, pygame.Rect(0, 0, 200, 200)) == 1
+    assert screen.get_at((50, 50))[:3] == (255, 100, 0)
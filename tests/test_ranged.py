@@ -38,16 +38,15 @@ def test_fireball_offscreen():
 def test_goblin_mage_fires_when_on_screen(dummy_player):
     gm = GoblinMage(x=dummy_player.rect.centerx, y=dummy_player.rect.centery)
     gm.fire_timer = 0.0
-    gm.projectiles.clear()
+    pm = gm.projectile_manager
     # cam_x, cam_y à (0,0) font que le mage est "on screen"
     gm.update(dummy_player, dt=0.0, cam_x=0, cam_y=0)
-    assert len(gm.projectiles) == 1
-    assert isinstance(gm.projectiles[0], Fireball)
+    assert len(pm) == 1
+    assert pm.columns["damage"][0] == gm.damage
 
 def test_goblin_mage_respects_cooldown(dummy_player):
     gm = GoblinMage(x=dummy_player.rect.centerx, y=dummy_player.rect.centery)
     gm.fire_timer = gm.fire_cooldown  # encore en cooldown
-    before = list(gm.projectiles)
     gm.update(dummy_player, dt=1.0, cam_x=0, cam_y=0)
     # aucune nouvelle flamme tant que fire_timer > 0
-    assert gm.projectiles == before
+    assert len(gm.projectile_manager) == 0
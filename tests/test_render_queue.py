@@ -0,0 +1,69 @@
+import pygame
+
+from game.render_queue import RenderQueue, GROUND, BODIES, BARS, PLAYER
+from game.enemy import Enemy
+from game.player import Player
+from game.projectile_manager import ProjectileManager
+
+
+def solid(color, size=(4, 4)):
+    s = pygame.Surface(size)
+    s.fill(color)
+    return s
+
+def test_layers_flush_in_order_whatever_the_submission_order():
+    rq = RenderQueue()
+    screen = pygame.Surface((10, 10))
+    rq.add(PLAYER, solid((0, 0, 255)), (0, 0))
+    rq.add(BARS, solid((0, 255, 0), (2, 2)), (0, 0))
+    rq.add(GROUND, solid((255, 0, 0), (10, 10)), (0, 0))
+    rq.add(BODIES, solid((9, 9, 9)), (6, 6))
+    assert len(rq) == 4
+    assert rq.flush(screen) == 4 and len(rq) == 0
+    assert screen.get_at((0, 0))[:3] == (0, 0, 255)
+    assert screen.get_at((5, 5))[:3] == (255, 0, 0)
+    assert screen.get_at((7, 7))[:3] == (9, 9, 9)
+
+class FblitsSurface:
+    """Surface pygame-ce factice : fblits refuse les entrées avec area."""
+    def __init__(self):
+        self.calls = []
+
+    def fblits(self, pairs):
+        assert all(len(p) == 2 for p in pairs), "fblits n'accepte que (source, dest)"
+        self.calls.append(("fblits", len(pairs)))
+
+    def blits(self, pairs, doreturn=True):
+        self.calls.append(("blits", len(pairs)))
+
+def test_area_entries_fall_back_to_blits_when_fblits_exists():
+    rq = RenderQueue()
+    strip = solid((0, 200, 0), (20, 5))
+    rq.add(BODIES, solid((9, 9, 9)), (0, 0))
+    rq.blits[BARS].append((strip, (0, 0), pygame.Rect(0, 0, 10, 5)))
+    surface = FblitsSurface()
+    assert rq.flush(surface) == 2
+    assert surface.calls == [("fblits", 1), ("blits", 1)]
+
+def test_entity_sprite_matches_draw():
+    e = Enemy(100, 100, speed=0)
+    a, b = pygame.Surface((300, 300)), pygame.Surface((300, 300))
+    e.draw(a, 20, 30)
+    b.blit(*e.sprite(20, 30))
+    assert pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+
+def test_player_sprites_include_cone_and_slash():
+    p = Player(200, 200)
+    assert len(p.sprites(0, 0)) == 1
+    p.show_scream_cone = True
+    p.attacking = True
+    assert len(p.sprites(0, 0)) == 3
+
+def test_projectile_sprites_are_culled():
+    pm = ProjectileManager()
+    pm.spawn(100, 100, (200, 100))
+    pm.spawn(2000, 2000, (2100, 2000))
+    pairs = pm.sprites(0, 0, pygame.Rect(0, 0, 500, 500))
+    assert len(pairs) == 1
+    image, (x, y) = pairs[0]
+    assert (x, y) == (100 - 8, 100 - 8)
@@ -0,0 +1,90 @@
+import pygame
+import pytest
+
+from game.simulation import Simulation, FrameInput
+from game.bot import Bot
+from game.replay import (
+    Recording, ReplayDriver, record, replay, pack_input, unpack_input, TICKS,
+)
+
+DT = 1 / 120
+
+def world_state(sim):
+    return ([e.rect.topleft for e in sim.enemy_list],
+            [m.rect.topleft for m in sim.mages],
+            [b.rect.topleft for b in sim.boss_list],
+            [o.rect.topleft for o in sim.xp_orbs],
+            sim.player.rect.topleft, sim.player.hp, sim.player.level,
+            sim.kills, sim.frames, sim.time)
+
+def tweak(sim):
+    """Partie courte mais chargée : level ups fréquents, joueur robuste."""
+    sim.player.regen_rate    = 50
+    sim.player.next_level_xp = 2
+    sim.player.XP_GROWTH     = 1.0
+    cx, cy = sim.player.rect.center
+    for k in range(30):
+        sim.drop_orb(cx - 600 + 40 * k, cy + 150 - 10 * (k % 3), 1)
+    return sim
+
+def bot_run(path, seed=11, steps=2400, stress=False):
+    """Partie pilotée par le bot, enregistrée dans `path`."""
+    sim = tweak(Simulation(seed=seed, stress=stress))
+    recorder = record(sim, path)
+    bot = Bot(seed)
+    for _ in range(steps):
+        inputs = bot.act(sim)
+        sim.step(DT, inputs)
+        sim.step(DT, inputs)   # deux pas par frame, comme le jeu
+    recorder.close()
+    return sim
+
+
+@pytest.mark.parametrize("stress", [False, True])
+def test_replay_reproduces_the_run_step_for_step(tmp_path, stress):
+    path = tmp_path / "run.rpl"
+    expected = bot_run(path, stress=stress)
+    got = tweak(Recording(path).simulation())
+    driver = ReplayDriver(Recording(path))
+    while driver.step(got):
+        pass
+    assert driver.ticks == expected.frames
+    assert world_state(got) == world_state(expected)
+    assert got.player.attack_damage == expected.player.attack_damage
+
+def test_recording_holds_upgrades_screams_and_merged_ticks(tmp_path):
+    path = tmp_path / "run.rpl"
+    sim = bot_run(path)
+    rec = Recording(path)
+    kinds = [e[0] for e in rec.events]
+    assert 0 < kinds.count("upgrade") <= sim.player.level - 1
+    assert "scream" in kinds
+    assert rec.ticks == sim.frames
+    # pas identiques fusionnés : bien moins d'un enregistrement par pas
+    assert kinds.count("tick") < sim.frames / 2
+    assert path.stat().st_size < kinds.count("tick") * (TICKS.size + 1) + 200
+
+def test_input_packing_round_trip():
+    inputs = FrameInput(keys={pygame.K_z: True, pygame.K_d: True, pygame.K_SPACE: True},
+                        mouse=(12, -3.5), attack=True)
+    flags, mouse = pack_input(inputs)
+    back = unpack_input(flags, mouse)
+    assert back.keys == inputs.keys and back.attack and back.mouse == (12.0, -3.5)
+    assert pack_input(back) == (flags, mouse)
+    # autres touches ignorées : le joueur ne les lit pas
+    assert pack_input(FrameInput(keys={pygame.K_x: True})) == (0, (0.0, 0.0))
+
+def test_headless_replay_times_every_step(tmp_path):
+    path = tmp_path / "run.rpl"
+    expected = bot_run(path, steps=300)
+    sim, times = replay(path)
+    assert len(times) == expected.frames
+    assert sim.frames == expected.frames and sim.time == expected.time
+
+def test_bad_files_are_rejected(tmp_path):
+    path = tmp_path / "bad.rpl"
+    path.write_bytes(b"NOPE" + bytes(10))
+    with pytest.raises(ValueError):
+        Recording(path)
+    with pytest.raises(ValueError):
+        record(Simulation(), tmp_path / "noseed.rpl")
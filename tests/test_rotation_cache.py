@@ -0,0 +1,30 @@
+import pygame
+from game import sprites
+from game.player import Player, SLASH
+
+def test_rotations_are_quantised_and_shared():
+    a = sprites.get_rotated(SLASH, 41.0, 0.15)
+    assert sprites.get_rotated(SLASH, 42.4, 0.15) is a          # même pas de 5°
+    assert sprites.get_rotated(SLASH, 43.0, 0.15) is not a
+    assert sprites.get_rotated(SLASH, 41.0 + 360, 0.15) is a
+
+def test_cone_apex_and_bounds():
+    cone, (ax, ay) = sprites.get_cone(100, 22.5, 0, (0, 0, 255, 51))
+    # cône vers la droite : apex sur le bord gauche, hauteur ~ 2·100·sin(22.5°)
+    assert ax == 0 and abs(cone.get_height() - 78) <= 2
+    assert cone.get_at((ax + 50, ay))[3] == 51                 # intérieur
+    assert cone.get_at((ax, 0))[3] == 0                         # hors cône
+    assert sprites.get_cone(100, 22.5, 2, (0, 0, 255, 51))[0] is cone
+
+def test_attack_draw_uses_cache(monkeypatch):
+    p = Player(300, 300)
+    p.attacking = True
+    p.last_attack_angle = 90
+    p.show_scream_cone = True
+    calls = []
+    real = pygame.transform.rotozoom
+    monkeypatch.setattr(pygame.transform, "rotozoom", lambda *a: calls.append(a) or real(*a))
+    screen = pygame.Surface((600, 600))
+    for _ in range(12):
+        p.draw(screen, 0, 0)
+    assert len(calls) <= 1
@@ -0,0 +1,56 @@
+import pygame
+import pytest
+from game.simulation import Simulation, FrameInput, UPGRADE_RESUME_DELAY
+
+DT = 1 / 60
+
+def run(sim, frames, inputs=None):
+    for _ in range(frames):
+        sim.step(DT, inputs or FrameInput())
+    return sim
+
+def world_state(sim):
+    return ([e.rect.topleft for e in sim.enemy_list],
+            [m.rect.topleft for m in sim.mages],
+            [o.rect.topleft for o in sim.xp_orbs],
+            sim.player.rect.topleft, sim.player.hp, sim.kills)
+
+def test_seeded_runs_are_identical():
+    """Même graine, mêmes entrées → même monde, frame pour frame."""
+    a = run(Simulation(seed=7), 600)
+    b = run(Simulation(seed=7), 600)
+    assert a.enemy_count() > 0
+    assert world_state(a) == world_state(b)
+
+def test_steps_without_window():
+    """La simulation tourne sans fenêtre ni mixer."""
+    pygame.display.quit()
+    try:
+        sim = run(Simulation(seed=1, stress=True), 240)
+        assert sim.time == pytest.approx(240 * DT)
+        assert len(sim.enemy_list) > 1
+    finally:
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+def test_level_up_pauses_until_choice():
+    sim = Simulation(seed=3)
+    sim.player.gain_xp(sim.player.next_level_xp)
+    sim.step(DT)
+    assert len(sim.upgrade_choices) == 3 and sim.paused
+    spawn_timer = sim.spawn_timer
+    run(sim, 30)
+    assert sim.spawn_timer == spawn_timer   # monde figé
+
+    sim.choose_upgrade(sim.upgrade_choices[0])
+    assert sim.upgrade_choices == [] and sim.paused
+    run(sim, int(UPGRADE_RESUME_DELAY / DT) + 2)
+    assert not sim.paused
+
+def test_game_over_records_survival_time():
+    sim = run(Simulation(seed=5), 10)
+    sim.player.regen_rate = 0
+    sim.player.take_damage(sim.player.max_hp)
+    sim.step(DT)
+    assert sim.game_over
+    assert sim.survival_time == sim.time
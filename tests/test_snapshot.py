@@ -0,0 +1,118 @@
+import pygame
+import pytest
+
+from game.settings import WIDTH, HEIGHT
+from game.simulation import Simulation, FrameInput
+from game.timestep import FixedTimestep
+from game.snapshot import capture
+from game.pipeline import Pipeline
+from game.enemy import Enemy
+from game.render_queue import BODIES, PLAYER
+
+
+@pytest.fixture
+def art():
+    if not pygame.display.get_init() or pygame.display.get_surface() is None:
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+    pygame.font.init()
+    pygame.freetype.init()
+    from game.main import GameArt, get_cri_icons
+    get_cri_icons()
+    return GameArt()
+
+def busy_sim(seed=5):
+    sim = Simulation(seed=seed)
+    cx, cy = sim.player.rect.center
+    for k in range(12):
+        e = Enemy(cx + 150 + 40 * (k % 4), cy - 100 + 60 * (k // 4), speed=60)
+        e.hp = e.max_hp / 2
+        sim.add_enemy(e)
+    for k in range(5):
+        sim.drop_orb(cx - 100 - 20 * k, cy, 1)
+    return sim
+
+def positions(snap):
+    return [[pair[1] for pair in blits] for blits in snap.layers]
+
+def run_frames(sim, frames, advance):
+    inputs = FrameInput(keys={pygame.K_d: True})
+    return [advance(1 / 60, inputs) for _ in range(frames)]
+
+
+def test_snapshot_is_read_only():
+    snap = capture(busy_sim())
+    with pytest.raises(AttributeError):
+        snap.level = 99
+    assert isinstance(snap.layers, tuple)
+    assert all(isinstance(blits, tuple) for blits in snap.layers)
+
+def test_snapshot_does_not_follow_the_simulation():
+    sim = busy_sim()
+    snap = capture(sim)
+    before = positions(snap), snap.frame, snap.camera, snap.xp_ratio
+    for _ in range(30):
+        sim.step(1 / 120, FrameInput(keys={pygame.K_d: True}))
+    assert sim.frames == snap.frame + 30
+    assert (positions(snap), snap.frame, snap.camera, snap.xp_ratio) == before
+    assert positions(capture(sim)) != before[0]
+
+def test_snapshot_is_consistent_with_its_frame():
+    sim = busy_sim()
+    for _ in range(10):
+        sim.step(1 / 120)
+    snap = capture(sim)
+    cam_x, cam_y = snap.camera
+    assert snap.frame == sim.frames
+    assert len(snap.layers[BODIES]) == snap.drawn - len(sim.xp_orbs)
+    # joueur à sa position écran de cette même frame
+    assert snap.layers[PLAYER] == tuple(sim.player.sprites(cam_x, cam_y))
+
+def test_draw_world_equals_drawing_the_snapshot(art):
+    from game.main import draw_world, draw_snapshot
+    sim = busy_sim()
+    a, b = pygame.Surface((WIDTH, HEIGHT)), pygame.Surface((WIDTH, HEIGHT))
+    snap = draw_world(a, sim, art)
+    draw_snapshot(b, snap, art)
+    assert pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+
+def test_pipeline_produces_the_same_frames_as_the_sequential_loop():
+    seq_sim, seq_ts = busy_sim(), FixedTimestep()
+
+    def sequential(dt, inputs):
+        steps = seq_ts.advance(dt)
+        for i in range(steps):
+            if i == steps - 1:
+                seq_sim.remember_positions()
+            seq_sim.step(seq_ts.dt, inputs)
+        return capture(seq_sim, seq_ts.alpha), steps
+
+    pipe_sim = busy_sim()
+    pipe = Pipeline(pipe_sim, FixedTimestep())
+
+    def pipelined(dt, inputs):
+        pipe.submit(dt, inputs)
+        return pipe.collect()
+
+    try:
+        expected = run_frames(seq_sim, 20, sequential)
+        got      = run_frames(pipe_sim, 20, pipelined)
+    finally:
+        pipe.close()
+    for (s1, n1), (s2, n2) in zip(expected, got):
+        assert n1 == n2 and s1.frame == s2.frame
+        assert s1.camera == s2.camera and positions(s1) == positions(s2)
+
+def test_pipeline_keeps_one_frame_in_flight_and_reraises():
+    sim = busy_sim()
+    pipe = Pipeline(sim, FixedTimestep())
+    pipe.submit(1 / 60, FrameInput())
+    with pytest.raises(RuntimeError):
+        pipe.submit(1 / 60, FrameInput())
+    pipe.collect()
+    sim.player = None   # le prochain pas échoue dans le worker
+    pipe.submit(1 / 60, FrameInput())
+    with pytest.raises(AttributeError):
+        pipe.collect()
+    pipe.close()
+    assert not pipe._thread.is_alive()
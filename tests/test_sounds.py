@@ -0,0 +1,38 @@
+import pygame
+import pytest
+from game import sounds
+from game.xp_orb import XPOrb
+from game.player import Player
+
+@pytest.fixture(autouse=True)
+def mixer_ready():
+    # d'autres modules de tests appellent pygame.quit()
+    if pygame.mixer.get_init() is None:
+        pygame.mixer.init()
+    yield
+
+def test_get_sound_is_shared():
+    """Un effet n'est décodé qu'une fois puis partagé."""
+    a = sounds.get_sound("fx/xp_orb.mp3")
+    b = sounds.get_sound("fx/xp_orb.mp3")
+    assert a is b
+    assert isinstance(a, pygame.mixer.Sound)
+
+def test_orbs_share_pickup_sound():
+    o1 = XPOrb(0, 0, 1)
+    o2 = XPOrb(10, 10, 2)
+    assert o1.pickup_sound is o2.pickup_sound
+
+def test_player_reinit_reuses_sounds():
+    p = Player(0, 0)
+    attack = p.attack_sound
+    p.__init__(0, 0)
+    assert p.attack_sound is attack
+    assert p.levelup_sound is sounds.get_sound("fx/levelup.mp3")
+
+def test_silent_sound_without_mixer(monkeypatch):
+    """Sans mixer initialisé, on obtient un son muet au lieu d'une erreur."""
+    monkeypatch.setattr(pygame.mixer, "get_init", lambda: None)
+    snd = sounds.get_sound("fx/does_not_exist.mp3")
+    assert snd is sounds.SILENT
+    snd.play()
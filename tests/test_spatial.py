@@ -0,0 +1,63 @@
+import math
+import random
+import pygame
+from game.spatial import SpatialHash, separate
+
+class Body:
+    def __init__(self, x, y, size=80):
+        self.rect = pygame.Rect(0, 0, size, size)
+        self.rect.center = (x, y)
+
+def brute_force_hits(bodies, rect):
+    return {id(b) for b in bodies if b.rect.colliderect(rect)}
+
+def test_query_rect_matches_brute_force():
+    rng = random.Random(1)
+    bodies = [Body(rng.randint(0, 3000), rng.randint(0, 3000), rng.choice((16, 80, 208)))
+              for _ in range(300)]
+    grid = SpatialHash()
+    grid.rebuild(bodies)
+    for _ in range(50):
+        q = pygame.Rect(rng.randint(0, 2900), rng.randint(0, 2900), 120, 90)
+        assert {id(b) for b in grid.query_rect(q)} == brute_force_hits(bodies, q)
+
+def test_query_rect_finds_big_object_from_far_cell():
+    """Un gros objet centré loin de la zone doit quand même être trouvé."""
+    boss = Body(500, 500, size=400)
+    grid = SpatialHash(cell_size=64)
+    grid.insert(boss)
+    assert grid.query_rect(pygame.Rect(320, 320, 5, 5)) == [boss]
+
+def test_query_radius_handles_negative_coords():
+    b = Body(-40, -40, size=20)
+    grid = SpatialHash()
+    grid.rebuild([b])
+    assert b in grid.query_radius(-30, -30, 10)
+
+def test_separate_pushes_overlapping_pair_apart():
+    a, b = Body(100, 100), Body(110, 100)
+    separate([a, b])
+    assert a.rect.centerx < 100 and b.rect.centerx > 110
+    assert math.hypot(a.rect.centerx - b.rect.centerx,
+                      a.rect.centery - b.rect.centery) > 10
+
+def test_separate_finds_entities_pushed_into_another_cell():
+    """c, poussée par a dans la cellule voisine, doit être trouvée par b."""
+    a, b, c = Body(120, 100, 40), Body(175, 100, 40), Body(122, 100, 40)
+    separate([a, b, c], SpatialHash(cell_size=64))
+    assert c.rect.centerx >= 128                      # a changé de cellule
+    assert b.rect.centerx - c.rect.centerx >= 39      # puis écartée de b
+
+def test_move_keeps_each_object_in_one_cell():
+    b = Body(10, 10, size=20)
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild([b])
+    old = b.rect.center
+    b.rect.center = (200, 10)
+    grid.move(b, old)
+    assert grid.query_radius(10, 10, 1) == [] and grid.query_radius(200, 10, 1) == [b]
+
+def test_separate_leaves_distant_entities():
+    a, b = Body(100, 100), Body(1000, 1000)
+    separate([a, b])
+    assert a.rect.center == (100, 100) and b.rect.center == (1000, 1000)
@@ -1,5 +1,5 @@
 import pytest
-from game.main import BASE_MAX_ENEMIES, PER_LEVEL_ENEMIES
+from game.simulation import BASE_MAX_ENEMIES, PER_LEVEL_ENEMIES
 
 def cap_for_level(level):
     return BASE_MAX_ENEMIES + PER_LEVEL_ENEMIES * (level - 1)
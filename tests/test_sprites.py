@@ -0,0 +1,83 @@
+import pygame
+from game import sprites
+from game.enemy import Enemy
+from game.goblin_mage import GoblinMage
+from game.boss import Boss
+
+def test_get_sprite_is_cached():
+    """Une même variante n'est chargée/transformée qu'une seule fois."""
+    a = sprites.get_sprite("assets/gobelin-right.png", size=(80, 80))
+    b = sprites.get_sprite("assets/gobelin-right.png", size=(80, 80))
+    assert a is b
+    assert a.get_size() == (80, 80)
+
+def test_get_sprite_variants_are_distinct():
+    """Taille, flip et teinte donnent des surfaces différentes."""
+    base    = sprites.get_sprite("assets/gobelin-right.png", size=(80, 80))
+    flipped = sprites.get_sprite("assets/gobelin-right.png", size=(80, 80), flip=True)
+    tinted  = sprites.get_sprite("assets/gobelin-right.png", size=(80, 80), tint=(0, 0, 255, 80))
+    bigger  = sprites.get_sprite("assets/gobelin-right.png", size=(104, 104))
+    assert len({id(base), id(flipped), id(tinted), id(bigger)}) == 4
+    assert bigger.get_size() == (104, 104)
+
+def test_enemies_share_surfaces():
+    """Deux gobelins du même tier partagent leurs sprites au lieu de les copier."""
+    e1 = Enemy(0, 0, tier='normal')
+    e2 = Enemy(100, 100, tier='normal')
+    assert e1.img_right is e2.img_right
+    assert e1.img_left is e2.img_left
+    e3 = Enemy(0, 0, tier='elite')
+    assert e3.img_right is not e1.img_right
+
+def test_mages_share_surface():
+    assert GoblinMage(0, 0).image is GoblinMage(50, 50).image
+
+def test_boss_keeps_zoomed_sprite_in_both_directions():
+    """Le boss garde son sprite agrandi quand il change d'orientation."""
+    b = Boss(500, 500, player_level=10)
+    ref = Enemy(0, 0, tier='elite')
+    assert b.img_left.get_width() > ref.img_left.get_width()
+    b.update((0, 500), dt=0.1)   # le joueur est à gauche
+    assert b.image is b.img_left
+    assert b.image.get_size() == b.rect.size
+
+def test_tinted_and_flash_variants_are_baked_once():
+    """Les variantes teintées/flash sont partagées entre gobelins du même tier."""
+    e1 = Enemy(0, 0, tier='elite')
+    e2 = Enemy(0, 0, tier='elite')
+    assert e1.tint_frames[0] is e2.tint_frames[0]
+    assert e1.flash_frames[1] is e2.flash_frames[1]
+    assert e1.tint_frames[0] is not e1.img_right
+
+def test_enemy_draw_is_single_blit():
+    """Un ennemi teinté en flash se dessine en un seul blit."""
+    class Dummy:
+        def __init__(self):
+            self.calls = []
+        def blit(self, img, pos):
+            self.calls.append((img, pos))
+    e = Enemy(100, 100, tier='rare')
+    e.flash_timer = e.flash_duration
+    e.image = e.img_left
+    surf = Dummy()
+    e.draw(surf, 0, 0)
+    assert surf.calls == [(e.flash_frames[1], (e.rect.x, e.rect.y))]
+
+def test_baked_tint_matches_mask_overlay():
+    """La variante cuite donne le même rendu que sprite + masque teinté."""
+    e = Enemy(0, 0, tier='rare')
+    w, h = e.img_right.get_size()
+    ref = pygame.Surface((w, h))
+    ref.blit(e.img_right, (0, 0))
+    mask = pygame.mask.from_surface(e.img_right)
+    ref.blit(mask.to_surface(setcolor=e.tint_color, unsetcolor=(0, 0, 0, 0)), (0, 0))
+    baked = pygame.Surface((w, h))
+    baked.blit(e.tint_frames[0], (0, 0))
+    x, y = w // 2, h // 2
+    assert baked.get_at((x, y)) == ref.get_at((x, y))
+
+def test_faded_is_quantised_and_cached():
+    src = sprites.get_sprite("assets/gobelin-right.png", size=(80, 80))
+    a = sprites.faded(src, 200)
+    assert sprites.faded(src, 201) is a
+    assert a is not src
@@ -0,0 +1,69 @@
+import pytest
+
+from game.player import Player
+from game.simulation import Simulation
+from game.sweep import (
+    apply_params, parse_grid, combinations, run_one, sweep, aggregate, main,
+)
+
+
+def test_parse_grid_and_combinations():
+    grid = parse_grid(["base_max_enemies=5,8", "xp_growth=1.2"])
+    assert grid == {"base_max_enemies": [5, 8], "xp_growth": [1.2]}
+    assert combinations(grid) == [
+        {"base_max_enemies": 5, "xp_growth": 1.2},
+        {"base_max_enemies": 8, "xp_growth": 1.2},
+    ]
+    with pytest.raises(ValueError):
+        parse_grid(["base_max_enemies"])
+
+def test_apply_params_stays_local_to_the_run():
+    sim = Simulation(seed=1)
+    apply_params(sim, {"base_max_enemies": 9, "per_level_enemies": 0,
+                       "xp_growth": 2.0, "upgrade.Haste": 50})
+    assert sim.enemy_cap() == 9
+    speed = sim.player.speed
+    sim.player.apply_upgrade("Haste")
+    assert sim.player.speed == speed + 50
+    sim.player.next_level_xp = 100
+    sim.player.level_up()
+    assert sim.player.next_level_xp == 200
+    # les valeurs de classe ne bougent pas
+    assert Player.UPGRADE_INFO["Haste"]["value"] == 30 and Player.XP_GROWTH == 1.18
+    with pytest.raises(KeyError):
+        apply_params(sim, {"nope": 1})
+
+def test_runs_are_deterministic_per_seed():
+    a = run_one({}, seed=3, max_time=5)
+    b = run_one({}, seed=3, max_time=5)
+    for key in ("survival", "died", "level", "kills"):
+        assert a[key] == b[key]
+    assert a["survival"] == pytest.approx(5, abs=0.01) or a["died"]
+
+def test_process_pool_matches_in_process_runs():
+    grid = {"base_max_enemies": [3, 12]}
+    local  = sweep(grid, seeds=2, max_time=3, workers=0)
+    pooled = sweep(grid, seeds=2, max_time=3, workers=2)
+    strip = lambda runs: [(r["params"], r["seed"], r["survival"], r["kills"]) for r in runs]
+    assert strip(local) == strip(pooled)
+
+def test_aggregate_averages_per_combination():
+    runs = [
+        {"params": {"a": 1}, "seed": 0, "survival": 10, "died": True,  "level": 2, "kills": 4, "step_ms": 1},
+        {"params": {"a": 1}, "seed": 1, "survival": 20, "died": False, "level": 4, "kills": 6, "step_ms": 3},
+        {"params": {"a": 2}, "seed": 0, "survival": 5,  "died": True,  "level": 1, "kills": 0, "step_ms": 2},
+    ]
+    rows = aggregate(runs)
+    assert rows[0] == {"a": 1, "runs": 2, "survival": 15, "died": 0.5,
+                       "level": 3, "kills": 5, "step_ms": 2}
+    assert rows[1]["a"] == 2 and rows[1]["runs"] == 1
+
+def test_cli_prints_table_and_writes_csv(tmp_path, capsys):
+    out = tmp_path / "sweep.csv"
+    main(["base_max_enemies=4,6", "--seeds", "1", "--max-time", "2",
+          "--workers", "0", "--out", str(out)])
+    printed = capsys.readouterr().out
+    assert "survival s" in printed and "2 runs" in printed
+    lines = out.read_text().splitlines()
+    assert lines[0] == "base_max_enemies,runs,survival,died,level,kills,step_ms"
+    assert len(lines) == 3
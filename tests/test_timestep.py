@@ -0,0 +1,38 @@
+import pygame
+import pytest
+from game.timestep import FixedTimestep
+from game.simulation import Simulation
+from game.player import Player
+
+def test_accumulates_fixed_steps():
+    ts = FixedTimestep(hz=100, max_steps=8)
+    assert ts.advance(0.025) == 2
+    assert ts.alpha == pytest.approx(0.5)
+    assert ts.advance(0.005) == 1
+    assert ts.alpha == pytest.approx(0.0, abs=1e-9)
+
+def test_hitch_is_capped_not_snowballed():
+    """Un à-coup de 1 s ne donne que max_steps pas, le reste est abandonné."""
+    ts = FixedTimestep(hz=100, max_steps=4)
+    assert ts.advance(1.0) == 4
+    assert ts.alpha == 0.0
+    assert ts.dropped == pytest.approx(0.96)
+    assert ts.advance(0.01) == 1
+
+def test_small_steps_keep_subpixel_motion():
+    """À 120 Hz, un pas < 0.5 px ne doit pas être arrondi à zéro."""
+    p = Player(500, 500)
+    x0 = p.rect.x
+    for _ in range(120):
+        p.update({pygame.K_d: True}, 1 / 120)
+    assert p.rect.x - x0 == pytest.approx(p.speed, abs=1)
+
+def test_interpolated_offset_between_steps():
+    sim = Simulation(seed=2)
+    p = sim.player
+    sim.remember_positions()
+    p.rect.x += 10
+    assert sim.interp_offset(p, 0.0) == (-10, 0)
+    assert sim.interp_offset(p, 0.5) == (-5, 0)
+    assert sim.interp_offset(p, 1.0) == (0, 0)
+    assert sim.interp_offset(object(), 0.5) == (0, 0)